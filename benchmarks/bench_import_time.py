@@ -0,0 +1,79 @@
+"""
+Start-up cost of stats4science in fresh interpreters.
+
+Each scenario runs in a new Python process (as a CLI worker or serverless invocation
+would) and reports the median wall time of its statements, plus whether NumPy and
+SciPy ended up imported. The package resolves its public names lazily and imports
+SciPy only inside the functions that need it, so importing it and formatting stored
+results should cost no more than NumPy; the first analysis call pays for SciPy.
+
+Run with:
+    uv run python benchmarks/bench_import_time.py
+    uv run python benchmarks/bench_import_time.py --repeat 21
+    python -X importtime -c "import stats4science"   # per-module breakdown
+"""
+
+from __future__ import annotations
+
+import sys
+import json
+import argparse
+import tempfile
+import statistics
+import subprocess
+from pathlib import Path
+
+import numpy as np
+
+import stats4science as stats
+
+SCENARIOS = {
+    "import numpy": "import numpy",
+    "import stats4science": "import stats4science",
+    "import + format stored report": (
+        "import stats4science as stats\n(result,) = stats.read_jsonl(RESULTS)\nstats.report_two_group(result)"
+    ),
+    "import + first comparison": (
+        "import numpy as np\nimport stats4science as stats\n"
+        "stats.compare_independent_groups(np.arange(20.0), np.arange(20.0) + 0.5)"
+    ),
+}
+
+_HARNESS = """
+import sys, time, json
+RESULTS = {results!r}
+start = time.perf_counter()
+exec({code!r})
+seconds = time.perf_counter() - start
+print(json.dumps({{"seconds": seconds, "numpy": "numpy" in sys.modules, "scipy": "scipy" in sys.modules}}))
+"""
+
+
+def _run_once(code: str, results: str) -> dict[str, object]:
+    script = _HARNESS.format(code=code, results=results)
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=11)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    result = stats.compare_independent_groups(rng.normal(size=30), rng.normal(loc=0.3, size=30))
+    with tempfile.TemporaryDirectory() as directory:
+        results = str(Path(directory) / "results.jsonl")
+        stats.write_jsonl([result], results)
+        print(f"{'scenario':<32} {'median ms':>10} {'numpy':>6} {'scipy':>6}")
+        for name, code in SCENARIOS.items():
+            runs = [_run_once(code, results) for _ in range(args.repeat)]
+            median = statistics.median(float(run["seconds"]) for run in runs)  # type: ignore[arg-type]
+            last = runs[-1]
+            print(
+                f"{name:<32} {1e3 * median:>10.1f} {'yes' if last['numpy'] else 'no':>6} {'yes' if last['scipy'] else 'no':>6}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Per-call cost of the in-package numeric kernels against the scipy.stats calls they replace.
+
+The kernels (stats4science._kernels) evaluate the same special functions as
+scipy.stats but skip its argument normalisation, nan-policy handling and result
+objects, which dominate for the small samples typical of A/B segments.
+
+Run with:
+    uv run python benchmarks/bench_kernels.py
+    uv run python benchmarks/bench_kernels.py --sizes 10 50 1000 --repeat 7
+"""
+
+from __future__ import annotations
+
+import timeit
+import argparse
+from typing import Callable
+
+import numpy as np
+from scipy import stats as sps
+
+from stats4science import _kernels as kernels
+
+
+def _per_call_seconds(fn: Callable[[], object], repeat: int) -> float:
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def _cases(x: np.ndarray, y: np.ndarray) -> dict[str, tuple[Callable[[], object], Callable[[], object]]]:
+    df = 17.3
+    welch_df = np.random.default_rng(1).uniform(2.0, 200.0, 10_000)
+    centers = (float(np.median(x)), float(np.median(y)))
+    return {
+        "t p-value (two-sided)": (lambda: 2.0 * sps.t.sf(1.7, df), lambda: kernels.t_pvalue(1.7, df, "two-sided")),
+        "t quantile": (lambda: sps.t.ppf(0.975, df), lambda: kernels.t_ppf(0.975, df)),
+        "t critical, integer df": (lambda: sps.t.ppf(0.975, 18), lambda: kernels.t_critical(0.95, 18, "two-sided")),
+        "t critical, Welch df": (lambda: sps.t.ppf(0.975, df), lambda: kernels.t_critical(0.95, df, "two-sided")),
+        "t critical, 10^4 Welch df": (
+            lambda: sps.t.ppf(0.975, welch_df),
+            lambda: kernels.t_critical(0.95, welch_df, "two-sided"),
+        ),
+        "normal quantile": (lambda: sps.norm.ppf(0.975), lambda: kernels.norm_ppf(0.975)),
+        "Brown-Forsythe": (
+            lambda: sps.levene(x, y, center="median"),
+            lambda: kernels.brown_forsythe((x, y), centers),
+        ),
+        "Pearson r and p-value": (lambda: sps.pearsonr(x, y), lambda: kernels.pearson(x, y, "two-sided")),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[20, 200, 20_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'kernel':<26} {'n':>7} {'scipy us':>10} {'kernel us':>10} {'speedup':>8}")
+    for n in args.sizes:
+        x = rng.normal(size=n)
+        y = 0.4 * x + rng.normal(size=n)
+        for name, (reference, kernel) in _cases(x, y).items():
+            before = _per_call_seconds(reference, args.repeat)
+            after = _per_call_seconds(kernel, args.repeat)
+            print(f"{name:<26} {n:>7} {1e6 * before:>10.1f} {1e6 * after:>10.1f} {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
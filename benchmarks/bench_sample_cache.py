@@ -0,0 +1,76 @@
+"""
+Per-call cost of compare_independent_groups with the shared per-call sample cache.
+
+The reference pipeline recomputes everything with NumPy and SciPy directly, as the
+function did before each input was validated once and its moments cached
+(describe, Shapiro-Wilk, Levene, ttest_ind, hedges_g, a fresh variance for the CI).
+
+Run with:
+    uv run python benchmarks/bench_sample_cache.py
+    uv run python benchmarks/bench_sample_cache.py --sizes 20 1000 100000 --repeat 7
+"""
+
+from __future__ import annotations
+
+import timeit
+import argparse
+import warnings
+
+import numpy as np
+from scipy import stats as sps
+
+import stats4science as stats
+
+
+def _reference_mean_difference(x: np.ndarray, y: np.ndarray) -> None:
+    # Calls NumPy/SciPy directly so the baseline stays fixed while the package's own
+    # helpers move onto shared kernels.
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    for values in (x, y):
+        np.mean(values)
+        np.std(values, ddof=1)
+        np.median(values)
+        np.min(values)
+        np.max(values)
+        sps.kurtosis(values, fisher=True, bias=False)
+        sps.shapiro(values)
+    sps.levene(x, y, center="mean")
+    sps.ttest_ind(x, y, equal_var=False)
+    n1, n2 = x.size, y.size
+    var1, var2 = float(np.var(x, ddof=1)), float(np.var(y, ddof=1))
+    se = np.sqrt(var1 / n1 + var2 / n2)
+    df = (var1 / n1 + var2 / n2) ** 2 / ((var1 / n1) ** 2 / (n1 - 1) + (var2 / n2) ** 2 / (n2 - 1))
+    diff = float(np.mean(x) - np.mean(y))
+    half_width = float(sps.t.ppf(0.975, df)) * se
+    _ = (diff - half_width, diff + half_width)
+    pooled_sd = np.sqrt(((n1 - 1) * float(np.var(x, ddof=1)) + (n2 - 1) * float(np.var(y, ddof=1))) / (n1 + n2 - 2))
+    _ = (1 - 3 / (4 * (n1 + n2) - 9)) * float(np.mean(x) - np.mean(y)) / pooled_sd
+
+
+def _per_call_seconds(fn: object, repeat: int) -> float:
+    timer = timeit.Timer(fn)  # type: ignore[arg-type]
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[20, 200, 2_000, 20_000, 200_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # Shapiro-Wilk warns about p-value accuracy above n = 5000; irrelevant for timing.
+    warnings.simplefilter("ignore", UserWarning)
+    rng = np.random.default_rng(0)
+    print(f"{'n per group':>12} {'reference ms':>13} {'cached ms':>10} {'speedup':>8}")
+    for n in args.sizes:
+        x = rng.normal(size=n)
+        y = rng.normal(loc=0.2, size=n)
+        reference = _per_call_seconds(lambda x=x, y=y: _reference_mean_difference(x, y), args.repeat)
+        cached = _per_call_seconds(lambda x=x, y=y: stats.compare_independent_groups(x, y), args.repeat)
+        print(f"{n:>12} {1e3 * reference:>13.3f} {1e3 * cached:>10.3f} {reference / cached:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""
+Benchmark suite for the public analysis functions across data sizes.
+
+Every case is timed (best of --repeat runs of timeit's autorange) and its peak
+traced memory is recorded with tracemalloc, for each n in --sizes. Results can be
+saved as a JSON baseline and later runs compared against it: a case is flagged as a
+regression when its time or peak memory grows by more than the given ratio (and by
+more than a small absolute floor, so microsecond noise at small n is ignored), and
+the script then exits with status 1 so scheduled jobs fail visibly.
+
+Bootstrap-based cases use a fixed BootstrapConfig(n_resamples=200) so the sweep to
+n = 10^6 stays tractable; their cost scales linearly in the number of resamples.
+
+Run with:
+    uv run python benchmarks/suite.py
+    uv run python benchmarks/suite.py --sizes 10 1000 --cases describe correlation_spearman
+    uv run python benchmarks/suite.py --save benchmarks/baseline.json
+    uv run python benchmarks/suite.py --baseline benchmarks/baseline.json --time-ratio 1.3
+"""
+
+from __future__ import annotations
+
+import sys
+import json
+import timeit
+import argparse
+import platform
+import warnings
+import tracemalloc
+from typing import Any, Callable
+from pathlib import Path
+from datetime import datetime, timezone
+
+import numpy as np
+import scipy
+
+import stats4science as stats
+
+SCHEMA_VERSION = 1
+DEFAULT_SIZES = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+# Differences below these floors are treated as noise whatever the ratio.
+TIME_FLOOR_SECONDS = 1e-3
+MEMORY_FLOOR_BYTES = 1 << 16
+
+BOOTSTRAP = stats.BootstrapConfig(n_resamples=200)
+
+# A case builds its inputs for a given n outside the timed region and returns the call to time.
+CaseFactory = Callable[[int, np.random.Generator], Callable[[], object]]
+
+
+def _groups(n: int, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+    return rng.normal(size=n), rng.normal(loc=0.3, size=n)
+
+
+def _pairs(n: int, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+    x = rng.normal(size=n)
+    return x, 0.5 * x + rng.normal(size=n)
+
+
+def _describe(n: int, rng: np.random.Generator) -> Callable[[], object]:
+    x = rng.normal(size=n)
+    return lambda: stats.describe(x)
+
+
+def _compare_mean_difference(n: int, rng: np.random.Generator) -> Callable[[], object]:
+    x, y = _groups(n, rng)
+    return lambda: stats.compare_independent_groups(x, y, estimand="mean_difference")
+
+
+def _compare_stochastic_dominance(n: int, rng: np.random.Generator) -> Callable[[], object]:
+    x, y = _groups(n, rng)
+    return lambda: stats.compare_independent_groups(x, y, estimand="stochastic_dominance", bootstrap=BOOTSTRAP)
+
+
+def _correlation_pearson(n: int, rng: np.random.Generator) -> Callable[[], object]:
+    x, y = _pairs(n, rng)
+    return lambda: stats.correlation(x, y, method="pearson")
+
+
+def _correlation_spearman(n: int, rng: np.random.Generator) -> Callable[[], object]:
+    x, y = _pairs(n, rng)
+    return lambda: stats.correlation(x, y, method="spearman", bootstrap=BOOTSTRAP)
+
+
+def _segmented(n: int, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Long-format rows in about n / 100 segments, half of each segment treated.
+    treated = rng.random(n) < 0.5
+    return rng.normal(size=n) + 0.3 * treated, treated, rng.integers(0, max(1, n // 100), size=n)
+
+
+def _compare_by_group(n: int, rng: np.random.Generator) -> Callable[[], object]:
+    values, treated, segments = _segmented(n, rng)
+    return lambda: stats.compare_by_group(values, treated, segments, group1=True)
+
+
+def _compare_by_group_ranks(n: int, rng: np.random.Generator) -> Callable[[], object]:
+    values, treated, segments = _segmented(n, rng)
+    return lambda: stats.compare_by_group(values, treated, segments, group1=True, estimand="stochastic_dominance")
+
+
+def _report_two_group(n: int, rng: np.random.Generator) -> Callable[[], object]:
+    result = stats.compare_independent_groups(*_groups(n, rng))
+    return lambda: stats.report_two_group(result)
+
+
+def _report_correlation(n: int, rng: np.random.Generator) -> Callable[[], object]:
+    result = stats.correlation(*_pairs(n, rng), method="pearson")
+    return lambda: stats.report_correlation(result)
+
+
+CASES: dict[str, CaseFactory] = {
+    "describe": _describe,
+    "compare_mean_difference": _compare_mean_difference,
+    "compare_stochastic_dominance": _compare_stochastic_dominance,
+    "correlation_pearson": _correlation_pearson,
+    "correlation_spearman": _correlation_spearman,
+    "compare_by_group": _compare_by_group,
+    "compare_by_group_ranks": _compare_by_group_ranks,
+    "report_two_group": _report_two_group,
+    "report_correlation": _report_correlation,
+}
+
+
+def _per_call_seconds(fn: Callable[[], object], repeat: int) -> float:
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def _peak_bytes(fn: Callable[[], object]) -> int:
+    # NumPy reports its array buffers to tracemalloc, so this covers the numerical work too.
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(cases: list[str], sizes: list[int], repeat: int, seed: int) -> list[dict[str, Any]]:
+    results = []
+    for name in cases:
+        for n in sizes:
+            fn = CASES[name](n, np.random.default_rng(seed))
+            results.append(
+                {"case": name, "n": n, "seconds": _per_call_seconds(fn, repeat), "peak_bytes": _peak_bytes(fn)}
+            )
+            print(f"  {name:<30} n={n:<9} done", file=sys.stderr)
+    return results
+
+
+def environment() -> dict[str, str]:
+    return {
+        "stats4science": stats.__version__,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "scipy": scipy.__version__,
+        "machine": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+    }
+
+
+def compare(
+    results: list[dict[str, Any]], baseline: dict[str, Any], *, time_ratio: float, memory_ratio: float
+) -> list[dict[str, Any]]:
+    """Annotate each result with its ratios to the baseline and whether it regressed."""
+    previous = {(row["case"], row["n"]): row for row in baseline["results"]}
+    annotated = []
+    for row in results:
+        row = dict(row)
+        base = previous.get((row["case"], row["n"]))
+        if base is not None:
+            row["time_ratio"] = row["seconds"] / base["seconds"]
+            row["memory_ratio"] = row["peak_bytes"] / max(base["peak_bytes"], 1)
+            slower = row["time_ratio"] > time_ratio and row["seconds"] - base["seconds"] > TIME_FLOOR_SECONDS
+            larger = row["memory_ratio"] > memory_ratio and row["peak_bytes"] - base["peak_bytes"] > MEMORY_FLOOR_BYTES
+            row["regression"] = [label for label, flag in (("time", slower), ("memory", larger)) if flag]
+        annotated.append(row)
+    return annotated
+
+
+def print_table(rows: list[dict[str, Any]]) -> None:
+    print(f"{'case':<30} {'n':>9} {'ms':>11} {'peak MiB':>10} {'time x':>8} {'mem x':>7}  flag")
+    for row in rows:
+        line = f"{row['case']:<30} {row['n']:>9} {1e3 * row['seconds']:>11.3f} {row['peak_bytes'] / 2**20:>10.2f}"
+        if "time_ratio" in row:
+            flag = "REGRESSION (" + ", ".join(row["regression"]) + ")" if row["regression"] else ""
+            line += f" {row['time_ratio']:>7.2f}x {row['memory_ratio']:>6.2f}x  {flag}"
+        print(line)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=list(CASES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", type=Path, help="write the results as a JSON baseline")
+    parser.add_argument("--baseline", type=Path, help="compare against a JSON baseline written by --save")
+    parser.add_argument("--time-ratio", type=float, default=1.25, help="flag cases slower than this ratio")
+    parser.add_argument("--memory-ratio", type=float, default=1.25, help="flag cases whose peak memory grows more")
+    args = parser.parse_args()
+
+    # Shapiro-Wilk warns about p-value accuracy above n = 5000; irrelevant for timing.
+    warnings.simplefilter("ignore", UserWarning)
+    results = run(args.cases, args.sizes, args.repeat, args.seed)
+    env = environment()
+
+    rows = results
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text())
+        if baseline.get("schema") != SCHEMA_VERSION:
+            raise SystemExit(f"{args.baseline} has schema {baseline.get('schema')}, expected {SCHEMA_VERSION}.")
+        changed = [key for key, value in env.items() if baseline["environment"].get(key) != value]
+        if changed:
+            print(f"Note: baseline environment differs in {', '.join(changed)}; ratios may reflect that too.")
+        rows = compare(results, baseline, time_ratio=args.time_ratio, memory_ratio=args.memory_ratio)
+    print_table(rows)
+
+    if args.save is not None:
+        document = {
+            "schema": SCHEMA_VERSION,
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "environment": env,
+            "results": results,
+        }
+        args.save.write_text(json.dumps(document, indent=2) + "\n")
+
+    regressions = [row for row in rows if row.get("regression")]
+    if regressions:
+        print(f"{len(regressions)} regression(s) against {args.baseline}.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,47 +1,174 @@
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .version import __version__
-from .inferential_stats import (
-    EffectSize,
-    AssumptionCheck,
-    DescriptiveStats,
-    CorrelationResult,
-    ConfidenceInterval,
-    TwoGroupComparisonResult,
-    describe,
-    hedges_g,
-    apa_pvalue,
-    correlation,
-    cliffs_delta,
-    report_two_group,
-    shapiro_normality,
-    report_correlation,
-    interpret_two_group,
-    equal_variance_check,
-    interpret_correlation,
-    compare_independent_groups,
-    anderson_darling_candidates,
-    interpret_correlation_coefficient,
-)
+
+if TYPE_CHECKING:
+    from .batch import (
+        TwoGroupBatchResult,
+        CorrelationMatrixResult,
+        GroupedComparisonResult,
+        compare_by_group,
+        correlation_matrix,
+        compare_from_summary,
+        compare_independent_groups_batch,
+    )
+    from .export import ResultFile, load_npz, save_npz, read_jsonl, write_jsonl
+    from .tables import ResultTable
+    from ._kernels import CriticalValueCacheInfo, critical_value_cache_info, reset_critical_value_cache
+    from .profiling import Profiler, CallProfile, StageTiming, add_profile_hook, remove_profile_hook
+    from .streaming import PearsonAccumulator, StreamingDescriptives, compare_independent_groups_streaming
+    from .permutation import PermutationConfig, permutation_test
+    from .multiple_testing import adjust_batch, adjust_pvalues, adjust_results
+    from .inferential_stats import (
+        EffectSize,
+        AssumptionCheck,
+        BootstrapConfig,
+        DescriptiveStats,
+        CorrelationResult,
+        ConfidenceInterval,
+        PermutationSummary,
+        TwoGroupComparisonResult,
+        describe,
+        hedges_g,
+        apa_pvalue,
+        correlation,
+        cliffs_delta,
+        report_two_group,
+        shapiro_normality,
+        report_correlation,
+        interpret_two_group,
+        equal_variance_check,
+        interpret_correlation,
+        compare_independent_groups,
+        anderson_darling_candidates,
+        interpret_correlation_coefficient,
+    )
+
+# Public name -> defining submodule. Submodules are imported on first attribute access
+# (and SciPy only inside the functions that need it), so ``import stats4science`` costs
+# little more than NumPy.
+_EXPORTS: dict[str, str] = {
+    "AssumptionCheck": "inferential_stats",
+    "BootstrapConfig": "inferential_stats",
+    "CallProfile": "profiling",
+    "ConfidenceInterval": "inferential_stats",
+    "CriticalValueCacheInfo": "_kernels",
+    "CorrelationMatrixResult": "batch",
+    "CorrelationResult": "inferential_stats",
+    "DescriptiveStats": "inferential_stats",
+    "EffectSize": "inferential_stats",
+    "GroupedComparisonResult": "batch",
+    "PearsonAccumulator": "streaming",
+    "PermutationConfig": "permutation",
+    "PermutationSummary": "inferential_stats",
+    "Profiler": "profiling",
+    "ResultFile": "export",
+    "ResultTable": "tables",
+    "StageTiming": "profiling",
+    "StreamingDescriptives": "streaming",
+    "TwoGroupBatchResult": "batch",
+    "TwoGroupComparisonResult": "inferential_stats",
+    "add_profile_hook": "profiling",
+    "adjust_batch": "multiple_testing",
+    "adjust_pvalues": "multiple_testing",
+    "adjust_results": "multiple_testing",
+    "anderson_darling_candidates": "inferential_stats",
+    "apa_pvalue": "inferential_stats",
+    "cliffs_delta": "inferential_stats",
+    "compare_by_group": "batch",
+    "compare_from_summary": "batch",
+    "compare_independent_groups": "inferential_stats",
+    "compare_independent_groups_batch": "batch",
+    "compare_independent_groups_streaming": "streaming",
+    "correlation": "inferential_stats",
+    "correlation_matrix": "batch",
+    "critical_value_cache_info": "_kernels",
+    "describe": "inferential_stats",
+    "equal_variance_check": "inferential_stats",
+    "hedges_g": "inferential_stats",
+    "interpret_correlation": "inferential_stats",
+    "interpret_correlation_coefficient": "inferential_stats",
+    "interpret_two_group": "inferential_stats",
+    "load_npz": "export",
+    "permutation_test": "permutation",
+    "read_jsonl": "export",
+    "remove_profile_hook": "profiling",
+    "report_correlation": "inferential_stats",
+    "report_two_group": "inferential_stats",
+    "reset_critical_value_cache": "_kernels",
+    "save_npz": "export",
+    "shapiro_normality": "inferential_stats",
+    "write_jsonl": "export",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __all__ = [
     "__version__",
     "AssumptionCheck",
+    "BootstrapConfig",
+    "CallProfile",
     "ConfidenceInterval",
+    "CriticalValueCacheInfo",
+    "CorrelationMatrixResult",
     "CorrelationResult",
     "DescriptiveStats",
     "EffectSize",
+    "GroupedComparisonResult",
+    "PearsonAccumulator",
+    "PermutationConfig",
+    "PermutationSummary",
+    "Profiler",
+    "ResultFile",
+    "ResultTable",
+    "StageTiming",
+    "StreamingDescriptives",
+    "TwoGroupBatchResult",
     "TwoGroupComparisonResult",
+    "add_profile_hook",
+    "adjust_batch",
+    "adjust_pvalues",
+    "adjust_results",
     "anderson_darling_candidates",
     "apa_pvalue",
     "cliffs_delta",
+    "compare_by_group",
+    "compare_from_summary",
     "compare_independent_groups",
+    "compare_independent_groups_batch",
+    "compare_independent_groups_streaming",
     "correlation",
+    "correlation_matrix",
+    "critical_value_cache_info",
     "describe",
     "equal_variance_check",
     "hedges_g",
     "interpret_correlation",
     "interpret_correlation_coefficient",
     "interpret_two_group",
+    "load_npz",
+    "permutation_test",
+    "read_jsonl",
+    "remove_profile_hook",
     "report_correlation",
     "report_two_group",
+    "reset_critical_value_cache",
+    "save_npz",
     "shapiro_normality",
+    "write_jsonl",
 ]
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import math
+import functools
+from typing import Any, Literal, Optional, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+# Light-weight numeric kernels for the hot paths of the analysis functions.
+#
+# scipy.stats distributions and tests normalise arguments, apply nan policies and
+# build result objects on every call, which costs 50-450 us against a few us of
+# arithmetic for the small samples most analyses see. These kernels call the special
+# functions that scipy.stats itself evaluates (stdtr/stdtrit for t, ndtr/ndtri for
+# the normal, betainc for Pearson's null distribution, fdtrc for F) directly, and
+# compute the test statistics with NumPy. They accept floats or arrays, broadcast like
+# ufuncs and do no validation: callers pass checked, finite inputs.
+#
+# scipy.special is imported on first use so that ``import stats4science`` stays cheap.
+
+Alternative = Literal["two-sided", "less", "greater"]
+
+
+def norm_cdf(x: Any) -> Any:
+    from scipy.special import ndtr
+
+    return ndtr(x)
+
+
+def norm_sf(x: Any) -> Any:
+    from scipy.special import ndtr
+
+    return ndtr(-np.asarray(x, dtype=float))
+
+
+def norm_ppf(q: Any) -> Any:
+    from scipy.special import ndtri
+
+    return ndtri(q)
+
+
+def t_cdf(x: Any, df: Any) -> Any:
+    from scipy.special import stdtr
+
+    return stdtr(df, x)
+
+
+def t_sf(x: Any, df: Any) -> Any:
+    from scipy.special import stdtr
+
+    return stdtr(df, -np.asarray(x, dtype=float))
+
+
+def t_ppf(q: Any, df: Any) -> Any:
+    from scipy.special import stdtrit
+
+    return stdtrit(df, q)
+
+
+def t_pvalue(statistic: Any, df: Any, alternative: Alternative) -> Any:
+    """P-value of a t statistic with ``df`` degrees of freedom (Welch df may be fractional)."""
+    if alternative == "two-sided":
+        return np.minimum(2.0 * t_sf(np.abs(statistic), df), 1.0)
+    if alternative == "greater":
+        return t_sf(statistic, df)
+    return t_cdf(statistic, df)
+
+
+# ------------------------------
+# Critical values
+# ------------------------------
+
+_CRITICAL_CACHE_SIZE = 1024
+# Welch's fractional df read t quantiles from a table on a uniform grid in u = 1/df
+# over df >= 1 (u = 0 is the normal limit), with 4-point Lagrange interpolation:
+# the relative error is below 1e-11 for upper levels up to 0.9995.
+_TABLE_POINTS = 2048
+_TABLE_CACHE_SIZE = 32
+_table_lookups = 0
+
+
+@dataclass(frozen=True)
+class CriticalValueCacheInfo:
+    """
+    Counters of the critical-value caches, for tuning their size.
+
+    ``hits``/``misses``/``maxsize``/``currsize`` describe the LRU cache of exact
+    quantiles keyed by (distribution, level, sidedness, df), used for normal quantiles
+    and integer df. ``interpolated`` counts fractional-df t quantiles read from the
+    interpolation tables and ``tables`` the tables built (one per level and sidedness).
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    interpolated: int
+    tables: int
+
+
+def _upper_level(confidence_level: float, two_sided: bool) -> float:
+    alpha = 1.0 - confidence_level
+    return 1.0 - alpha / 2.0 if two_sided else 1.0 - alpha
+
+
+def _exact_critical(distribution: str, confidence_level: float, two_sided: bool, df: Optional[float]) -> float:
+    level = _upper_level(confidence_level, two_sided)
+    return float(norm_ppf(level) if distribution == "norm" else t_ppf(level, df))
+
+
+_cached_critical = functools.lru_cache(maxsize=_CRITICAL_CACHE_SIZE)(_exact_critical)
+
+
+@functools.lru_cache(maxsize=_TABLE_CACHE_SIZE)
+def _t_table(confidence_level: float, two_sided: bool) -> tuple[np.ndarray, list[float]]:
+    level = _upper_level(confidence_level, two_sided)
+    u = np.linspace(0.0, 1.0, _TABLE_POINTS + 1)
+    with np.errstate(divide="ignore"):
+        quantiles = t_ppf(level, 1.0 / u)
+    quantiles[0] = norm_ppf(level)
+    # The list serves scalar lookups without NumPy call overhead.
+    return quantiles, quantiles.tolist()
+
+
+def _lagrange4(y0: Any, y1: Any, y2: Any, y3: Any, s: Any) -> Any:
+    # Cubic through equally spaced nodes at 0, 1, 2, 3, evaluated at s.
+    return (
+        -y0 * (s - 1.0) * (s - 2.0) * (s - 3.0) / 6.0
+        + y1 * s * (s - 2.0) * (s - 3.0) / 2.0
+        - y2 * s * (s - 1.0) * (s - 3.0) / 2.0
+        + y3 * s * (s - 1.0) * (s - 2.0) / 6.0
+    )
+
+
+def _interpolated_t_critical(confidence_level: float, df: Any, two_sided: bool) -> Any:
+    global _table_lookups
+    quantiles, values = _t_table(confidence_level, two_sided)
+    if isinstance(df, float):
+        _table_lookups += 1
+        x = _TABLE_POINTS / df
+        i = min(max(int(x) - 1, 0), _TABLE_POINTS - 3)
+        return _lagrange4(values[i], values[i + 1], values[i + 2], values[i + 3], x - i)
+    _table_lookups += df.size
+    x = _TABLE_POINTS / df
+    i = np.clip(x.astype(np.intp) - 1, 0, _TABLE_POINTS - 3)
+    return _lagrange4(quantiles[i], quantiles[i + 1], quantiles[i + 2], quantiles[i + 3], x - i)
+
+
+def t_critical(confidence_level: float, df: Any, alternative: Alternative) -> Any:
+    """
+    t quantile bounding a two-sided (1 - alpha/2) or one-sided (1 - alpha) interval.
+
+    Integer df are memoised exactly; fractional df >= 1 (Welch) are interpolated from a
+    per-level table, and anything else is computed directly.
+    """
+    two_sided = alternative == "two-sided"
+    # np.ndim costs more than the lookup itself, so plain numbers are recognised first.
+    if isinstance(df, (float, int)) or np.ndim(df) == 0:
+        df = float(df)
+        if df.is_integer():
+            return _cached_critical("t", confidence_level, two_sided, df)
+        if df >= 1.0:
+            return _interpolated_t_critical(confidence_level, df, two_sided)
+        return _exact_critical("t", confidence_level, two_sided, df)
+    df = np.asarray(df, dtype=float)
+    tabulated = df >= 1.0
+    if tabulated.all():
+        return _interpolated_t_critical(confidence_level, df, two_sided)
+    out = t_ppf(_upper_level(confidence_level, two_sided), df)
+    out[tabulated] = _interpolated_t_critical(confidence_level, df[tabulated], two_sided)
+    return out
+
+
+def z_critical(confidence_level: float, alternative: Alternative) -> float:
+    """Standard normal counterpart of ``t_critical``, memoised."""
+    return _cached_critical("norm", confidence_level, alternative == "two-sided", None)
+
+
+def critical_value_cache_info() -> CriticalValueCacheInfo:
+    """Hit/miss counters of the critical values behind t and Fisher z intervals."""
+    exact = _cached_critical.cache_info()
+    return CriticalValueCacheInfo(
+        hits=exact.hits,
+        misses=exact.misses,
+        maxsize=exact.maxsize or 0,
+        currsize=exact.currsize,
+        interpolated=_table_lookups,
+        tables=_t_table.cache_info().currsize,
+    )
+
+
+def reset_critical_value_cache(*, maxsize: Optional[int] = None) -> None:
+    """Empty the critical-value caches and zero their counters, optionally resizing the LRU cache."""
+    global _cached_critical, _table_lookups
+    if maxsize is not None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer.")
+        _cached_critical = functools.lru_cache(maxsize=maxsize)(_exact_critical)
+    _cached_critical.cache_clear()
+    _t_table.cache_clear()
+    _table_lookups = 0
+
+
+def brown_forsythe(groups: Sequence[np.ndarray], centers: Sequence[float]) -> tuple[float, float]:
+    """
+    Levene statistic on absolute deviations from the given group centers, and its F p-value.
+
+    With medians as centers this is the Brown-Forsythe test, as
+    ``scipy.stats.levene(*groups, center="median")``; with means, the original Levene test.
+    """
+    from scipy.special import fdtrc
+
+    k = len(groups)
+    deviations = [np.abs(values - center) for values, center in zip(groups, centers)]
+    sizes = np.array([d.size for d in deviations], dtype=float)
+    means = np.array([d.mean() for d in deviations])
+    total = sizes.sum()
+    grand_mean = float(np.dot(sizes, means) / total)
+    between = float(np.dot(sizes, (means - grand_mean) ** 2))
+    within = math.fsum(float(np.sum((d - m) ** 2)) for d, m in zip(deviations, means))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        statistic = float(np.divide((total - k) * between, (k - 1) * within))
+    return statistic, float(fdtrc(k - 1, total - k, statistic))
+
+
+def pearson(x: np.ndarray, y: np.ndarray, alternative: Alternative) -> tuple[float, float]:
+    """
+    Pearson's r and its exact p-value under independent normal data, as ``scipy.stats.pearsonr``.
+
+    Under the null, (r + 1) / 2 follows Beta(n/2 - 1, n/2 - 1), so the p-value is a
+    regularized incomplete beta function of r.
+    """
+    from scipy.special import betainc, betaincc
+
+    xm = x - x.mean()
+    ym = y - y.mean()
+    # Scaling by the largest deviation first avoids premature overflow in the norms.
+    xm = xm / np.max(np.abs(xm))
+    ym = ym / np.max(np.abs(ym))
+    r = float(np.clip(np.dot(xm / np.linalg.norm(xm), ym / np.linalg.norm(ym)), -1.0, 1.0))
+    ab = x.size / 2.0 - 1.0
+    if alternative == "two-sided":
+        p_value = 2.0 * float(betaincc(ab, ab, (abs(r) + 1.0) / 2.0))
+    elif alternative == "greater":
+        p_value = float(betaincc(ab, ab, (r + 1.0) / 2.0))
+    else:
+        p_value = float(betainc(ab, ab, (r + 1.0) / 2.0))
+    return r, p_value
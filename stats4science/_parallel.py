@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Any, Literal, Mapping, Callable, Iterable, Generator
+from functools import partial
+from itertools import islice
+from collections import deque
+
+import numpy as np
+
+# multiprocessing and concurrent.futures are imported only once work is actually spread
+# over workers, keeping them out of ``import stats4science``.
+if TYPE_CHECKING:
+    from multiprocessing import shared_memory
+    from concurrent.futures import Executor
+
+ParallelBackend = Literal["thread", "process"]
+ChunkKernel = Callable[[Mapping[str, np.ndarray], tuple[Any, ...], np.random.Generator, int], np.ndarray]
+
+# Arrays attached from shared memory inside a process-pool worker, keyed by name.
+_WORKER_ARRAYS: dict[str, np.ndarray] = {}
+_WORKER_SEGMENTS: list[shared_memory.SharedMemory] = []
+
+
+def resolve_n_jobs(n_jobs: int) -> int:
+    if n_jobs == -1:
+        return os.cpu_count() or 1
+    if n_jobs < 1:
+        raise ValueError("n_jobs must be a positive integer or -1 for all available cores.")
+    return n_jobs
+
+
+def _share_arrays(
+    arrays: Mapping[str, np.ndarray],
+) -> tuple[list[shared_memory.SharedMemory], dict[str, tuple[str, tuple[int, ...], str]]]:
+    from multiprocessing import shared_memory
+
+    segments: list[shared_memory.SharedMemory] = []
+    specs: dict[str, tuple[str, tuple[int, ...], str]] = {}
+    try:
+        for key, array in arrays.items():
+            segment = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+            segments.append(segment)
+            np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)[...] = array
+            specs[key] = (segment.name, array.shape, array.dtype.str)
+    except BaseException:
+        _release_segments(segments)
+        raise
+    return segments, specs
+
+
+def _release_segments(segments: list[shared_memory.SharedMemory]) -> None:
+    for segment in segments:
+        segment.close()
+        segment.unlink()
+
+
+def _attach_arrays(specs: Mapping[str, tuple[str, tuple[int, ...], str]]) -> None:
+    # Worker initializer: map the parent's segments read-only instead of unpickling copies.
+    from multiprocessing import shared_memory
+
+    for key, (name, shape, dtype) in specs.items():
+        segment = shared_memory.SharedMemory(name=name)
+        _WORKER_SEGMENTS.append(segment)
+        view = np.ndarray(shape, dtype=np.dtype(dtype), buffer=segment.buf)
+        view.flags.writeable = False
+        _WORKER_ARRAYS[key] = view
+
+
+def _run_on_worker_arrays(
+    kernel: ChunkKernel, params: tuple[Any, ...], rng: np.random.Generator, size: int
+) -> np.ndarray:
+    return kernel(_WORKER_ARRAYS, params, rng, size)
+
+
+def map_chunks(
+    kernel: ChunkKernel,
+    arrays: Mapping[str, np.ndarray],
+    params: tuple[Any, ...],
+    tasks: Iterable[tuple[np.random.Generator, int]],
+    *,
+    n_jobs: int = 1,
+    backend: ParallelBackend = "thread",
+) -> Generator[np.ndarray, None, None]:
+    """
+    Evaluate ``kernel(arrays, params, rng, size)`` for each ``(rng, size)`` task, yielding
+    results in task order whatever the worker count.
+
+    At most ``2 * n_jobs`` tasks are in flight, so a consumer that stops iterating early
+    (e.g. adaptive bootstrap) does not pay for the remaining tasks. With the process
+    backend the input arrays are placed in shared memory once rather than pickled per task.
+    """
+    n_jobs = resolve_n_jobs(n_jobs)
+    if n_jobs == 1:
+        for rng, size in tasks:
+            yield kernel(arrays, params, rng, size)
+        return
+
+    from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+    segments: list[shared_memory.SharedMemory] = []
+    executor: Executor
+    if backend == "thread":
+        executor = ThreadPoolExecutor(max_workers=n_jobs)
+        fn: Callable[[np.random.Generator, int], np.ndarray] = partial(kernel, arrays, params)
+    elif backend == "process":
+        segments, specs = _share_arrays(arrays)
+        executor = ProcessPoolExecutor(max_workers=n_jobs, initializer=_attach_arrays, initargs=(specs,))
+        fn = partial(_run_on_worker_arrays, kernel, params)
+    else:
+        raise ValueError("backend must be 'thread' or 'process'.")
+
+    try:
+        task_iter = iter(tasks)
+        pending = deque(executor.submit(fn, rng, size) for rng, size in islice(task_iter, 2 * n_jobs))
+        while pending:
+            result = pending.popleft().result()
+            for rng, size in islice(task_iter, 1):
+                pending.append(executor.submit(fn, rng, size))
+            yield result
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        _release_segments(segments)
@@ -0,0 +1,831 @@
+from __future__ import annotations
+
+import math
+from typing import Any, Iterable, Optional
+from dataclasses import replace, dataclass
+
+import numpy as np
+
+from .inferential_stats import (
+    Alternative,
+    ArrayLike1D,
+    DescriptiveStats,
+    CorrelationMethod,
+    ComparisonEstimand,
+    TwoGroupComparisonResult,
+    _t_test_pvalue,
+    _fisher_z_bounds,
+    _pooled_variance,
+    _hedges_correction,
+    _t_interval_bounds,
+    _mean_difference_ci,
+    _mean_difference_note,
+    _hedges_g_from_moments,
+    _mean_difference_se_df,
+    _mann_whitney_normal_pvalue,
+)
+
+
+@dataclass(frozen=True)
+class TwoGroupBatchResult:
+    """
+    Columnar mean-difference results, one entry per (group1, group2) pair.
+
+    Every array field has length ``len(result)``; entry ``i`` matches what
+    ``compare_independent_groups`` reports for pair ``i`` (without diagnostics).
+    """
+
+    method: str
+    alternative: Alternative
+    confidence_level: float
+    n1: np.ndarray
+    n2: np.ndarray
+    mean1: np.ndarray
+    mean2: np.ndarray
+    sd1: np.ndarray
+    sd2: np.ndarray
+    estimate: np.ndarray
+    statistic: np.ndarray
+    df: np.ndarray
+    p_value: np.ndarray
+    ci_lower: np.ndarray
+    ci_upper: np.ndarray
+    hedges_g: np.ndarray
+    notes: tuple[str, ...] = ()
+
+    _COLUMNS = (
+        "n1",
+        "n2",
+        "mean1",
+        "mean2",
+        "sd1",
+        "sd2",
+        "estimate",
+        "statistic",
+        "df",
+        "p_value",
+        "ci_lower",
+        "ci_upper",
+        "hedges_g",
+    )
+
+    def __len__(self) -> int:
+        return int(self.estimate.size)
+
+    def columns(self) -> dict[str, np.ndarray]:
+        return {name: getattr(self, name) for name in self._COLUMNS}
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            "method": self.method,
+            "alternative": self.alternative,
+            "confidence_level": self.confidence_level,
+        }
+        out.update({name: column.tolist() for name, column in self.columns().items()})
+        out["notes"] = list(self.notes)
+        return out
+
+
+def _ragged_moments(
+    pairs: Iterable[tuple[ArrayLike1D, ArrayLike1D]],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    # Flatten every group into one buffer so all moments come from a handful of
+    # segmented reductions rather than one NumPy call per group.
+    groups: list[np.ndarray] = []
+    for index, pair in enumerate(pairs):
+        if len(pair) != 2:
+            raise ValueError(f"pairs[{index}] must be a (group1, group2) pair.")
+        for side, data in enumerate(pair, start=1):
+            arr = np.asarray(data, dtype=float)
+            if arr.ndim != 1:
+                raise ValueError(f"pairs[{index}] group{side} must be one-dimensional, got shape={arr.shape}.")
+            groups.append(arr)
+    if not groups:
+        raise ValueError("pairs must contain at least one (group1, group2) pair.")
+    counts = np.array([g.size for g in groups], dtype=np.int64)
+    values = np.concatenate(groups)
+    _check_sizes_and_values(counts, values)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    means = np.add.reduceat(values, starts) / counts
+    deviations = values - np.repeat(means, counts)
+    variances = np.add.reduceat(deviations * deviations, starts) / (counts - 1)
+    return counts[0::2], means[0::2], variances[0::2], counts[1::2], means[1::2], variances[1::2]
+
+
+def _padded_moments(
+    data: np.ndarray, lengths: Optional[Any], *, name: str
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    x = np.asarray(data, dtype=float)
+    if x.ndim != 2:
+        raise ValueError(f"{name} must be two-dimensional (pairs x observations), got shape={x.shape}.")
+    if lengths is None:
+        counts = np.full(x.shape[0], x.shape[1], dtype=np.int64)
+    else:
+        counts = np.asarray(lengths, dtype=np.int64)
+        if counts.shape != (x.shape[0],):
+            raise ValueError(f"lengths for {name} must have one entry per row, got shape={counts.shape}.")
+        if np.any(counts > x.shape[1]):
+            raise ValueError(f"lengths for {name} must not exceed the row width {x.shape[1]}.")
+    mask = np.arange(x.shape[1])[None, :] < counts[:, None]
+    _check_sizes_and_values(counts, x[mask])
+    filled = np.where(mask, x, 0.0)
+    means = filled.sum(axis=1) / counts
+    deviations = np.where(mask, x - means[:, None], 0.0)
+    variances = np.einsum("ij,ij->i", deviations, deviations) / (counts - 1)
+    return counts, means, variances
+
+
+def _check_sizes_and_values(counts: np.ndarray, values: np.ndarray) -> None:
+    if np.any(counts < 2):
+        raise ValueError("At least 2 observations per group are required.")
+    if np.isnan(values).any():
+        raise ValueError("Groups contain NaN values. Impute or remove them explicitly before analysis.")
+    if np.isinf(values).any():
+        raise ValueError("Groups contain infinite values.")
+
+
+def compare_independent_groups_batch(
+    pairs: Optional[Iterable[tuple[ArrayLike1D, ArrayLike1D]]] = None,
+    *,
+    group1: Optional[np.ndarray] = None,
+    group2: Optional[np.ndarray] = None,
+    lengths1: Optional[Any] = None,
+    lengths2: Optional[Any] = None,
+    method: str = "welch",
+    alternative: Alternative = "two-sided",
+    confidence_level: float = 0.95,
+) -> TwoGroupBatchResult:
+    """
+    Compare many independent group pairs by mean difference in one vectorised pass.
+
+    Parameters
+    ----------
+    pairs:
+        Ragged collection of ``(group1, group2)`` samples.
+    group1, group2:
+        Alternatively, padded 2-D arrays with one pair per row; ``lengths1`` and
+        ``lengths2`` give the number of valid leading entries per row (default: full rows).
+    method:
+        {'welch', 'student'}; default is 'welch'.
+
+    Notes
+    -----
+    Statistics, confidence intervals, degrees of freedom and Hedges' g use the same
+    formulas as ``compare_independent_groups``. Descriptives beyond mean/SD and
+    assumption diagnostics are not computed; pairs with zero variance get infinite
+    or NaN entries instead of raising.
+    """
+    test_method = method.lower()
+    if test_method not in {"welch", "student"}:
+        raise ValueError("method must be 'welch' or 'student'.")
+    if pairs is not None:
+        if group1 is not None or group2 is not None:
+            raise ValueError("Pass either pairs or padded group1/group2 arrays, not both.")
+        n1, mean1, var1, n2, mean2, var2 = _ragged_moments(pairs)
+    else:
+        if group1 is None or group2 is None:
+            raise ValueError("Pass either pairs or both padded group1 and group2 arrays.")
+        n1, mean1, var1 = _padded_moments(group1, lengths1, name="group1")
+        n2, mean2, var2 = _padded_moments(group2, lengths2, name="group2")
+        if n1.size != n2.size:
+            raise ValueError(f"group1 and group2 must have the same number of rows, got {n1.size} and {n2.size}.")
+
+    return _batch_from_moments(
+        n1,
+        mean1,
+        var1,
+        n2,
+        mean2,
+        var2,
+        equal_var=test_method == "student",
+        alternative=alternative,
+        confidence_level=confidence_level,
+    )
+
+
+def _batch_from_moments(
+    n1: np.ndarray,
+    mean1: np.ndarray,
+    var1: np.ndarray,
+    n2: np.ndarray,
+    mean2: np.ndarray,
+    var2: np.ndarray,
+    *,
+    equal_var: bool,
+    alternative: Alternative,
+    confidence_level: float,
+) -> TwoGroupBatchResult:
+    estimate = mean1 - mean2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        se, df = _mean_difference_se_df(var1, n1, var2, n2, equal_var=equal_var)
+        statistic = estimate / se
+        p_value = _t_test_pvalue(statistic, df, alternative)
+        lower, upper = _t_interval_bounds(estimate, se, df, confidence_level=confidence_level, alternative=alternative)
+        pooled_sd = np.sqrt(_pooled_variance(var1, n1, var2, n2))
+        g = np.where(pooled_sd > 0, _hedges_correction(n1, n2) * estimate / pooled_sd, np.nan)
+
+    notes = [
+        "Welch's t-test does not assume equal variances."
+        if not equal_var
+        else "Student's t-test assumes equal variances across groups.",
+        "Assumption diagnostics are not computed in batch mode. Pairs with zero variance follow SciPy's conventions for the t statistic (infinite or NaN), and Hedges' g is NaN where the pooled SD is zero.",
+    ]
+    return TwoGroupBatchResult(
+        method="Welch_t_test" if not equal_var else "Students_t_test",
+        alternative=alternative,
+        confidence_level=confidence_level,
+        n1=n1,
+        n2=n2,
+        mean1=mean1,
+        mean2=mean2,
+        sd1=np.sqrt(var1),
+        sd2=np.sqrt(var2),
+        estimate=estimate,
+        statistic=np.asarray(statistic, dtype=float),
+        df=np.asarray(df, dtype=float),
+        p_value=np.asarray(p_value, dtype=float),
+        ci_lower=np.asarray(lower, dtype=float),
+        ci_upper=np.asarray(upper, dtype=float),
+        hedges_g=np.asarray(g, dtype=float),
+        notes=tuple(notes),
+    )
+
+
+def _summary_descriptives(n: int, mean: float, sd: float) -> DescriptiveStats:
+    return DescriptiveStats(
+        n=n,
+        mean=mean,
+        sd=sd,
+        median=math.nan,
+        minimum=math.nan,
+        maximum=math.nan,
+        kurtosis_fisher=math.nan,
+        notes=("Built from summary statistics; median, minimum, maximum and kurtosis are unavailable (NaN).",),
+    )
+
+
+def compare_from_summary(
+    n1: Any,
+    mean1: Any,
+    sd1: Any,
+    n2: Any,
+    mean2: Any,
+    sd2: Any,
+    *,
+    method: str = "welch",
+    alternative: Alternative = "two-sided",
+    confidence_level: float = 0.95,
+) -> TwoGroupComparisonResult | TwoGroupBatchResult:
+    """
+    Compare two independent groups by mean difference from per-group n, mean and SD.
+
+    Scalar inputs return a ``TwoGroupComparisonResult``; array inputs (broadcast
+    against each other) are scored in one vectorised pass and return a
+    ``TwoGroupBatchResult``. The t statistic, p-value, CI, df and Hedges' g use the
+    same formulas as ``compare_independent_groups``, so they agree with the raw-data
+    analysis. Normality and equal-variance diagnostics need the raw observations and
+    are reported as unavailable.
+
+    Parameters
+    ----------
+    sd1, sd2:
+        Sample standard deviations (``ddof=1``).
+    method:
+        {'welch', 'student'}; default is 'welch'.
+    """
+    test_method = method.lower()
+    if test_method not in {"welch", "student"}:
+        raise ValueError("method must be 'welch' or 'student'.")
+    arrays = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (n1, mean1, sd1, n2, mean2, sd2)))
+    counts1, m1, s1, counts2, m2, s2 = arrays
+    for name, counts in (("n1", counts1), ("n2", counts2)):
+        if np.any(counts != np.round(counts)) or np.any(counts < 2):
+            raise ValueError(f"{name} must contain integer counts of at least 2 observations.")
+    if not all(np.isfinite(v).all() for v in arrays):
+        raise ValueError("Summary statistics must be finite (no NaN or infinite values).")
+    if np.any(s1 < 0) or np.any(s2 < 0):
+        raise ValueError("Standard deviations must be non-negative.")
+    equal_var = test_method == "student"
+
+    if counts1.ndim > 0:
+        result = _batch_from_moments(
+            counts1.astype(np.int64),
+            m1,
+            s1 * s1,
+            counts2.astype(np.int64),
+            m2,
+            s2 * s2,
+            equal_var=equal_var,
+            alternative=alternative,
+            confidence_level=confidence_level,
+        )
+        return replace(
+            result,
+            notes=(
+                result.notes[0],
+                "Computed from summary statistics (n, mean, SD); assumption diagnostics are unavailable. Pairs with zero variance follow SciPy's conventions for the t statistic (infinite or NaN), and Hedges' g is NaN where the pooled SD is zero.",
+            ),
+        )
+
+    size1, size2 = int(counts1), int(counts2)
+    mean_diff = float(m1 - m2)
+    var1, var2 = float(s1) ** 2, float(s2) ** 2
+    effect = _hedges_g_from_moments(mean_diff, var1, size1, var2, size2)
+    se, _ = _mean_difference_se_df(var1, size1, var2, size2, equal_var=equal_var)
+    statistic = mean_diff / float(se)
+    ci, df = _mean_difference_ci(
+        mean_diff,
+        var1,
+        size1,
+        var2,
+        size2,
+        confidence_level=confidence_level,
+        equal_var=equal_var,
+        alternative=alternative,
+    )
+    return TwoGroupComparisonResult(
+        estimand="mean_difference",
+        method="Welch_t_test" if not equal_var else "Students_t_test",
+        alternative=alternative,
+        statistic=statistic,
+        p_value=float(_t_test_pvalue(statistic, df, alternative)),
+        estimate=mean_diff,
+        estimate_label="mean_difference",
+        ci=ci,
+        effect_size=effect,
+        n1=size1,
+        n2=size2,
+        group1_descriptives=_summary_descriptives(size1, float(m1), float(s1)),
+        group2_descriptives=_summary_descriptives(size2, float(m2), float(s2)),
+        df=df,
+        assumptions=(),
+        notes=(
+            _mean_difference_note(equal_var),
+            "Computed from summary statistics (n, mean, SD); normality and equal-variance diagnostics are unavailable because they need the raw observations.",
+        ),
+    )
+
+
+@dataclass(frozen=True)
+class GroupedComparisonResult:
+    """
+    Columnar two-group comparisons, one entry per segment of a long-format dataset.
+
+    Entry ``i`` compares the observations of segment ``segments[i]`` labelled ``group1``
+    with those labelled ``group2``; its statistic, p-value, estimate and effect size are
+    those ``compare_independent_groups`` reports for that slice (without diagnostics or,
+    for stochastic dominance, the bootstrap interval). Segments with fewer than 2
+    observations in either group have NaN statistics.
+    """
+
+    estimand: ComparisonEstimand
+    method: str
+    alternative: Alternative
+    confidence_level: float
+    group1: Any
+    group2: Any
+    effect_size_name: str
+    segments: np.ndarray
+    n1: np.ndarray
+    n2: np.ndarray
+    mean1: np.ndarray
+    mean2: np.ndarray
+    sd1: np.ndarray
+    sd2: np.ndarray
+    estimate: np.ndarray
+    statistic: np.ndarray
+    df: np.ndarray
+    p_value: np.ndarray
+    ci_lower: np.ndarray
+    ci_upper: np.ndarray
+    effect_size: np.ndarray
+    notes: tuple[str, ...] = ()
+
+    _COLUMNS = (
+        "segments",
+        "n1",
+        "n2",
+        "mean1",
+        "mean2",
+        "sd1",
+        "sd2",
+        "estimate",
+        "statistic",
+        "df",
+        "p_value",
+        "ci_lower",
+        "ci_upper",
+        "effect_size",
+    )
+
+    def __len__(self) -> int:
+        return int(self.segments.size)
+
+    def columns(self) -> dict[str, np.ndarray]:
+        return {name: getattr(self, name) for name in self._COLUMNS}
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            "estimand": self.estimand,
+            "method": self.method,
+            "alternative": self.alternative,
+            "confidence_level": self.confidence_level,
+            "group1": _builtin(self.group1),
+            "group2": _builtin(self.group2),
+            "effect_size_name": self.effect_size_name,
+        }
+        out.update({name: column.tolist() for name, column in self.columns().items()})
+        out["notes"] = list(self.notes)
+        return out
+
+
+def _builtin(value: Any) -> Any:
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _segment_ranks(
+    values: np.ndarray, segment_codes: np.ndarray, in_group1: np.ndarray, n_total: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # One sort by (segment, value). Runs of equal values within a segment are ties;
+    # each run gets its within-segment midrank, and the rank sums and tie terms per
+    # segment follow from bincounts.
+    order = np.lexsort((values, segment_codes))
+    sorted_values, sorted_segments, sorted_group1 = values[order], segment_codes[order], in_group1[order]
+    new_run = np.ones(values.size, dtype=bool)
+    new_run[1:] = (sorted_segments[1:] != sorted_segments[:-1]) | (sorted_values[1:] != sorted_values[:-1])
+    run_starts = np.flatnonzero(new_run)
+    run_lengths = np.diff(np.append(run_starts, values.size))
+    run_segments = sorted_segments[run_starts]
+    segment_starts = np.cumsum(n_total) - n_total
+    midranks = run_starts - segment_starts[run_segments] + (run_lengths + 1) / 2.0
+    ranks = np.repeat(midranks, run_lengths)
+    n_segments = n_total.size
+    rank_sum1 = np.bincount(sorted_segments[sorted_group1], weights=ranks[sorted_group1], minlength=n_segments)
+    tied = run_lengths.astype(float)
+    tie_term = np.bincount(run_segments, weights=tied**3 - tied, minlength=n_segments)
+    return rank_sum1, tie_term, order
+
+
+def _exact_mann_whitney_pvalues(
+    values: np.ndarray,
+    order: np.ndarray,
+    in_group1: np.ndarray,
+    n1: np.ndarray,
+    n2: np.ndarray,
+    segments: np.ndarray,
+    alternative: Alternative,
+) -> np.ndarray:
+    # Small tie-free segments use the exact null distribution, as compare_independent_groups
+    # does. Segments sharing (n1, n2) are stacked into 2-D arrays and tested in one call.
+    from scipy.stats import mannwhitneyu
+
+    sorted_group1 = in_group1[order]
+    values1, values2 = values[order][sorted_group1], values[order][~sorted_group1]
+    starts1, starts2 = np.cumsum(n1) - n1, np.cumsum(n2) - n2
+    shapes, shape_codes = np.unique(np.stack([n1[segments], n2[segments]], axis=1), axis=0, return_inverse=True)
+    shape_codes = shape_codes.reshape(-1)
+    p_values = np.empty(segments.size)
+    for code, (size1, size2) in enumerate(shapes):
+        members = shape_codes == code
+        chosen = segments[members]
+        x = values1[starts1[chosen][:, None] + np.arange(size1)]
+        y = values2[starts2[chosen][:, None] + np.arange(size2)]
+        p_values[members] = mannwhitneyu(x, y, alternative=alternative, method="exact", axis=1).pvalue
+    return p_values
+
+
+def compare_by_group(
+    values: ArrayLike1D,
+    group_labels: Any,
+    segment_labels: Any,
+    *,
+    group1: Any = None,
+    estimand: ComparisonEstimand = "mean_difference",
+    method: Optional[str] = None,
+    alternative: Alternative = "two-sided",
+    confidence_level: float = 0.95,
+) -> GroupedComparisonResult:
+    """
+    Compare two groups within every segment of long-format data in one vectorised pass.
+
+    Parameters
+    ----------
+    values:
+        One observation per row.
+    group_labels:
+        Two distinct labels (e.g. a treatment flag), one per row.
+    segment_labels:
+        Segment of each row; one result entry is produced per distinct label, in sorted order.
+    group1:
+        The group label whose rows form group 1 (default: the first in sorted order, so
+        pass ``group1=True`` to put treated rows first for a boolean flag).
+    estimand, method:
+        As in ``compare_independent_groups``: 'mean_difference' with {'welch', 'student'}
+        (default 'welch'), or 'stochastic_dominance' with {'mannwhitney'}.
+
+    Notes
+    -----
+    The labels are sorted once and per-segment counts, means and variances come from
+    ``np.bincount`` reductions; for stochastic dominance one further sort by (segment,
+    value) gives every segment's midranks and tie correction, so the cost is
+    O(N log N) whatever the number of segments. Assumption diagnostics and bootstrap
+    intervals are not computed.
+    """
+    x = np.asarray(values, dtype=float)
+    groups = np.asarray(group_labels)
+    segment_array = np.asarray(segment_labels)
+    if x.ndim != 1:
+        raise ValueError(f"values must be one-dimensional, got shape={x.shape}.")
+    if groups.shape != x.shape or segment_array.shape != x.shape:
+        raise ValueError(
+            "values, group_labels and segment_labels must have the same length, "
+            f"got {x.size}, {groups.size} and {segment_array.size}."
+        )
+    if x.size == 0:
+        raise ValueError("values must not be empty.")
+    if np.isnan(x).any():
+        raise ValueError("values contain NaN values. Impute or remove them explicitly before analysis.")
+    if np.isinf(x).any():
+        raise ValueError("values contain infinite values.")
+    if estimand == "mean_difference":
+        test_method = (method or "welch").lower()
+        if test_method not in {"welch", "student"}:
+            raise ValueError("For estimand='mean_difference', method must be 'welch' or 'student'.")
+    elif estimand == "stochastic_dominance":
+        if (method or "mannwhitney").lower() != "mannwhitney":
+            raise ValueError("For estimand='stochastic_dominance', method must be 'mannwhitney'.")
+    else:
+        raise ValueError("estimand must be 'mean_difference' or 'stochastic_dominance'.")
+
+    group_levels, group_codes = np.unique(groups, return_inverse=True)
+    if group_levels.size != 2:
+        raise ValueError(f"group_labels must contain exactly two distinct labels, got {group_levels.size}.")
+    if group1 is None:
+        first = 0
+    else:
+        matches = np.flatnonzero(group_levels == group1)
+        if matches.size == 0:
+            raise ValueError(f"group1={group1!r} does not occur in group_labels.")
+        first = int(matches[0])
+    in_group1 = group_codes.reshape(-1) == first
+    segments, segment_codes = np.unique(segment_array, return_inverse=True)
+    segment_codes = segment_codes.reshape(-1)
+    n_segments = segments.size
+
+    # Cell 2s holds segment s of group 1 and cell 2s + 1 its group 2.
+    cells = 2 * segment_codes + (~in_group1)
+    counts = np.bincount(cells, minlength=2 * n_segments)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        means = np.bincount(cells, weights=x, minlength=2 * n_segments) / counts
+        deviations = x - means[cells]
+        variances = np.bincount(cells, weights=deviations * deviations, minlength=2 * n_segments) / (counts - 1)
+    n1, n2 = counts[0::2], counts[1::2]
+    mean1, mean2, var1, var2 = means[0::2], means[1::2], variances[0::2], variances[1::2]
+    valid = (n1 >= 2) & (n2 >= 2)
+
+    notes: list[str]
+    if estimand == "mean_difference":
+        batch = _batch_from_moments(
+            n1,
+            mean1,
+            var1,
+            n2,
+            mean2,
+            var2,
+            equal_var=test_method == "student",
+            alternative=alternative,
+            confidence_level=confidence_level,
+        )
+        method_label, effect_name = batch.method, "Hedges_g"
+        estimate, statistic, df = batch.estimate, batch.statistic, batch.df
+        p_value, ci_lower, ci_upper, effect = batch.p_value, batch.ci_lower, batch.ci_upper, batch.hedges_g
+        notes = [
+            batch.notes[0],
+            "Computed per segment from long-format data; assumption diagnostics are not computed. Segments with zero variance follow SciPy's conventions for the t statistic (infinite or NaN), and Hedges' g is NaN where the pooled SD is zero.",
+        ]
+    else:
+        rank_sum1, tie_term, order = _segment_ranks(x, segment_codes, in_group1, n1 + n2)
+        statistic = rank_sum1 - n1 * (n1 + 1) / 2.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            estimate = statistic / (n1 * n2)
+        p_value = np.asarray(_mann_whitney_normal_pvalue(statistic, n1, n2, tie_term, alternative), dtype=float)
+        exact = np.flatnonzero(valid & ((n1 <= 8) | (n2 <= 8)) & (tie_term == 0))
+        if exact.size:
+            p_value[exact] = _exact_mann_whitney_pvalues(x, order, in_group1, n1, n2, exact, alternative)
+        method_label, effect_name = "Mann_Whitney_U", "Cliffs_delta"
+        df = ci_lower = ci_upper = np.full(n_segments, math.nan)
+        effect = 2.0 * estimate - 1.0
+        notes = [
+            "Mann-Whitney U per segment: the exact null distribution for small tie-free segments, otherwise the tie-corrected normal approximation. The estimate is the probability of superiority, P(group1 > group2) + 0.5 P(tie), with Cliff's delta as the effect size. Bootstrap confidence intervals are not computed per segment (ci_lower and ci_upper are NaN); run compare_independent_groups on a segment of interest for one.",
+        ]
+
+    if not valid.all():
+        notes.append(
+            f"{int(np.count_nonzero(~valid))} segment(s) have fewer than 2 observations in a group; their statistics are NaN."
+        )
+
+    def masked(column: np.ndarray) -> np.ndarray:
+        return np.where(valid, column, math.nan)
+
+    return GroupedComparisonResult(
+        estimand=estimand,
+        method=method_label,
+        alternative=alternative,
+        confidence_level=confidence_level,
+        group1=group_levels[first],
+        group2=group_levels[1 - first],
+        effect_size_name=effect_name,
+        segments=segments,
+        n1=n1,
+        n2=n2,
+        mean1=masked(mean1),
+        mean2=masked(mean2),
+        sd1=masked(np.sqrt(var1)),
+        sd2=masked(np.sqrt(var2)),
+        estimate=masked(estimate),
+        statistic=masked(statistic),
+        df=masked(df),
+        p_value=masked(p_value),
+        ci_lower=masked(ci_lower),
+        ci_upper=masked(ci_upper),
+        effect_size=masked(effect),
+        notes=tuple(notes),
+    )
+
+
+@dataclass(frozen=True)
+class CorrelationMatrixResult:
+    """
+    Pairwise correlations between the columns of a data matrix.
+
+    In full mode every array is ``(p, p)``. In upper-triangle mode the arrays are
+    condensed to the ``p * (p - 1) / 2`` pairs ``i < j``, identified by ``row`` and ``col``.
+    """
+
+    method: CorrelationMethod
+    alternative: Alternative
+    confidence_level: float
+    n: int
+    coefficient: np.ndarray
+    p_value: np.ndarray
+    ci_lower: np.ndarray
+    ci_upper: np.ndarray
+    row: Optional[np.ndarray] = None
+    col: Optional[np.ndarray] = None
+    notes: tuple[str, ...] = ()
+
+    @property
+    def condensed(self) -> bool:
+        return self.row is not None
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            "method": self.method,
+            "alternative": self.alternative,
+            "confidence_level": self.confidence_level,
+            "n": self.n,
+            "coefficient": self.coefficient.tolist(),
+            "p_value": self.p_value.tolist(),
+            "ci_lower": self.ci_lower.tolist(),
+            "ci_upper": self.ci_upper.tolist(),
+        }
+        if self.row is not None and self.col is not None:
+            out["row"] = self.row.tolist()
+            out["col"] = self.col.tolist()
+        out["notes"] = list(self.notes)
+        return out
+
+
+def _standardized_columns(x: np.ndarray) -> np.ndarray:
+    # Centre and scale each column to unit norm so that Z.T @ Z is the correlation matrix.
+    centered = x - x.mean(axis=0)
+    norms = np.sqrt(np.einsum("ij,ij->j", centered, centered))
+    flat = np.flatnonzero(norms <= 1e-12 * np.maximum(1.0, np.abs(x).max(axis=0)))
+    if flat.size:
+        raise ValueError(f"column {int(flat[0])} has zero variance; the requested analysis is undefined.")
+    return centered / norms
+
+
+def _correlation_statistics(
+    r: np.ndarray, n: int, *, method: CorrelationMethod, alternative: Alternative, confidence_level: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    df = n - 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        statistic = r * np.sqrt(df / ((1.0 - r) * (1.0 + r)))
+    p_value = _t_test_pvalue(statistic, df, alternative)
+    if method == "pearson":
+        se = 1.0 / np.sqrt(n - 3)
+    else:
+        # Bonett-Wright standard error for Fisher-z intervals around Spearman's rho.
+        se = np.sqrt((1.0 + r * r / 2.0) / (n - 3))
+    lower, upper = _fisher_z_bounds(r, se, confidence_level, alternative)
+    return np.asarray(p_value, dtype=float), np.asarray(lower, dtype=float), np.asarray(upper, dtype=float)
+
+
+def correlation_matrix(
+    data: Any,
+    *,
+    method: CorrelationMethod = "pearson",
+    alternative: Alternative = "two-sided",
+    confidence_level: float = 0.95,
+    upper_triangle: bool = False,
+    block_size: Optional[int] = None,
+) -> CorrelationMatrixResult:
+    """
+    Correlate every pair of columns of ``data`` (observations x variables) at once.
+
+    Coefficients come from one matrix product of standardized columns (ranked once per
+    column for Spearman). P-values use the t distribution with n - 2 degrees of
+    freedom, matching ``correlation``. Intervals use the Fisher z transform: the
+    ``_pearson_ci`` interval for Pearson, and the Bonett-Wright standard error for
+    Spearman instead of the per-pair bootstrap used by ``correlation``.
+
+    ``upper_triangle=True`` returns only the pairs ``i < j`` in condensed arrays, and
+    ``block_size`` bounds temporaries to ``block_size x block_size`` column blocks.
+    """
+    x = np.asarray(data, dtype=float)
+    if x.ndim != 2:
+        raise ValueError(f"data must be two-dimensional (observations x variables), got shape={x.shape}.")
+    n, p = x.shape
+    if n < 4:
+        raise ValueError("Correlation matrices with Fisher z intervals require at least 4 observations.")
+    if p < 2:
+        raise ValueError("data must have at least 2 columns.")
+    if np.isnan(x).any():
+        raise ValueError("data contains NaN values. Impute or remove them explicitly before analysis.")
+    if np.isinf(x).any():
+        raise ValueError("data contains infinite values.")
+    if method not in {"pearson", "spearman"}:
+        raise ValueError("method must be 'pearson' or 'spearman'.")
+    if block_size is not None and block_size < 1:
+        raise ValueError("block_size must be a positive integer.")
+
+    if method == "spearman":
+        from scipy.stats import rankdata
+
+        x = rankdata(x, axis=0)
+    z = _standardized_columns(x)
+    step = block_size or p
+
+    rows: Optional[np.ndarray] = None
+    cols: Optional[np.ndarray] = None
+    if upper_triangle:
+        rows, cols = np.triu_indices(p, k=1)
+        out = [np.empty(rows.size) for _ in range(4)]
+    else:
+        out = [np.empty((p, p)) for _ in range(4)]
+
+    for start_i in range(0, p, step):
+        stop_i = min(p, start_i + step)
+        for start_j in range(start_i, p, step):
+            stop_j = min(p, start_j + step)
+            r = np.clip(z[:, start_i:stop_i].T @ z[:, start_j:stop_j], -1.0, 1.0)
+            if start_i == start_j:
+                # Self-correlations are exactly 1 regardless of rounding in the product.
+                np.fill_diagonal(r, 1.0)
+            p_value, lower, upper = _correlation_statistics(
+                r, n, method=method, alternative=alternative, confidence_level=confidence_level
+            )
+            blocks = (r, p_value, lower, upper)
+            if upper_triangle:
+                i_idx, j_idx = np.nonzero(np.arange(start_i, stop_i)[:, None] < np.arange(start_j, stop_j)[None, :])
+                gi = i_idx + start_i
+                gj = j_idx + start_j
+                position = gi * p - gi * (gi + 1) // 2 + (gj - gi - 1)
+                for target, block in zip(out, blocks):
+                    target[position] = block[i_idx, j_idx]
+            else:
+                for target, block in zip(out, blocks):
+                    target[start_i:stop_i, start_j:stop_j] = block
+                    target[start_j:stop_j, start_i:stop_i] = block.T
+
+    label = "Pearson" if method == "pearson" else "Spearman"
+    notes = [
+        f"{label} correlation matrix with t-based p-values and Fisher z confidence intervals"
+        + (" (Bonett-Wright standard error)." if method == "spearman" else "."),
+        "P-values are not adjusted for the number of pairs tested.",
+    ]
+    return CorrelationMatrixResult(
+        method=method,
+        alternative=alternative,
+        confidence_level=confidence_level,
+        n=int(n),
+        coefficient=out[0],
+        p_value=out[1],
+        ci_lower=out[2],
+        ci_upper=out[3],
+        row=rows,
+        col=cols,
+        notes=tuple(notes),
+    )
+
+
+__all__ = [
+    "CorrelationMatrixResult",
+    "GroupedComparisonResult",
+    "TwoGroupBatchResult",
+    "compare_by_group",
+    "compare_from_summary",
+    "compare_independent_groups_batch",
+    "correlation_matrix",
+]
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import os
+import json
+import zipfile
+from typing import IO, Any, Union, TextIO, Iterable, Iterator, Optional
+from pathlib import Path
+from itertools import islice, groupby
+
+import numpy as np
+
+from .tables import ResultKind, ResultTable, AnalysisResult, _result_from_dict
+from .version import __version__
+from .inferential_stats import CorrelationResult
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+# Bumped whenever the exported layout changes incompatibly; readers refuse newer files.
+# Schema 2 added the permutation summary of two-group results.
+SCHEMA_VERSION = 2
+_FORMAT = "stats4science.results"
+# Results are tabulated this many at a time while streaming, bounding memory use.
+_STREAM_BLOCK = 4096
+
+
+def _metadata(kind: Optional[ResultKind], **extra: Any) -> dict[str, Any]:
+    return {
+        "format": _FORMAT,
+        "schema_version": SCHEMA_VERSION,
+        "stats4science_version": __version__,
+        "kind": kind,
+        **extra,
+    }
+
+
+def _check_metadata(metadata: dict[str, Any], source: str) -> None:
+    if metadata.get("format") != _FORMAT:
+        raise ValueError(f"{source} is not a stats4science results export.")
+    if metadata["schema_version"] > SCHEMA_VERSION:
+        raise ValueError(
+            f"{source} uses export schema {metadata['schema_version']} (stats4science "
+            f"{metadata['stats4science_version']}); this version reads schema {SCHEMA_VERSION} or older."
+        )
+
+
+def _kind_of(result: AnalysisResult) -> ResultKind:
+    return "correlation" if isinstance(result, CorrelationResult) else "two_group"
+
+
+def _tables(results: Union[ResultTable, Iterable[AnalysisResult]]) -> Iterator[ResultTable]:
+    # Tabulate a stream of results block by block (runs of one kind per table), so
+    # encoding is columnar without holding the whole stream in memory.
+    if isinstance(results, ResultTable):
+        yield results
+        return
+    iterator = iter(results)
+    while block := list(islice(iterator, _STREAM_BLOCK)):
+        for kind, run in groupby(block, key=_kind_of):
+            yield ResultTable.from_results(run, kind=kind)
+
+
+def _json_default(value: Any) -> Any:
+    # NumPy scalars that slipped into a result (e.g. np.int64 counts) serialise as Python values.
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# ------------------------------
+# JSON Lines
+# ------------------------------
+
+
+def write_jsonl(
+    results: Union[ResultTable, Iterable[AnalysisResult]],
+    destination: Union[PathLike, TextIO],
+    *,
+    header: bool = True,
+) -> int:
+    """
+    Stream results to JSON Lines, one ``to_dict()`` record per line, and return the count.
+
+    ``results`` may be a ``ResultTable`` or any iterable (including a generator) of
+    ``TwoGroupComparisonResult``/``CorrelationResult``; iterables are consumed in blocks,
+    so memory stays bounded. With ``header`` the first line is a metadata record holding
+    the export schema version and the writing ``stats4science`` version. NaN values are
+    written as ``NaN``, as ``json.dumps`` does.
+    """
+    if isinstance(destination, (str, os.PathLike)):
+        with Path(destination).open("w", encoding="utf-8") as stream:
+            return write_jsonl(results, stream, header=header)
+    if header:
+        kind = results.kind if isinstance(results, ResultTable) else None
+        destination.write(json.dumps({"metadata": _metadata(kind)}) + "\n")
+    count = 0
+    encoder = json.JSONEncoder(default=_json_default, separators=(",", ":"))
+    for table in _tables(results):
+        for record in table.iter_dicts():
+            destination.write(encoder.encode(record) + "\n")
+            count += 1
+    return count
+
+
+def _tuples(record: dict[str, Any]) -> dict[str, Any]:
+    # JSON turns the notes tuples into lists; restore them so rows compare equal to results.
+    record["notes"] = tuple(record["notes"])
+    for key, value in record.items():
+        if key.endswith("_descriptives"):
+            value["notes"] = tuple(value["notes"])
+    return record
+
+
+def read_jsonl(source: Union[PathLike, IO[str]]) -> Iterator[AnalysisResult]:
+    """Lazily yield the results stored by ``write_jsonl``, one line at a time."""
+    if isinstance(source, (str, os.PathLike)):
+        with Path(source).open(encoding="utf-8") as stream:
+            yield from read_jsonl(stream)
+        return
+    for number, line in enumerate(source):
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        if number == 0 and "metadata" in record:
+            _check_metadata(record["metadata"], "JSON Lines input")
+            continue
+        kind: ResultKind = "two_group" if "estimand" in record else "correlation"
+        yield _result_from_dict(kind, _tuples(record))
+
+
+# ------------------------------
+# Columnar NPZ
+# ------------------------------
+
+_COLUMN_PREFIX = "columns/"
+
+
+def save_npz(results: Union[ResultTable, Iterable[AnalysisResult]], path: PathLike) -> None:
+    """
+    Write results as an uncompressed NPZ with one ``.npy`` member per column.
+
+    A ``metadata`` member holds the schema and package versions, the column order and
+    the interned string pools. Members are stored uncompressed so ``load_npz`` can
+    memory-map each column directly from the archive.
+    """
+    table = results if isinstance(results, ResultTable) else ResultTable.from_results(results)
+    names = list(table.data.dtype.names or ())
+    metadata = _metadata(
+        table.kind,
+        rows=len(table),
+        columns=names,
+        strings=list(table.strings),
+        note_sets=[list(notes) for notes in table.note_sets],
+    )
+    members = [("metadata", np.array(json.dumps(metadata)))]
+    members += [(_COLUMN_PREFIX + name, np.ascontiguousarray(table.data[name])) for name in names]
+    # Written like np.savez, but column by column and explicitly stored (not deflated).
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED, allowZip64=True) as archive:
+        for member, array in members:
+            with archive.open(f"{member}.npy", "w", force_zip64=True) as stream:
+                np.lib.format.write_array(stream, array, allow_pickle=False)
+
+
+def _member_array(path: Path, archive: zipfile.ZipFile, member: str, mmap: bool) -> np.ndarray:
+    info = archive.getinfo(member)
+    if not mmap or info.compress_type != zipfile.ZIP_STORED:
+        with archive.open(member) as stream:
+            return np.lib.format.read_array(stream, allow_pickle=False)
+    with path.open("rb") as stream:
+        # Skip the zip local file header (30 fixed bytes, then the name and extra field).
+        stream.seek(info.header_offset)
+        local_header = stream.read(30)
+        name_length = int.from_bytes(local_header[26:28], "little")
+        extra_length = int.from_bytes(local_header[28:30], "little")
+        stream.seek(info.header_offset + 30 + name_length + extra_length)
+        version = np.lib.format.read_magic(stream)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(stream)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(stream)
+        offset = stream.tell()
+    if 0 in shape:
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=shape, order="F" if fortran_order else "C")
+
+
+class ResultFile:
+    """
+    Lazy reader for an NPZ written by ``save_npz``.
+
+    Only the metadata is read on opening. ``column`` memory-maps a single column from
+    the archive (nothing is copied until pages are touched), integer indexing decodes
+    one row into its result dataclass, and ``table`` assembles a ``ResultTable`` for a
+    range of rows.
+    """
+
+    def __init__(self, path: PathLike, *, mmap: bool = True) -> None:
+        self.path = Path(path)
+        self._mmap = mmap
+        self._columns: dict[str, np.ndarray] = {}
+        with zipfile.ZipFile(self.path) as archive, archive.open("metadata.npy") as stream:
+            metadata = json.loads(str(np.lib.format.read_array(stream, allow_pickle=False)))
+        _check_metadata(metadata, str(self.path))
+        self.metadata: dict[str, Any] = metadata
+        self.kind: ResultKind = metadata["kind"]
+        self.column_names: tuple[str, ...] = tuple(metadata["columns"])
+        self.strings: tuple[str, ...] = tuple(metadata["strings"])
+        self.note_sets: tuple[tuple[str, ...], ...] = tuple(tuple(notes) for notes in metadata["note_sets"])
+
+    def __len__(self) -> int:
+        return int(self.metadata["rows"])
+
+    def __repr__(self) -> str:
+        return f"ResultFile({str(self.path)!r}, kind={self.kind!r}, rows={len(self)})"
+
+    def column(self, name: str, *, decode: bool = False) -> Any:
+        if name not in self.column_names:
+            raise KeyError(name)
+        if name not in self._columns:
+            with zipfile.ZipFile(self.path) as archive:
+                self._columns[name] = _member_array(self.path, archive, f"{_COLUMN_PREFIX}{name}.npy", self._mmap)
+        values = self._columns[name]
+        if not decode or values.dtype != np.int32:
+            return values
+        pool: tuple[Any, ...] = self.note_sets if name.endswith("notes") else self.strings
+        return [None if code < 0 else pool[code] for code in values.tolist()]
+
+    def table(self, rows: slice = slice(None)) -> ResultTable:
+        """Copy the selected rows of every column into a ``ResultTable``."""
+        columns = [(name, self.column(name)[rows]) for name in self.column_names]
+        size = len(columns[0][1]) if columns else 0
+        data = np.empty(size, dtype=[(name, values.dtype) for name, values in columns])
+        for name, values in columns:
+            data[name] = values
+        return ResultTable(kind=self.kind, data=data, strings=self.strings, note_sets=self.note_sets)
+
+    def __getitem__(self, index: int) -> AnalysisResult:
+        position = range(len(self))[index]
+        return self.table(slice(position, position + 1))[0]
+
+    def __iter__(self) -> Iterator[AnalysisResult]:
+        for start in range(0, len(self), _STREAM_BLOCK):
+            yield from self.table(slice(start, start + _STREAM_BLOCK))
+
+
+def load_npz(path: PathLike, *, mmap: bool = True) -> ResultFile:
+    """Open an NPZ written by ``save_npz`` for lazy, column-wise reading."""
+    return ResultFile(path, mmap=mmap)
+
+
+__all__ = ["ResultFile", "SCHEMA_VERSION", "load_npz", "read_jsonl", "save_npz", "write_jsonl"]
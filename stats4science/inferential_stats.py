@@ -1,28 +1,24 @@
 from __future__ import annotations
 
 import math
-import warnings
-from typing import Any, Literal, Callable, Optional, Sequence
+from typing import Any, Literal, Mapping, Callable, Optional, Sequence
+from functools import cached_property
 from dataclasses import asdict, dataclass
 
 import numpy as np
-from scipy.stats import (
-    ConstantInputWarning,
-    t,
-    norm,
-    levene,
-    shapiro,
-    anderson,
-    kurtosis,
-    pearsonr,
-    spearmanr,
-    mannwhitneyu,
-)
+
+from ._kernels import norm_sf, pearson, norm_cdf, norm_ppf, t_pvalue, t_critical, z_critical, brown_forsythe
+from ._parallel import ChunkKernel, ParallelBackend, map_chunks, resolve_n_jobs
+from .profiling import _stage, _profiled, _record_sizes
 
 ArrayLike1D = Sequence[float] | np.ndarray
 Alternative = Literal["two-sided", "less", "greater"]
 CorrelationMethod = Literal["pearson", "spearman"]
 ComparisonEstimand = Literal["mean_difference", "stochastic_dominance"]
+BootstrapCIMethod = Literal["percentile", "basic", "bca", "studentized"]
+PAdjustMethod = Literal["bonferroni", "holm", "bh", "by"]
+DiagnosticsPolicy = Literal["eager", "lazy", "off"]
+RandomState = int | np.random.Generator | None
 
 
 @dataclass(frozen=True)
@@ -53,6 +49,52 @@ class AssumptionCheck:
         return asdict(self)
 
 
+class _LazyAssumptions(Sequence[AssumptionCheck]):
+    """
+    Tuple-like container whose diagnostics run on first use and are then cached.
+
+    Pickling stores the computed checks as a plain tuple.
+    """
+
+    def __init__(self, compute: Callable[[], tuple[AssumptionCheck, ...]]) -> None:
+        self._compute: Optional[Callable[[], tuple[AssumptionCheck, ...]]] = compute
+        self._checks: Optional[tuple[AssumptionCheck, ...]] = None
+
+    @property
+    def evaluated(self) -> bool:
+        return self._checks is not None
+
+    def _materialize(self) -> tuple[AssumptionCheck, ...]:
+        if self._checks is None:
+            assert self._compute is not None
+            self._checks = self._compute()
+            # Drop the closure so the raw samples it captured can be freed.
+            self._compute = None
+        return self._checks
+
+    def __getitem__(self, index: Any) -> Any:
+        return self._materialize()[index]
+
+    def __len__(self) -> int:
+        return len(self._materialize())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (tuple, _LazyAssumptions)):
+            return self._materialize() == tuple(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._materialize())
+
+    def __repr__(self) -> str:
+        if self._checks is None:
+            return "_LazyAssumptions(<not evaluated>)"
+        return repr(self._checks)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (tuple, (self._materialize(),))
+
+
 @dataclass(frozen=True)
 class ConfidenceInterval:
     level: float
@@ -63,6 +105,25 @@ class ConfidenceInterval:
         return asdict(self)
 
 
+@dataclass(frozen=True)
+class PermutationSummary:
+    """
+    How a permutation p-value was obtained.
+
+    ``n_resamples`` relabellings were enumerated (``exact``) or drawn at random;
+    ``mc_error`` is the Monte Carlo standard error of the p-value (0 when exact) and
+    ``stopped_early`` whether sampling stopped before the configured maximum.
+    """
+
+    n_resamples: int
+    exact: bool
+    mc_error: float
+    stopped_early: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
 @dataclass(frozen=True)
 class EffectSize:
     name: str
@@ -90,8 +151,11 @@ class TwoGroupComparisonResult:
     group1_descriptives: DescriptiveStats
     group2_descriptives: DescriptiveStats
     df: Optional[float] = None
-    assumptions: tuple[AssumptionCheck, ...] = ()
+    assumptions: Sequence[AssumptionCheck] = ()
     notes: tuple[str, ...] = ()
+    adjusted_p_value: Optional[float] = None
+    p_adjustment: Optional[str] = None
+    permutation: Optional[PermutationSummary] = None
 
     def to_dict(self) -> dict[str, Any]:
         out = asdict(self)
@@ -100,6 +164,8 @@ class TwoGroupComparisonResult:
             out["ci"] = self.ci.to_dict()
         if self.effect_size is not None:
             out["effect_size"] = self.effect_size.to_dict()
+        if self.permutation is not None:
+            out["permutation"] = self.permutation.to_dict()
         out["group1_descriptives"] = self.group1_descriptives.to_dict()
         out["group2_descriptives"] = self.group2_descriptives.to_dict()
         return out
@@ -115,6 +181,8 @@ class TwoGroupComparisonResult:
         if self.df is not None:
             parts.append(f"df={self.df:.{digits}f}")
         parts.append(f"p={p}")
+        if self.adjusted_p_value is not None:
+            parts.append(f"p_{self.p_adjustment}={self.adjusted_p_value:.{digits}g}")
         if self.ci is not None:
             parts.append(f"{int(self.ci.level * 100)}% CI [{self.ci.lower:.{digits}f}, {self.ci.upper:.{digits}f}]")
         if self.effect_size is not None:
@@ -136,6 +204,8 @@ class CorrelationResult:
     y_descriptives: DescriptiveStats
     assumptions: tuple[AssumptionCheck, ...] = ()
     notes: tuple[str, ...] = ()
+    adjusted_p_value: Optional[float] = None
+    p_adjustment: Optional[str] = None
 
     def to_dict(self) -> dict[str, Any]:
         out = asdict(self)
@@ -149,7 +219,10 @@ class CorrelationResult:
     def summary(self, digits: int = 3) -> str:
         p = f"{self.p_value:.{digits}g}"
         r = f"{self.coefficient:.{digits}f}"
-        parts = [f"{self.method} correlation: r={r}", f"p={p}", f"n={self.n}"]
+        parts = [f"{self.method} correlation: r={r}", f"p={p}"]
+        if self.adjusted_p_value is not None:
+            parts.append(f"p_{self.p_adjustment}={self.adjusted_p_value:.{digits}g}")
+        parts.append(f"n={self.n}")
         if self.ci is not None:
             parts.append(f"{int(self.ci.level * 100)}% CI [{self.ci.lower:.{digits}f}, {self.ci.upper:.{digits}f}]")
         parts.append(f"x_mean={self.x_descriptives.mean:.{digits}f}")
@@ -157,6 +230,80 @@ class CorrelationResult:
         return "; ".join(parts)
 
 
+P_ADJUSTMENT_LABELS: dict[str, str] = {
+    "bonferroni": "Bonferroni",
+    "holm": "Holm",
+    "bh": "Benjamini-Hochberg",
+    "by": "Benjamini-Yekutieli",
+}
+
+_BOOTSTRAP_CI_LABELS: dict[str, str] = {
+    "percentile": "percentile",
+    "basic": "basic",
+    "bca": "bias-corrected and accelerated (BCa)",
+    "studentized": "studentized (bootstrap-t)",
+}
+
+
+@dataclass(frozen=True)
+class BootstrapConfig:
+    """
+    Resampling settings for bootstrap confidence intervals.
+
+    Parameters
+    ----------
+    n_resamples:
+        Number of bootstrap resamples (the maximum when ``adaptive`` is set).
+    random_state:
+        Seed or ``np.random.Generator``; ``None`` draws fresh entropy.
+    ci_method:
+        {'percentile', 'basic', 'bca', 'studentized'}; default is 'percentile'. 'bca' takes
+        its acceleration from closed-form leave-one-out estimates; 'studentized' pivots
+        each resample on its own standard error (DeLong placement variances for the
+        probability of superiority, the Bonett-Wright Fisher-z SE for Spearman's rho).
+    adaptive:
+        Stop early once the Monte Carlo standard error of every interval limit is at
+        most ``tolerance`` (on the scale of the estimand), after at least ``min_resamples``.
+    chunk_size:
+        Resamples evaluated per vectorised step; by default at most 250, capped by a fixed
+        memory budget. Each chunk has its own seed stream, so results depend on the chunk
+        size but not on ``n_jobs`` or ``backend``.
+    n_jobs:
+        Number of workers evaluating chunks; ``-1`` uses every available core.
+    backend:
+        {'thread', 'process'}; the process backend shares the inputs through shared memory.
+    """
+
+    n_resamples: int = 5000
+    random_state: RandomState = 0
+    ci_method: BootstrapCIMethod = "percentile"
+    adaptive: bool = False
+    tolerance: float = 0.002
+    min_resamples: int = 1000
+    chunk_size: Optional[int] = None
+    n_jobs: int = 1
+    backend: ParallelBackend = "thread"
+
+    def __post_init__(self) -> None:
+        if self.n_resamples < 1:
+            raise ValueError("n_resamples must be a positive integer.")
+        if self.ci_method not in _BOOTSTRAP_CI_LABELS:
+            raise ValueError("ci_method must be 'percentile', 'basic', 'bca' or 'studentized'.")
+        if self.tolerance <= 0:
+            raise ValueError("tolerance must be positive.")
+        if self.min_resamples < 1:
+            raise ValueError("min_resamples must be a positive integer.")
+        if self.chunk_size is not None and self.chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+        resolve_n_jobs(self.n_jobs)
+        if self.backend not in {"thread", "process"}:
+            raise ValueError("backend must be 'thread' or 'process'.")
+
+    @property
+    def ci_label(self) -> str:
+        return _BOOTSTRAP_CI_LABELS[self.ci_method]
+
+
 # ------------------------------
 # Validation and descriptives
 # ------------------------------
@@ -175,33 +322,118 @@ def _as_1d_float_array(data: ArrayLike1D, *, name: str = "data", allow_nan: bool
     return x
 
 
-def _require_variation(x: np.ndarray, *, name: str) -> None:
-    if np.allclose(x, x[0]):
+def _require_range(minimum: float, maximum: float, *, name: str) -> None:
+    # Judged on the range alone, so streamed data (which keeps only its extremes) and
+    # in-memory arrays are held to the same rule.
+    if np.isclose(maximum, minimum):
         raise ValueError(f"{name} has zero variance; the requested analysis is undefined.")
 
 
+def _require_variation(x: np.ndarray, *, name: str) -> None:
+    _require_range(float(np.min(x)), float(np.max(x)), name=name)
+
+
+class _Sample:
+    """
+    A validated 1-D sample whose moments and orderings are computed at most once.
+
+    Analysis entry points build one per input and hand it to the helpers below, so
+    each array is validated once and the mean, variance, sort and ranks are shared
+    by the descriptives, test statistic, interval and effect size of a single call.
+    """
+
+    def __init__(self, data: ArrayLike1D, *, name: str) -> None:
+        self.name = name
+        self.values = _as_1d_float_array(data, name=name)
+
+    @property
+    def n(self) -> int:
+        return int(self.values.size)
+
+    @cached_property
+    def mean(self) -> float:
+        return float(np.mean(self.values))
+
+    @cached_property
+    def _central_sums(self) -> tuple[float, float]:
+        d = self.values - self.mean
+        d2 = d * d
+        return float(np.sum(d2)), float(np.sum(d2 * d2))
+
+    @property
+    def var(self) -> float:
+        return self._central_sums[0] / (self.n - 1)
+
+    @property
+    def sd(self) -> float:
+        return math.sqrt(self.var)
+
+    @cached_property
+    def sorted(self) -> np.ndarray:
+        return np.sort(self.values)
+
+    @property
+    def median(self) -> float:
+        ordered, mid = self.sorted, self.n // 2
+        if self.n % 2:
+            return float(ordered[mid])
+        return float((ordered[mid - 1] + ordered[mid]) / 2.0)
+
+    @cached_property
+    def codes(self) -> tuple[np.ndarray, int]:
+        # Dense codes of the distinct values (equal codes are ties) and the number of levels.
+        levels, inverse = np.unique(self.values, return_inverse=True)
+        return inverse, int(levels.size)
+
+    @cached_property
+    def ranks(self) -> np.ndarray:
+        # Average ranks of ties, as scipy.stats.rankdata(method="average").
+        codes, n_levels = self.codes
+        counts = np.bincount(codes, minlength=n_levels)
+        return (np.cumsum(counts) - (counts - 1) / 2.0)[codes]
+
+
+_KURTOSIS_UNDEFINED_NOTE = (
+    "Kurtosis is undefined or numerically unstable for constant/nearly-constant data; returning NaN."
+)
+
+
+def _is_near_constant(ptp: float, mean: float) -> bool:
+    return ptp <= 1e-12 * max(1.0, abs(mean))
+
+
+def _kurtosis_from_sums(n: int, m2: float, m4: float) -> float:
+    # Fisher kurtosis from central moment sums with the small-sample correction of
+    # scipy.stats.kurtosis(bias=False), which is applied only for n > 3.
+    ratio = n * m4 / (m2 * m2)
+    if n > 3:
+        return ((n * n - 1.0) * ratio - 3.0 * (n - 1.0) ** 2) / ((n - 2.0) * (n - 3.0))
+    return ratio - 3.0
+
+
 def describe(data: ArrayLike1D) -> DescriptiveStats:
-    x = _as_1d_float_array(data, name="data")
-    if x.size < 2:
+    return _describe_sample(_Sample(data, name="data"))
+
+
+def _describe_sample(sample: _Sample) -> DescriptiveStats:
+    if sample.n < 2:
         raise ValueError("At least 2 observations are required for descriptive statistics with sample SD.")
     notes: list[str] = []
-    # SciPy's kurtosis is numerically unstable for constant or nearly constant arrays.
-    # We avoid surfacing SciPy warnings by returning NaN with an explicit note instead.
-    ptp = float(np.ptp(x))
-    scale = max(1.0, float(abs(np.mean(x))))
-    near_constant_tol = 1e-12 * scale
-    if ptp <= near_constant_tol:
+    minimum, maximum = float(sample.sorted[0]), float(sample.sorted[-1])
+    # Kurtosis is numerically unstable for constant or nearly constant arrays.
+    # We avoid meaningless values by returning NaN with an explicit note instead.
+    if _is_near_constant(maximum - minimum, sample.mean):
         kurt = float("nan")
-        notes.append("Kurtosis is undefined or numerically unstable for constant/nearly-constant data; returning NaN.")
+        notes.append(_KURTOSIS_UNDEFINED_NOTE)
     else:
-        kurt = float(kurtosis(x, fisher=True, bias=False, nan_policy="raise"))
+        kurt = _kurtosis_from_sums(sample.n, *sample._central_sums)
     return DescriptiveStats(
-        n=int(x.size),
-        mean=float(np.mean(x)),
-        sd=float(np.std(x, ddof=1)),
-        median=float(np.median(x)),
-        minimum=float(np.min(x)),
-        maximum=float(np.max(x)),
+        n=sample.n,
+        mean=sample.mean,
+        sd=sample.sd,
+        median=sample.median,
+        minimum=minimum,
+        maximum=maximum,
         kurtosis_fisher=kurt,
         notes=tuple(notes),
     )
@@ -213,10 +445,16 @@ def describe(data: ArrayLike1D) -> DescriptiveStats:
 
 
 def shapiro_normality(data: ArrayLike1D, alpha: float = 0.05) -> AssumptionCheck:
-    x = _as_1d_float_array(data, name="data")
+    return _shapiro_normality(_Sample(data, name="data"), alpha)
+
+
+def _shapiro_normality(sample: _Sample, alpha: float) -> AssumptionCheck:
+    x = sample.values
     n = x.size
     if n < 3:
         raise ValueError(f"Shapiro-Wilk requires at least 3 observations, got {n}.")
+    from scipy.stats import shapiro
+
     statistic, p_value = shapiro(x)
     note = (
         "Diagnostic only: normality tests should not be the sole gatekeeper for parametric inference. "
@@ -241,9 +479,14 @@ def equal_variance_check(
     alpha: float = 0.05,
     center: Literal["mean", "median"] = "median",
 ) -> AssumptionCheck:
-    x = _as_1d_float_array(group1, name="group1")
-    y = _as_1d_float_array(group2, name="group2")
-    statistic, p_value = levene(x, y, center=center)
+    return _equal_variance_check(_Sample(group1, name="group1"), _Sample(group2, name="group2"), alpha, center)
+
+
+def _equal_variance_check(
+    group1: _Sample, group2: _Sample, alpha: float, center: Literal["mean", "median"]
+) -> AssumptionCheck:
+    centers = (group1.median, group2.median) if center == "median" else (group1.mean, group2.mean)
+    statistic, p_value = brown_forsythe((group1.values, group2.values), centers)
     note = (
         f"Levene/Brown-Forsythe test with center='{center}'. "
         "Use as a diagnostic; Welch's t-test is typically preferred when comparing means because it does not assume equal variances."
@@ -259,6 +502,8 @@ def equal_variance_check(
 
 
 def anderson_darling_candidates(data: ArrayLike1D) -> list[str]:
+    from scipy.stats import anderson
+
     x = _as_1d_float_array(data, name="data")
     dists = ["norm", "expon", "logistic", "gumbel_l", "gumbel_r"]
     accepted: list[str] = []
@@ -296,22 +541,34 @@ def interpret_hedges_g(value: float) -> str:
     return "huge"
 
 
+# The moment helpers below accept floats or equally shaped NumPy arrays, so the
+# single-call and batched analyses share one set of formulas.
+
+
+def _pooled_variance(var1: Any, n1: Any, var2: Any, n2: Any) -> Any:
+    return ((n1 - 1) * var1 + (n2 - 1) * var2) / (n1 + n2 - 2)
+
+
+def _hedges_correction(n1: Any, n2: Any) -> Any:
+    return 1.0 - (3.0 / (4.0 * (n1 + n2) - 9.0))
+
+
 def hedges_g(group1: ArrayLike1D, group2: ArrayLike1D) -> EffectSize:
-    x = _as_1d_float_array(group1, name="group1")
-    y = _as_1d_float_array(group2, name="group2")
-    if x.size < 2 or y.size < 2:
+    x = _Sample(group1, name="group1")
+    y = _Sample(group2, name="group2")
+    if x.n < 2 or y.n < 2:
         raise ValueError("Hedges' g requires at least 2 observations per group.")
 
-    s1 = np.var(x, ddof=1)
-    s2 = np.var(y, ddof=1)
-    pooled = math.sqrt(((x.size - 1) * s1 + (y.size - 1) * s2) / (x.size + y.size - 2))
+    return _hedges_g_from_moments(x.mean - y.mean, x.var, x.n, y.var, y.n)
+
+
+def _hedges_g_from_moments(mean_diff: float, var1: float, n1: int, var2: float, n2: int) -> EffectSize:
+    pooled = math.sqrt(_pooled_variance(var1, n1, var2, n2))
     if pooled == 0:
         raise ValueError("Hedges' g is undefined because the pooled standard deviation is zero.")
 
-    d = (np.mean(x) - np.mean(y)) / pooled
-    correction = 1.0 - (3.0 / (4.0 * (x.size + y.size) - 9.0))
-    g = correction * d
-    return EffectSize(name="Hedges_g", value=float(g), interpretation=interpret_hedges_g(float(g)))
+    g = float(_hedges_correction(n1, n2) * mean_diff / pooled)
+    return EffectSize(name="Hedges_g", value=g, interpretation=interpret_hedges_g(g))
 
 
 def _interpret_cliffs_delta(delta: float) -> str:
@@ -325,94 +582,697 @@ def _interpret_cliffs_delta(delta: float) -> str:
     return "large"
 
 
+def _superiority_counts(x: np.ndarray, y: np.ndarray, *, y_sorted: Optional[np.ndarray] = None) -> tuple[int, int]:
+    # Counting wins and ties against the sorted second group avoids materialising
+    # the n*m difference matrix: O((n + m) log m) time and O(n + m) memory.
+    if y_sorted is None:
+        y_sorted = np.sort(y)
+    below = np.searchsorted(y_sorted, x, side="left")
+    not_above = np.searchsorted(y_sorted, x, side="right")
+    wins = int(np.sum(below, dtype=np.int64))
+    ties = int(np.sum(not_above - below, dtype=np.int64))
+    return wins, ties
+
+
 def _probability_of_superiority_from_arrays(x: np.ndarray, y: np.ndarray) -> float:
-    diffs = x[:, None] - y[None, :]
-    wins = np.sum(diffs > 0)
-    ties = np.sum(diffs == 0)
-    return float(wins + 0.5 * ties) / float(diffs.size)
+    wins, ties = _superiority_counts(x, y)
+    return float(wins + 0.5 * ties) / float(x.size * y.size)
 
 
-def _probability_of_superiority_ci(
-    x: np.ndarray,
-    y: np.ndarray,
+def cliffs_delta(group1: ArrayLike1D, group2: ArrayLike1D) -> EffectSize:
+    x = _as_1d_float_array(group1, name="group1")
+    y = _as_1d_float_array(group2, name="group2")
+    return _cliffs_delta_from_superiority(_probability_of_superiority_from_arrays(x, y))
+
+
+def _cliffs_delta_from_superiority(superiority: float) -> EffectSize:
+    delta = 2.0 * superiority - 1.0
+    return EffectSize(name="Cliffs_delta", value=delta, interpretation=_interpret_cliffs_delta(delta))
+
+
+# ------------------------------
+# Bootstrap machinery
+# ------------------------------
+
+# Upper bound on the number of index/count cells materialised per vectorised bootstrap
+# chunk (~32 MB of int64), used when no explicit chunk size is requested.
+_BOOTSTRAP_CHUNK_CELLS = 1 << 22
+# Default resamples per chunk: small enough that the default 5000 resamples split into
+# 20 independently seeded chunks that parallel workers can share.
+_BOOTSTRAP_MAX_CHUNK = 250
+# A studentized interval falls back to the percentile interval of the same resamples
+# when more than this share of its pivots is degenerate.
+_STUDENTIZED_MAX_DROPPED = 0.5
+
+
+@dataclass(frozen=True)
+class _BootstrapRun:
+    ci: ConfidenceInterval
+    n_resamples: int
+    # Resamples left out of the interval: non-finite estimates, or degenerate pivots
+    # when ``pivots`` is set.
+    n_nonfinite: int
+    pivots: bool = False
+    note: Optional[str] = None
+
+
+def _bootstrap_chunk_sizes(n_resamples: int, cells_per_resample: int, chunk_size: Optional[int]) -> list[int]:
+    if chunk_size is None:
+        chunk_size = max(1, min(_BOOTSTRAP_MAX_CHUNK, _BOOTSTRAP_CHUNK_CELLS // max(1, cells_per_resample)))
+    full, rest = divmod(n_resamples, chunk_size)
+    return [chunk_size] * full + ([rest] if rest else [])
+
+
+def _chunk_generator_factory(random_state: RandomState) -> Callable[[], np.random.Generator]:
+    # Each chunk draws from its own child stream, spawned in order, so the estimates depend
+    # only on random_state and the chunk layout, never on how many chunks end up evaluated
+    # or on which worker evaluates them.
+    if isinstance(random_state, np.random.Generator):
+        return lambda: random_state.spawn(1)[0]
+    seed_sequence = np.random.SeedSequence(random_state)
+    return lambda: np.random.default_rng(seed_sequence.spawn(1)[0])
+
+
+def _quantile_mc_error(estimates: np.ndarray, p: float) -> float:
+    # Distribution-free Monte Carlo standard error of a sample quantile: half the spread
+    # between the quantiles one binomial standard deviation either side of p.
+    s = math.sqrt(p * (1.0 - p) / estimates.size)
+    lo, hi = np.quantile(estimates, [max(p - s, 0.0), min(p + s, 1.0)])
+    return float(hi - lo) / 2.0
+
+
+def _bca_acceleration(jackknife: Sequence[np.ndarray]) -> float:
+    # Multi-sample jackknife acceleration (Efron & Tibshirani), one array of
+    # leave-one-out estimates per independent sample.
+    num = 0.0
+    den = 0.0
+    for theta_i in jackknife:
+        theta_i = theta_i[np.isfinite(theta_i)]
+        n = theta_i.size
+        if n < 2:
+            continue
+        u = (n - 1) * (np.mean(theta_i) - theta_i)
+        num += float(np.sum(u**3)) / n**3
+        den += float(np.sum(u**2)) / n**2
+    if den <= 0.0:
+        return 0.0
+    return num / (6.0 * den**1.5)
+
+
+@dataclass(frozen=True)
+class _Studentization:
+    """
+    Bootstrap-t pivot for ``ci_method='studentized'``.
+
+    In this mode a chunk kernel returns ``(size, 2)`` rows of (estimate, standard error),
+    the error being on the scale of ``transform``; the pivot is
+    ``(transform(theta*) - transform(theta)) / se*`` and ``inverse`` maps the limits back.
+    """
+
+    standard_error: float
+    transform: Callable[[Any], Any] = np.asarray
+    inverse: Callable[[Any], Any] = np.asarray
+
+
+def _interval_quantile_levels(
+    estimates: np.ndarray,
     *,
+    estimate: float,
+    acceleration: float,
+    ci_method: BootstrapCIMethod,
     confidence_level: float,
     alternative: Alternative,
-    n_resamples: int = 5000,
-    random_state: int = 0,
-) -> ConfidenceInterval:
-    rng = np.random.default_rng(random_state)
-    nx = x.size
-    ny = y.size
-    estimates = np.empty(n_resamples, dtype=float)
-
-    for i in range(n_resamples):
-        xb = x[rng.integers(nx, size=nx)]
-        yb = y[rng.integers(ny, size=ny)]
-        estimates[i] = _probability_of_superiority_from_arrays(xb, yb)
-
+) -> tuple[Optional[float], Optional[float]]:
+    # Bootstrap-distribution quantiles that form the lower and upper limits; None means the
+    # limit is the natural bound of the estimand (one-sided alternatives).
     alpha = 1.0 - confidence_level
     if alternative == "two-sided":
-        lower, upper = np.quantile(estimates, [alpha / 2.0, 1.0 - alpha / 2.0])
+        lo_p, hi_p = alpha / 2.0, 1.0 - alpha / 2.0
     elif alternative == "greater":
-        lower = float(np.quantile(estimates, alpha))
-        upper = 1.0
+        lo_p, hi_p = alpha, None
     else:
-        lower = 0.0
-        upper = float(np.quantile(estimates, 1.0 - alpha))
+        lo_p, hi_p = None, 1.0 - alpha
 
-    return ConfidenceInterval(level=confidence_level, lower=float(lower), upper=float(upper))
+    if ci_method in ("basic", "studentized"):
+        # Both reflect the opposite quantile (of the estimates or of the pivots) around the point estimate.
+        return (None if lo_p is None else 1.0 - lo_p), (None if hi_p is None else 1.0 - hi_p)
+    if ci_method == "bca":
+        b = estimates.size
+        below = (np.count_nonzero(estimates < estimate) + 0.5 * np.count_nonzero(estimates == estimate)) / b
+        z0 = float(norm_ppf(min(max(below, 0.5 / b), 1.0 - 0.5 / b)))
 
+        def adjust(p: float) -> float:
+            z = z0 + float(norm_ppf(p))
+            return float(norm_cdf(z0 + z / (1.0 - acceleration * z)))
 
-def _bootstrap_correlation_ci(
-    x: np.ndarray,
-    y: np.ndarray,
+        return (None if lo_p is None else adjust(lo_p)), (None if hi_p is None else adjust(hi_p))
+    return lo_p, hi_p
+
+
+def _interval_from_estimates(
+    estimates: np.ndarray,
+    *,
+    estimate: float,
+    levels: tuple[Optional[float], Optional[float]],
+    ci_method: BootstrapCIMethod,
+    confidence_level: float,
+    bounds: tuple[float, float],
+    studentization: Optional[_Studentization] = None,
+) -> ConfidenceInterval:
+    lo_p, hi_p = levels
+    lower = bounds[0] if lo_p is None else float(np.quantile(estimates, lo_p))
+    upper = bounds[1] if hi_p is None else float(np.quantile(estimates, hi_p))
+    if studentization is not None:
+        # Here the draws are pivots: theta - q * se on the transformed scale.
+        centre, se = float(studentization.transform(estimate)), studentization.standard_error
+        if lo_p is not None:
+            lower = float(np.clip(studentization.inverse(centre - lower * se), *bounds))
+        if hi_p is not None:
+            upper = float(np.clip(studentization.inverse(centre - upper * se), *bounds))
+    elif ci_method == "basic":
+        lower = bounds[0] if lo_p is None else float(np.clip(2.0 * estimate - lower, *bounds))
+        upper = bounds[1] if hi_p is None else float(np.clip(2.0 * estimate - upper, *bounds))
+    return ConfidenceInterval(level=confidence_level, lower=lower, upper=upper)
+
+
+def _bootstrap_draws(
+    blocks: list[np.ndarray],
+    estimate: float,
+    studentization: Optional[_Studentization],
+    bounds: tuple[float, float],
+) -> np.ndarray:
+    # The bootstrap distribution the interval is read from: the estimates themselves, or
+    # the studentized pivots when the kernel also returned per-resample standard errors.
+    # A resample at the boundary of the estimand or with zero standard error has no
+    # usable pivot and is marked NaN, so it is dropped and counted like a non-finite one.
+    draws = np.concatenate(blocks)
+    if studentization is None:
+        return draws
+    theta, se = draws[:, 0], draws[:, 1]
+    centre = studentization.transform(estimate)
+    degenerate = (theta <= bounds[0]) | (theta >= bounds[1]) | ~(se > 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(degenerate, np.nan, (studentization.transform(theta) - centre) / se)
+
+
+def _run_bootstrap(
+    kernel: ChunkKernel,
+    arrays: dict[str, np.ndarray],
+    params: tuple[Any, ...],
     *,
+    estimate: float,
+    jackknife_fn: Callable[[], Sequence[np.ndarray]],
+    config: BootstrapConfig,
     confidence_level: float,
     alternative: Alternative,
-    statistic_fn: Callable[[np.ndarray, np.ndarray], float],
-    n_resamples: int = 5000,
-    random_state: int = 0,
-) -> tuple[ConfidenceInterval, int]:
-    rng = np.random.default_rng(random_state)
-    n = x.size
-    finite_estimates: list[float] = []
-    nonfinite_count = 0
-
-    for _ in range(n_resamples):
-        idx = rng.integers(n, size=n)
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", category=ConstantInputWarning)
-            estimate = float(statistic_fn(x[idx], y[idx]))
-        if not np.isfinite(estimate):
-            nonfinite_count += 1
-            continue
-        finite_estimates.append(float(np.clip(estimate, -1.0, 1.0)))
+    bounds: tuple[float, float],
+    cells_per_resample: int,
+    studentization: Optional[_Studentization] = None,
+) -> _BootstrapRun:
+    if studentization is not None and (not studentization.standard_error > 0.0 or not bounds[0] < estimate < bounds[1]):
+        # The pivot is undefined; like the other methods, whose resamples all sit at the
+        # estimate, the interval collapses onto it.
+        ci = ConfidenceInterval(
+            level=confidence_level,
+            lower=bounds[0] if alternative == "less" else estimate,
+            upper=bounds[1] if alternative == "greater" else estimate,
+        )
+        return _BootstrapRun(
+            ci=ci,
+            n_resamples=0,
+            n_nonfinite=0,
+            pivots=True,
+            note=(
+                "Bootstrap CI note: the estimate lies at the boundary of its range or has zero standard error, "
+                "so the studentized interval is degenerate at the estimate and no resamples were drawn."
+            ),
+        )
 
-    if len(finite_estimates) < 10:
-        # Too few finite bootstrap draws to form a meaningful percentile interval.
-        return ConfidenceInterval(level=confidence_level, lower=float("nan"), upper=float("nan")), nonfinite_count
+    chunk_size = config.chunk_size
+    if config.adaptive and chunk_size is None:
+        # Check the stopping rule at least every min_resamples / 4 draws.
+        budget_chunk = max(1, min(_BOOTSTRAP_MAX_CHUNK, _BOOTSTRAP_CHUNK_CELLS // max(1, cells_per_resample)))
+        chunk_size = max(1, min(budget_chunk, config.min_resamples // 4))
+    sizes = _bootstrap_chunk_sizes(config.n_resamples, cells_per_resample, chunk_size)
+    next_generator = _chunk_generator_factory(config.random_state)
+    acceleration = _bca_acceleration(jackknife_fn()) if config.ci_method == "bca" else 0.0
+    # Monte Carlo errors of pivot quantiles are put on the estimand scale through the SE.
+    error_scale = 1.0 if studentization is None else studentization.standard_error
+
+    def levels_for(finite: np.ndarray) -> tuple[Optional[float], Optional[float]]:
+        return _interval_quantile_levels(
+            finite,
+            estimate=estimate,
+            acceleration=acceleration,
+            ci_method=config.ci_method,
+            confidence_level=confidence_level,
+            alternative=alternative,
+        )
 
-    estimates = np.asarray(finite_estimates, dtype=float)
-    alpha = 1.0 - confidence_level
-    if alternative == "two-sided":
-        lower, upper = np.quantile(estimates, [alpha / 2.0, 1.0 - alpha / 2.0])
-    elif alternative == "greater":
-        lower = float(np.quantile(estimates, alpha))
-        upper = 1.0
+    # Chunks are consumed strictly in order and the stopping rule is checked after each
+    # one, so the result is identical for any n_jobs and backend.
+    tasks = ((next_generator(), size) for size in sizes)
+    chunks = map_chunks(kernel, arrays, params, tasks, n_jobs=config.n_jobs, backend=config.backend)
+    blocks: list[np.ndarray] = []
+    drawn = 0
+    try:
+        for size, block in zip(sizes, chunks):
+            blocks.append(block)
+            drawn += size
+            if config.adaptive and config.min_resamples <= drawn < config.n_resamples:
+                finite = _bootstrap_draws(blocks, estimate, studentization, bounds)
+                finite = finite[np.isfinite(finite)]
+                if finite.size >= 10:
+                    errors = [_quantile_mc_error(finite, p) for p in levels_for(finite) if p is not None]
+                    if error_scale * max(errors, default=0.0) <= config.tolerance:
+                        break
+    finally:
+        chunks.close()
+
+    ci_method = config.ci_method
+    note: Optional[str] = None
+    estimates = _bootstrap_draws(blocks, estimate, studentization, bounds)
+    nonfinite_count = int(estimates.size - np.count_nonzero(np.isfinite(estimates)))
+    if studentization is not None and nonfinite_count > _STUDENTIZED_MAX_DROPPED * estimates.size:
+        note = (
+            f"Bootstrap CI note: {nonfinite_count} of {drawn} studentized pivots were degenerate (resamples at the "
+            "boundary of the estimand or with zero standard error), so the percentile interval of the same "
+            "resamples is reported instead."
+        )
+        studentization, ci_method = None, "percentile"
+        estimates = np.concatenate(blocks)[:, 0]
+        nonfinite_count = int(estimates.size - np.count_nonzero(np.isfinite(estimates)))
+    pivots = studentization is not None
+    if estimates.size - nonfinite_count < 10:
+        # Too few finite bootstrap draws to form a meaningful interval.
+        ci = ConfidenceInterval(level=confidence_level, lower=float("nan"), upper=float("nan"))
+        return _BootstrapRun(ci=ci, n_resamples=drawn, n_nonfinite=nonfinite_count, pivots=pivots, note=note)
+
+    finite = estimates[np.isfinite(estimates)]
+    if studentization is None:
+        finite = np.clip(finite, *bounds)
+    levels = _interval_quantile_levels(
+        finite,
+        estimate=estimate,
+        acceleration=acceleration,
+        ci_method=ci_method,
+        confidence_level=confidence_level,
+        alternative=alternative,
+    )
+    ci = _interval_from_estimates(
+        finite,
+        estimate=estimate,
+        levels=levels,
+        ci_method=ci_method,
+        confidence_level=confidence_level,
+        bounds=bounds,
+        studentization=studentization,
+    )
+    return _BootstrapRun(ci=ci, n_resamples=drawn, n_nonfinite=nonfinite_count, pivots=pivots, note=note)
+
+
+def _bootstrap_notes(run: _BootstrapRun, config: BootstrapConfig, *, statistic: str) -> list[str]:
+    # Notes for every bootstrap interval that rests on other or fewer resamples than requested.
+    notes = [] if run.note is None else [run.note]
+    if run.n_nonfinite > 0:
+        if run.pivots:
+            reason = (
+                f"degenerate studentized pivots ({statistic} at the boundary of its range or with zero standard error)"
+            )
+        else:
+            reason = f"non-finite {statistic} estimates (typically due to ties/degenerate resamples)"
+        notes.append(
+            f"Bootstrap CI note: dropped {run.n_nonfinite} of {run.n_resamples} resamples with {reason}; "
+            f"the interval rests on the remaining {run.n_resamples - run.n_nonfinite}."
+        )
+    if config.adaptive and 0 < run.n_resamples < config.n_resamples:
+        notes.append(
+            f"Bootstrap CI note: adaptive resampling stopped after {run.n_resamples} of at most {config.n_resamples} "
+            f"resamples once the Monte Carlo error of the interval limits fell below {config.tolerance:g}."
+        )
+    return notes
+
+
+# ------------------------------
+# Bootstrap engines
+# ------------------------------
+
+
+def _pooled_codes(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray, int]:
+    # Dense codes over the pooled sorted values: equal codes are ties, smaller codes are smaller values.
+    levels, inverse = np.unique(np.concatenate([x, y]), return_inverse=True)
+    return inverse[: x.size], inverse[x.size :], int(levels.size)
+
+
+@dataclass(frozen=True)
+class _RankComparison:
+    """
+    Pooled rank and tie summary of two samples, built from a single sort.
+
+    Mann-Whitney U, the probability of superiority, Cliff's delta, the tie correction
+    and the bootstrap codes all derive from it, so none of them re-sorts or re-ranks.
+    """
+
+    codes_x: np.ndarray
+    codes_y: np.ndarray
+    n_levels: int
+    wins: int
+    ties: int
+    tie_term: float
+
+    @property
+    def u_statistic(self) -> float:
+        # U for group1 counts the pairs it wins plus half the ties, i.e. R1 - n1 (n1 + 1) / 2.
+        return self.wins + 0.5 * self.ties
+
+    @property
+    def superiority(self) -> float:
+        return self.u_statistic / float(self.codes_x.size * self.codes_y.size)
+
+
+def _rank_comparison(x: np.ndarray, y: np.ndarray) -> _RankComparison:
+    codes_x, codes_y, n_levels = _pooled_codes(x, y)
+    counts_x = np.bincount(codes_x, minlength=n_levels)
+    counts_y = np.bincount(codes_y, minlength=n_levels)
+    below = np.cumsum(counts_y) - counts_y
+    tied = (counts_x + counts_y).astype(float)
+    return _RankComparison(
+        codes_x=codes_x,
+        codes_y=codes_y,
+        n_levels=n_levels,
+        wins=int(np.dot(counts_x, below)),
+        ties=int(np.dot(counts_x, counts_y)),
+        tie_term=float(np.sum(tied**3 - tied)),
+    )
+
+
+def _mann_whitney_test(
+    x: np.ndarray, y: np.ndarray, ranks: _RankComparison, alternative: Alternative
+) -> tuple[float, float]:
+    # Same decisions as scipy.stats.mannwhitneyu(method="auto", use_continuity=True): the
+    # exact null distribution for small tie-free samples, otherwise the tie-corrected
+    # normal approximation, here evaluated from the shared rank summary.
+    n1, n2 = x.size, y.size
+    u1 = ranks.u_statistic
+    if (n1 <= 8 or n2 <= 8) and ranks.tie_term == 0:
+        from scipy.stats import mannwhitneyu
+
+        return u1, float(mannwhitneyu(x, y, alternative=alternative, method="exact").pvalue)
+    return u1, float(_mann_whitney_normal_pvalue(u1, n1, n2, ranks.tie_term, alternative))
+
+
+def _mann_whitney_normal_pvalue(u1: Any, n1: Any, n2: Any, tie_term: Any, alternative: Alternative) -> Any:
+    # Tie-corrected normal approximation with continuity correction; vectorised over groups.
+    u2 = n1 * n2 - u1
+    if alternative == "greater":
+        u, factor = u1, 1.0
+    elif alternative == "less":
+        u, factor = u2, 1.0
     else:
-        lower = -1.0
-        upper = float(np.quantile(estimates, 1.0 - alpha))
+        u, factor = np.maximum(u1, u2), 2.0
+    n = n1 + n2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sd = np.sqrt(n1 * n2 / 12.0 * ((n + 1) - tie_term / (n * (n - 1))))
+        z = (u - n1 * n2 / 2.0 - 0.5) / sd
+    return np.clip(factor * norm_sf(z), 0.0, 1.0)
+
+
+def _code_counts(codes: np.ndarray, n_levels: int) -> np.ndarray:
+    # Row-wise histograms of a (size, n) block of codes via a single offset bincount.
+    size = codes.shape[0]
+    offsets = (np.arange(size, dtype=np.int64) * n_levels)[:, None]
+    counts = np.bincount((codes + offsets).ravel(), minlength=size * n_levels)
+    return counts.reshape(size, n_levels)
+
+
+def _resampled_code_counts(codes: np.ndarray, n_levels: int, rng: np.random.Generator, size: int) -> np.ndarray:
+    idx = rng.integers(codes.size, size=(size, codes.size))
+    return _code_counts(codes[idx], n_levels)
+
+
+def _superiority_from_counts(hx: np.ndarray, hy: np.ndarray, nx: int, ny: int, *, with_se: bool = False) -> np.ndarray:
+    # Work on (size, n_levels) histograms of pooled codes. An x value's placement is the
+    # share of y values below it (ties count half) and the estimate is the mean placement;
+    # with_se adds DeLong's standard error from the spread of the x and y placements.
+    below_y = np.cumsum(hy, axis=1) - hy
+    placement_x = (below_y + 0.5 * hy) / ny
+    theta = np.einsum("ij,ij->i", hx, placement_x) / nx
+    if not with_se:
+        return theta
+    above_x = nx - np.cumsum(hx, axis=1)
+    placement_y = (above_x + 0.5 * hx) / nx
+    dev_x = placement_x - theta[:, None]
+    dev_y = placement_y - theta[:, None]
+    var_x = np.einsum("ij,ij,ij->i", hx, dev_x, dev_x) / (nx - 1)
+    var_y = np.einsum("ij,ij,ij->i", hy, dev_y, dev_y) / (ny - 1)
+    return np.column_stack([theta, np.sqrt(var_x / nx + var_y / ny)])
+
+
+def _probability_of_superiority_resamples(
+    codes_x: np.ndarray,
+    codes_y: np.ndarray,
+    n_levels: int,
+    rng: np.random.Generator,
+    size: int,
+    *,
+    with_se: bool = False,
+) -> np.ndarray:
+    hx = _resampled_code_counts(codes_x, n_levels, rng, size)
+    hy = _resampled_code_counts(codes_y, n_levels, rng, size)
+    return _superiority_from_counts(hx, hy, codes_x.size, codes_y.size, with_se=with_se)
+
+
+def _probability_of_superiority_jackknife(x: np.ndarray, y: np.ndarray) -> list[np.ndarray]:
+    # Leave-one-out estimates in closed form: dropping one observation only removes its
+    # own wins and ties, so no pairwise recomputation is needed.
+    nx, ny = x.size, y.size
+    wins, ties = _superiority_counts(x, y)
+    y_sorted = np.sort(y)
+    x_sorted = np.sort(x)
+    x_below = np.searchsorted(y_sorted, x, side="left")
+    x_ties = np.searchsorted(y_sorted, x, side="right") - x_below
+    y_above = nx - np.searchsorted(x_sorted, y, side="right")
+    y_ties = np.searchsorted(x_sorted, y, side="right") - np.searchsorted(x_sorted, y, side="left")
+    drop_x = ((wins - x_below) + 0.5 * (ties - x_ties)) / float((nx - 1) * ny)
+    drop_y = ((wins - y_above) + 0.5 * (ties - y_ties)) / float(nx * (ny - 1))
+    return [drop_x, drop_y]
+
+
+def _probability_of_superiority_kernel(
+    arrays: Mapping[str, np.ndarray], params: tuple[Any, ...], rng: np.random.Generator, size: int
+) -> np.ndarray:
+    n_levels, with_se = params
+    return _probability_of_superiority_resamples(
+        arrays["codes_x"], arrays["codes_y"], n_levels, rng, size, with_se=with_se
+    )
+
+
+def _probability_of_superiority_ci(
+    x: np.ndarray,
+    y: np.ndarray,
+    *,
+    confidence_level: float,
+    alternative: Alternative,
+    config: Optional[BootstrapConfig] = None,
+    ranks: Optional[_RankComparison] = None,
+) -> _BootstrapRun:
+    config = config or BootstrapConfig()
+    ranks = ranks or _rank_comparison(x, y)
+    studentization = None
+    if config.ci_method == "studentized":
+        if x.size < 2 or y.size < 2:
+            raise ValueError("Studentized bootstrap intervals require at least 2 observations per group.")
+        counts = _code_counts(np.concatenate([ranks.codes_x, ranks.codes_y])[None, :], ranks.n_levels)
+        hx = _code_counts(ranks.codes_x[None, :], ranks.n_levels)
+        observed = _superiority_from_counts(hx, counts - hx, x.size, y.size, with_se=True)
+        studentization = _Studentization(standard_error=float(observed[0, 1]))
+    return _run_bootstrap(
+        _probability_of_superiority_kernel,
+        {"codes_x": ranks.codes_x, "codes_y": ranks.codes_y},
+        (ranks.n_levels, studentization is not None),
+        estimate=ranks.superiority,
+        jackknife_fn=lambda: _probability_of_superiority_jackknife(x, y),
+        config=config,
+        confidence_level=confidence_level,
+        alternative=alternative,
+        bounds=(0.0, 1.0),
+        cells_per_resample=x.size + y.size + 3 * ranks.n_levels,
+        studentization=studentization,
+    )
 
-    return ConfidenceInterval(level=confidence_level, lower=float(lower), upper=float(upper)), nonfinite_count
 
+def _midranks_by_row(codes: np.ndarray, n_levels: int) -> np.ndarray:
+    # Average (tie-corrected) ranks within each row of a (size, n) block of dense codes:
+    # a value's midrank is the count of smaller values plus (ties + 1) / 2.
+    counts = _code_counts(codes, n_levels)
+    midranks = np.cumsum(counts, axis=1) - (counts - 1) / 2.0
+    return np.take_along_axis(midranks, codes, axis=1)
+
+
+def _spearman_from_indices(
+    codes_x: np.ndarray, n_levels_x: int, codes_y: np.ndarray, n_levels_y: int, idx: np.ndarray
+) -> np.ndarray:
+    k = idx.shape[1]
+    # Midranks always average (k + 1) / 2, so centring needs no per-row mean.
+    rx = _midranks_by_row(codes_x[idx], n_levels_x) - (k + 1) / 2.0
+    ry = _midranks_by_row(codes_y[idx], n_levels_y) - (k + 1) / 2.0
+    sxy = np.einsum("ij,ij->i", rx, ry)
+    sxx = np.einsum("ij,ij->i", rx, rx)
+    syy = np.einsum("ij,ij->i", ry, ry)
+    # A row with a constant column has zero rank variance; like spearmanr, report NaN.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where((sxx > 0) & (syy > 0), sxy / np.sqrt(sxx * syy), np.nan)
+
+
+def _spearman_resamples(
+    codes_x: np.ndarray,
+    n_levels_x: int,
+    codes_y: np.ndarray,
+    n_levels_y: int,
+    rng: np.random.Generator,
+    size: int,
+) -> np.ndarray:
+    n = codes_x.size
+    return _spearman_from_indices(codes_x, n_levels_x, codes_y, n_levels_y, rng.integers(n, size=(size, n)))
+
+
+def _spearman_z_se(r: Any, n: int) -> Any:
+    # Bonett & Wright (2000) standard error of the Fisher-transformed Spearman coefficient.
+    return np.sqrt((1.0 + np.square(r) / 2.0) / (n - 3))
+
+
+def _spearman_kernel(
+    arrays: Mapping[str, np.ndarray], params: tuple[Any, ...], rng: np.random.Generator, size: int
+) -> np.ndarray:
+    n_levels_x, n_levels_y, with_se = params
+    rho = _spearman_resamples(arrays["codes_x"], n_levels_x, arrays["codes_y"], n_levels_y, rng, size)
+    if not with_se:
+        return rho
+    return np.column_stack([rho, _spearman_z_se(rho, arrays["codes_x"].size)])
+
+
+def _count_upper_right(codes_x: np.ndarray, codes_y: np.ndarray) -> np.ndarray:
+    # For every point, the number of points strictly above it in both coordinates, in
+    # O(n log^2 n) without Python-level loops over points. Ordering by x (ties by
+    # descending y) reduces this to counting larger y values further right, which a
+    # bottom-up merge sort answers level by level: each left half is searched against
+    # its sorted right half, all blocks at once through a block-offset key.
+    n = codes_x.size
+    order = np.lexsort((-codes_y, codes_x))
+    values = codes_y[order].astype(np.int64)
+    counts = np.zeros(n, dtype=np.int64)
+    span = int(values.max()) + 1 if n else 1
+    positions = np.arange(n, dtype=np.int64)
+    width = 1
+    while width < n:
+        pair = positions // (2 * width)
+        left = (positions // width) % 2 == 0
+        keys = pair * span + values
+        right_keys = keys[~left]
+        starts = np.searchsorted(right_keys, keys[left], side="right")
+        ends = np.searchsorted(right_keys, (pair[left] + 1) * span, side="left")
+        counts[order[left]] += ends - starts
+        merged = np.argsort(keys, kind="stable")
+        values, order = values[merged], order[merged]
+        width *= 2
+    return counts
+
+
+def _same_level_counts_above(codes_x: np.ndarray, codes_y: np.ndarray, n_levels_x: int) -> np.ndarray:
+    # For every point, the number of points sharing its y level with a strictly larger x.
+    keys = codes_y.astype(np.int64) * n_levels_x + codes_x
+    ordered = np.sort(keys)
+    ends = np.searchsorted(ordered, (codes_y.astype(np.int64) + 1) * n_levels_x, side="left")
+    return ends - np.searchsorted(ordered, keys, side="right")
+
+
+def _spearman_jackknife(codes_x: np.ndarray, n_levels_x: int, codes_y: np.ndarray, n_levels_y: int) -> list[np.ndarray]:
+    # Leave-one-out Spearman coefficients without re-ranking: dropping point i lowers the
+    # midrank of every point above it by 1 and of every point tied with it by 1/2, so the
+    # leave-one-out rank sums and cross-products follow from per-level prefix sums and
+    # pairwise dominance counts, in O(n log^2 n) overall instead of n re-rankings.
+    n = codes_x.size
+    counts_x = np.bincount(codes_x, minlength=n_levels_x)
+    counts_y = np.bincount(codes_y, minlength=n_levels_y)
+    # Ranks centred on the full-sample mean (n + 1) / 2 keep the sums small.
+    centre = (n + 1) / 2.0
+    u = (np.cumsum(counts_x) - (counts_x - 1) / 2.0 - centre)[codes_x]
+    v = (np.cumsum(counts_y) - (counts_y - 1) / 2.0 - centre)[codes_y]
+
+    def shifted_sums(
+        codes: np.ndarray, counts: np.ndarray, own: np.ndarray, other: np.ndarray, n_levels: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Sum of a_ij * own_j, a_ij * other_j and a_ij**2 over j != i, where a_ij is the
+        # rank drop of point j when point i is removed (1 above i, 1/2 tied with i).
+        def above_and_tied(weights: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+            level_sums = np.bincount(codes, weights=weights, minlength=n_levels)
+            above = (level_sums.sum() - np.cumsum(level_sums))[codes]
+            return above, level_sums[codes] - weights
+
+        own_above, own_tied = above_and_tied(own)
+        other_above, other_tied = above_and_tied(other)
+        n_above = (n - np.cumsum(counts))[codes]
+        n_tied = counts[codes] - 1
+        return own_above + 0.5 * own_tied, other_above + 0.5 * other_tied, n_above + 0.25 * n_tied
+
+    a_u, a_v, a_sq = shifted_sums(codes_x, counts_x, u, v, n_levels_x)
+    b_v, b_u, b_sq = shifted_sums(codes_y, counts_y, v, u, n_levels_y)
+    # Sum of a_ij * b_ij over j != i splits into strictly-above / tied combinations.
+    both_above = _count_upper_right(codes_x, codes_y)
+    x_above_y_tied = _same_level_counts_above(codes_x, codes_y, n_levels_x)
+    y_above_x_tied = _same_level_counts_above(codes_y, codes_x, n_levels_y)
+    pair_keys = codes_x.astype(np.int64) * n_levels_y + codes_y
+    ordered = np.sort(pair_keys)
+    both_tied = np.searchsorted(ordered, pair_keys, side="right") - np.searchsorted(ordered, pair_keys, side="left") - 1
+    ab = both_above + 0.5 * (x_above_y_tied + y_above_x_tied) + 0.25 * both_tied
+
+    # The n - 1 remaining ranks, shifted by -a_ij and -b_ij, average 1/2 below the centre.
+    mean_shift = (n - 1) / 4.0
+    sxx = (np.dot(u, u) - u * u) - 2.0 * a_u + a_sq - mean_shift
+    syy = (np.dot(v, v) - v * v) - 2.0 * b_v + b_sq - mean_shift
+    sxy = (np.dot(u, v) - u * v) - a_v - b_u + ab - mean_shift
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return [np.where((sxx > 0) & (syy > 0), sxy / np.sqrt(sxx * syy), np.nan)]
 
-def cliffs_delta(group1: ArrayLike1D, group2: ArrayLike1D) -> EffectSize:
-    x = _as_1d_float_array(group1, name="group1")
-    y = _as_1d_float_array(group2, name="group2")
-    superiority = _probability_of_superiority_from_arrays(x, y)
-    delta = 2.0 * superiority - 1.0
-    return EffectSize(name="Cliffs_delta", value=delta, interpretation=_interpret_cliffs_delta(delta))
+
+def _bootstrap_correlation_ci(
+    x: np.ndarray,
+    y: np.ndarray,
+    *,
+    estimate: float,
+    confidence_level: float,
+    alternative: Alternative,
+    config: Optional[BootstrapConfig] = None,
+    x_codes: Optional[tuple[np.ndarray, int]] = None,
+    y_codes: Optional[tuple[np.ndarray, int]] = None,
+) -> _BootstrapRun:
+    # Bootstrap for Spearman's rho: each value is coded once, and every chunk of
+    # resamples is ranked in bulk from per-row code histograms.
+    config = config or BootstrapConfig()
+    codes_x, n_levels_x = x_codes or _Sample(x, name="x").codes
+    codes_y, n_levels_y = y_codes or _Sample(y, name="y").codes
+    studentization = None
+    if config.ci_method == "studentized":
+        if x.size < 4:
+            raise ValueError(
+                "Studentized bootstrap intervals for Spearman's rho require at least 4 paired observations."
+            )
+        studentization = _Studentization(
+            standard_error=float(_spearman_z_se(estimate, x.size)), transform=np.arctanh, inverse=np.tanh
+        )
+    return _run_bootstrap(
+        _spearman_kernel,
+        {"codes_x": codes_x, "codes_y": codes_y},
+        (n_levels_x, n_levels_y, studentization is not None),
+        estimate=estimate,
+        jackknife_fn=lambda: _spearman_jackknife(codes_x, n_levels_x, codes_y, n_levels_y),
+        config=config,
+        confidence_level=confidence_level,
+        alternative=alternative,
+        bounds=(-1.0, 1.0),
+        cells_per_resample=6 * x.size + n_levels_x + n_levels_y,
+        studentization=studentization,
+    )
 
 
 # ------------------------------
@@ -420,49 +1280,63 @@ def cliffs_delta(group1: ArrayLike1D, group2: ArrayLike1D) -> EffectSize:
 # ------------------------------
 
 
-def _welch_df(x: np.ndarray, y: np.ndarray) -> float:
-    vx = np.var(x, ddof=1)
-    vy = np.var(y, ddof=1)
-    nx = x.size
-    ny = y.size
-    num = (vx / nx + vy / ny) ** 2
-    den = ((vx / nx) ** 2) / (nx - 1) + ((vy / ny) ** 2) / (ny - 1)
-    return float(num / den)
+def _welch_df(var1: Any, n1: Any, var2: Any, n2: Any) -> Any:
+    a = var1 / n1
+    b = var2 / n2
+    return (a + b) ** 2 / (a**2 / (n1 - 1) + b**2 / (n2 - 1))
+
+
+def _mean_difference_se_df(var1: Any, n1: Any, var2: Any, n2: Any, *, equal_var: bool) -> tuple[Any, Any]:
+    if equal_var:
+        se = np.sqrt(_pooled_variance(var1, n1, var2, n2) * (1.0 / n1 + 1.0 / n2))
+        df = (n1 + n2 - 2) * 1.0
+    else:
+        se = np.sqrt(var1 / n1 + var2 / n2)
+        df = _welch_df(var1, n1, var2, n2)
+    return se, df
+
+
+def _t_interval_bounds(
+    estimate: Any, se: Any, df: Any, *, confidence_level: float, alternative: Alternative
+) -> tuple[Any, Any]:
+    crit = t_critical(confidence_level, df, alternative)
+    if alternative == "two-sided":
+        return estimate - crit * se, estimate + crit * se
+    if alternative == "greater":
+        return estimate - crit * se, np.full_like(estimate - crit * se, math.inf)
+    return np.full_like(estimate + crit * se, -math.inf), estimate + crit * se
+
+
+def _t_test_pvalue(statistic: Any, df: Any, alternative: Alternative) -> Any:
+    return t_pvalue(statistic, df, alternative)
 
 
 def _mean_difference_ci(
-    x: np.ndarray,
-    y: np.ndarray,
+    mean_diff: float,
+    var1: float,
+    n1: int,
+    var2: float,
+    n2: int,
     *,
     confidence_level: float,
     equal_var: bool,
     alternative: Alternative,
 ) -> tuple[ConfidenceInterval, float]:
-    mean_diff = float(np.mean(x) - np.mean(y))
-    nx = x.size
-    ny = y.size
+    se, df = _mean_difference_se_df(var1, n1, var2, n2, equal_var=equal_var)
+    lower, upper = _t_interval_bounds(mean_diff, se, df, confidence_level=confidence_level, alternative=alternative)
+    return ConfidenceInterval(level=confidence_level, lower=float(lower), upper=float(upper)), float(df)
 
-    if equal_var:
-        sp2 = (((nx - 1) * np.var(x, ddof=1)) + ((ny - 1) * np.var(y, ddof=1))) / (nx + ny - 2)
-        se = math.sqrt(sp2 * (1.0 / nx + 1.0 / ny))
-        df = float(nx + ny - 2)
-    else:
-        se = math.sqrt(np.var(x, ddof=1) / nx + np.var(y, ddof=1) / ny)
-        df = _welch_df(x, y)
 
-    alpha = 1.0 - confidence_level
-    if alternative == "two-sided":
-        crit = t.ppf(1.0 - alpha / 2.0, df)
-        ci = ConfidenceInterval(level=confidence_level, lower=mean_diff - crit * se, upper=mean_diff + crit * se)
-    elif alternative == "greater":
-        crit = t.ppf(1.0 - alpha, df)
-        ci = ConfidenceInterval(level=confidence_level, lower=mean_diff - crit * se, upper=math.inf)
-    else:
-        crit = t.ppf(1.0 - alpha, df)
-        ci = ConfidenceInterval(level=confidence_level, lower=-math.inf, upper=mean_diff + crit * se)
-    return ci, df
+def _mean_difference_note(equal_var: bool) -> str:
+    return (
+        "This analysis assumes independent observations within and between groups; paired or repeated-measures designs require different methods. "
+        "Welch's t-test is the recommended default for comparing means because it remains valid under unequal variances."
+        if not equal_var
+        else "This analysis assumes independent observations within and between groups; paired or repeated-measures designs require different methods. Student's t-test assumes equal variances across groups."
+    )
 
 
+@_profiled
 def compare_independent_groups(
     group1: ArrayLike1D,
     group2: ArrayLike1D,
@@ -472,6 +1346,8 @@ def compare_independent_groups(
     alternative: Alternative = "two-sided",
     confidence_level: float = 0.95,
     alpha: float = 0.05,
+    bootstrap: Optional[BootstrapConfig] = None,
+    diagnostics: DiagnosticsPolicy = "eager",
 ) -> TwoGroupComparisonResult:
     """
     Compare two independent groups using an explicit estimand.
@@ -484,62 +1360,95 @@ def compare_independent_groups(
     method:
         For mean_difference: {'welch', 'student'}; default is 'welch'.
         For stochastic_dominance: {'mannwhitney'}; default is 'mannwhitney'.
+    bootstrap:
+        Resampling settings for the probability-of-superiority confidence interval
+        (stochastic_dominance only); defaults to ``BootstrapConfig()``.
+    diagnostics:
+        When to run the Shapiro-Wilk and Brown-Forsythe diagnostics (mean_difference only):
+        - 'eager': run them before returning (default).
+        - 'lazy': run them on first use of ``result.assumptions`` and cache the checks;
+          the result keeps a reference to both samples until then.
+        - 'off': skip them; ``result.assumptions`` is empty and a note says so.
 
     Notes
     -----
     This function intentionally avoids choosing the inferential target based on
     a normality pre-test. Normality and variance checks are returned as
     diagnostics, not gatekeepers.
+
+    Calls are instrumented: see ``stats4science.profiling`` for per-stage timings.
     """
-    x = _as_1d_float_array(group1, name="group1")
-    y = _as_1d_float_array(group2, name="group2")
-    if x.size < 2 or y.size < 2:
-        raise ValueError("At least 2 observations per group are required.")
-    group1_descriptives = describe(x)
-    group2_descriptives = describe(y)
+    if diagnostics not in {"eager", "lazy", "off"}:
+        raise ValueError("diagnostics must be 'eager', 'lazy' or 'off'.")
+    with _stage("validation"):
+        xs = _Sample(group1, name="group1")
+        ys = _Sample(group2, name="group2")
+        if xs.n < 2 or ys.n < 2:
+            raise ValueError("At least 2 observations per group are required.")
+    _record_sizes(n1=xs.n, n2=ys.n)
+    x, y = xs.values, ys.values
+    with _stage("describe"):
+        group1_descriptives = _describe_sample(xs)
+        group2_descriptives = _describe_sample(ys)
 
     if estimand == "mean_difference":
         test_method = (method or "welch").lower()
         if test_method not in {"welch", "student"}:
             raise ValueError("For estimand='mean_difference', method must be 'welch' or 'student'.")
 
-        assumptions = (
-            shapiro_normality(x, alpha=alpha),
-            shapiro_normality(y, alpha=alpha),
-            equal_variance_check(x, y, alpha=alpha, center="median"),
-        )
+        def run_diagnostics() -> tuple[AssumptionCheck, ...]:
+            with _stage("shapiro"):
+                normality = (_shapiro_normality(xs, alpha), _shapiro_normality(ys, alpha))
+            with _stage("levene"):
+                return (*normality, _equal_variance_check(xs, ys, alpha, "median"))
+
+        assumptions: Sequence[AssumptionCheck]
+        if diagnostics == "eager":
+            assumptions = run_diagnostics()
+        elif diagnostics == "lazy":
+            assumptions = _LazyAssumptions(run_diagnostics)
+        else:
+            assumptions = ()
 
         equal_var = test_method == "student"
-        from scipy.stats import ttest_ind
-
-        statistic, p_value = ttest_ind(x, y, equal_var=equal_var, alternative=alternative)
-        ci, df = _mean_difference_ci(
-            x, y, confidence_level=confidence_level, equal_var=equal_var, alternative=alternative
-        )
-        effect = hedges_g(x, y)
-        note = (
-            "This analysis assumes independent observations within and between groups; paired or repeated-measures designs require different methods. "
-            "Welch's t-test is the recommended default for comparing means because it remains valid under unequal variances."
-            if not equal_var
-            else "This analysis assumes independent observations within and between groups; paired or repeated-measures designs require different methods. Student's t-test assumes equal variances across groups."
-        )
+        mean_diff = xs.mean - ys.mean
+        with _stage("effect_size"):
+            # Raises for a zero pooled SD, before the t statistic would divide by zero.
+            effect = _hedges_g_from_moments(mean_diff, xs.var, xs.n, ys.var, ys.n)
+        with _stage("t_test"):
+            se, _ = _mean_difference_se_df(xs.var, xs.n, ys.var, ys.n, equal_var=equal_var)
+            statistic = mean_diff / float(se)
+            ci, df = _mean_difference_ci(
+                mean_diff,
+                xs.var,
+                xs.n,
+                ys.var,
+                ys.n,
+                confidence_level=confidence_level,
+                equal_var=equal_var,
+                alternative=alternative,
+            )
+            p_value = _t_test_pvalue(statistic, df, alternative)
+        notes = [_mean_difference_note(equal_var)]
+        if diagnostics == "off":
+            notes.append("Normality and equal-variance diagnostics were not computed (diagnostics='off').")
         return TwoGroupComparisonResult(
             estimand="mean_difference",
             method="Welch_t_test" if not equal_var else "Students_t_test",
             alternative=alternative,
-            statistic=float(statistic),
+            statistic=statistic,
             p_value=float(p_value),
-            estimate=float(np.mean(x) - np.mean(y)),
+            estimate=mean_diff,
             estimate_label="mean_difference",
             ci=ci,
             effect_size=effect,
-            n1=int(x.size),
-            n2=int(y.size),
+            n1=xs.n,
+            n2=ys.n,
             group1_descriptives=group1_descriptives,
             group2_descriptives=group2_descriptives,
             df=df,
             assumptions=assumptions,
-            notes=(note,),
+            notes=tuple(notes),
         )
 
     if estimand == "stochastic_dominance":
@@ -547,15 +1456,23 @@ def compare_independent_groups(
         if test_method != "mannwhitney":
             raise ValueError("For estimand='stochastic_dominance', method must be 'mannwhitney'.")
 
-        statistic, p_value = mannwhitneyu(x, y, alternative=alternative, method="auto")
-        superiority = _probability_of_superiority_from_arrays(x, y)
-        ci = _probability_of_superiority_ci(
-            x,
-            y,
-            confidence_level=confidence_level,
-            alternative=alternative,
-        )
-        effect = cliffs_delta(x, y)
+        with _stage("mann_whitney"):
+            ranks = _rank_comparison(x, y)
+            statistic, p_value = _mann_whitney_test(x, y, ranks, alternative)
+        superiority = ranks.superiority
+        bootstrap = bootstrap or BootstrapConfig()
+        with _stage("bootstrap", ci_method=bootstrap.ci_method) as details:
+            run = _probability_of_superiority_ci(
+                x,
+                y,
+                confidence_level=confidence_level,
+                alternative=alternative,
+                config=bootstrap,
+                ranks=ranks,
+            )
+            details.update(n_resamples=run.n_resamples, n_nonfinite=run.n_nonfinite)
+        ci = run.ci
+        effect = _cliffs_delta_from_superiority(superiority)
         effect = EffectSize(
             name=effect.name,
             value=effect.value,
@@ -568,8 +1485,9 @@ def compare_independent_groups(
         )
         note = (
             "This analysis assumes independent observations within and between groups; paired or repeated-measures designs require different methods. "
-            "Mann-Whitney U targets stochastic dominance rather than mean differences. The reported estimand is the probability of superiority, defined as P(group1 > group2) + 0.5 P(tie), with a percentile bootstrap confidence interval. Cliff's delta is reported as the corresponding standardized effect size. Separate Shapiro or equal-variance tests are not reported here because they are not the key diagnostics for this estimand; instead inspect overlap, ties, and whether a location-shift interpretation would require defensible same-shape assumptions."
+            f"Mann-Whitney U targets stochastic dominance rather than mean differences. The reported estimand is the probability of superiority, defined as P(group1 > group2) + 0.5 P(tie), with a {bootstrap.ci_label} bootstrap confidence interval. Cliff's delta is reported as the corresponding standardized effect size. Separate Shapiro or equal-variance tests are not reported here because they are not the key diagnostics for this estimand; instead inspect overlap, ties, and whether a location-shift interpretation would require defensible same-shape assumptions."
         )
+        notes = [note, *_bootstrap_notes(run, bootstrap, statistic="probability of superiority")]
         return TwoGroupComparisonResult(
             estimand="stochastic_dominance",
             method="Mann_Whitney_U",
@@ -580,13 +1498,13 @@ def compare_independent_groups(
             estimate_label="probability_of_superiority",
             ci=ci,
             effect_size=effect,
-            n1=int(x.size),
-            n2=int(y.size),
+            n1=xs.n,
+            n2=ys.n,
             group1_descriptives=group1_descriptives,
             group2_descriptives=group2_descriptives,
             df=None,
             assumptions=(),
-            notes=(note,),
+            notes=tuple(notes),
         )
 
     raise ValueError("estimand must be 'mean_difference' or 'stochastic_dominance'.")
@@ -597,6 +1515,22 @@ def compare_independent_groups(
 # ------------------------------
 
 
+def _fisher_z_bounds(r: Any, se: Any, confidence_level: float, alternative: Alternative) -> tuple[Any, Any]:
+    # Vectorised Fisher z interval; |r| = 1 maps to z = +/-inf and back to a degenerate interval.
+    with np.errstate(divide="ignore"):
+        z = np.arctanh(r)
+    z_crit = z_critical(confidence_level, alternative)
+    if alternative == "two-sided":
+        return np.tanh(z - z_crit * se), np.tanh(z + z_crit * se)
+    if alternative == "greater":
+        # One-sided (1-alpha) lower confidence bound.
+        return np.tanh(z - z_crit * se), np.ones_like(z)
+    return -np.ones_like(z), np.tanh(z + z_crit * se)
+
+
+_PEARSON_NOTE = "Pearson correlation targets linear association. The key diagnostics are the paired-data scatterplot, focusing on linearity, influential outliers, and other joint-structure issues such as heteroscedasticity. Marginal normality of x and y is not the main assumption, so separate normality tests are intentionally not reported here."
+
+
 def _pearson_ci(r: float, n: int, confidence_level: float, alternative: Alternative) -> ConfidenceInterval:
     if n < 4:
         raise ValueError("Pearson confidence interval via Fisher z requires n >= 4.")
@@ -604,25 +1538,22 @@ def _pearson_ci(r: float, n: int, confidence_level: float, alternative: Alternat
         return ConfidenceInterval(level=confidence_level, lower=1.0, upper=1.0)
     if r <= -1.0:
         return ConfidenceInterval(level=confidence_level, lower=-1.0, upper=-1.0)
-    z = np.arctanh(r)
-    se = 1.0 / math.sqrt(n - 3)
-    alpha = 1.0 - confidence_level
-    if alternative == "two-sided":
-        z_crit = float(norm.ppf(1.0 - alpha / 2.0))
-        lower = float(np.tanh(z - z_crit * se))
-        upper = float(np.tanh(z + z_crit * se))
-        return ConfidenceInterval(level=confidence_level, lower=lower, upper=upper)
-    if alternative == "greater":
-        # One-sided (1-alpha) lower confidence bound.
-        z_crit = float(norm.ppf(1.0 - alpha))
-        lower = float(np.tanh(z - z_crit * se))
-        return ConfidenceInterval(level=confidence_level, lower=lower, upper=1.0)
-    # alternative == "less"
-    z_crit = float(norm.ppf(1.0 - alpha))
-    upper = float(np.tanh(z + z_crit * se))
-    return ConfidenceInterval(level=confidence_level, lower=-1.0, upper=upper)
+    lower, upper = _fisher_z_bounds(r, 1.0 / math.sqrt(n - 3), confidence_level, alternative)
+    return ConfidenceInterval(level=confidence_level, lower=float(lower), upper=float(upper))
+
 
+def _spearman_test(x: _Sample, y: _Sample, alternative: Alternative) -> tuple[float, float]:
+    # Pearson correlation of the cached midranks with scipy.stats.spearmanr's t-based p-value.
+    rx = x.ranks - x.ranks.mean()
+    ry = y.ranks - y.ranks.mean()
+    rho = float(np.clip(np.dot(rx, ry) / math.sqrt(np.dot(rx, rx) * np.dot(ry, ry)), -1.0, 1.0))
+    df = x.n - 2
+    with np.errstate(divide="ignore"):
+        statistic = rho * np.sqrt(np.divide(df, (1.0 + rho) * (1.0 - rho)))
+    return rho, float(_t_test_pvalue(statistic, df, alternative))
 
+
+@_profiled
 def correlation(
     x: ArrayLike1D,
     y: ArrayLike1D,
@@ -631,46 +1562,62 @@ def correlation(
     alternative: Alternative = "two-sided",
     confidence_level: float = 0.95,
     alpha: float = 0.05,
+    bootstrap: Optional[BootstrapConfig] = None,
 ) -> CorrelationResult:
-    x_arr = _as_1d_float_array(x, name="x")
-    y_arr = _as_1d_float_array(y, name="y")
-    if x_arr.size != y_arr.size:
-        raise ValueError(f"x and y must have equal length, got {x_arr.size} and {y_arr.size}.")
-    if x_arr.size < 3:
-        raise ValueError("Correlation requires at least 3 paired observations.")
-    _require_variation(x_arr, name="x")
-    _require_variation(y_arr, name="y")
+    """
+    Estimate a Pearson or Spearman correlation with a confidence interval.
+
+    ``bootstrap`` controls the resampling behind the Spearman interval and defaults to
+    ``BootstrapConfig()``; the Pearson interval uses the Fisher z transform.
+    Calls are instrumented: see ``stats4science.profiling`` for per-stage timings.
+    """
+    with _stage("validation"):
+        xs = _Sample(x, name="x")
+        ys = _Sample(y, name="y")
+        x_arr, y_arr = xs.values, ys.values
+        if x_arr.size != y_arr.size:
+            raise ValueError(f"x and y must have equal length, got {x_arr.size} and {y_arr.size}.")
+        if x_arr.size < 3:
+            raise ValueError("Correlation requires at least 3 paired observations.")
+        _require_variation(x_arr, name="x")
+        _require_variation(y_arr, name="y")
+    _record_sizes(n=xs.n)
 
     if method == "pearson":
-        coefficient, p_value = pearsonr(x_arr, y_arr, alternative=alternative)
-        ci = _pearson_ci(float(coefficient), int(x_arr.size), confidence_level, alternative)
+        with _stage("pearson"):
+            coefficient, p_value = pearson(x_arr, y_arr, alternative)
+            ci = _pearson_ci(float(coefficient), int(x_arr.size), confidence_level, alternative)
         assumptions: tuple[AssumptionCheck, ...] = ()
-        notes: tuple[str, ...] = (
-            "Pearson correlation targets linear association. The key diagnostics are the paired-data scatterplot, focusing on linearity, influential outliers, and other joint-structure issues such as heteroscedasticity. Marginal normality of x and y is not the main assumption, so separate normality tests are intentionally not reported here.",
-        )
+        notes: tuple[str, ...] = (_PEARSON_NOTE,)
     elif method == "spearman":
-        coefficient, p_value = spearmanr(x_arr, y_arr, alternative=alternative)
-        n_resamples = 5000
-        ci, nonfinite = _bootstrap_correlation_ci(
-            x_arr,
-            y_arr,
-            confidence_level=confidence_level,
-            alternative=alternative,
-            statistic_fn=lambda a, b: float(spearmanr(a, b, alternative=alternative).statistic),
-            n_resamples=n_resamples,
-        )
+        with _stage("spearman"):
+            coefficient, p_value = _spearman_test(xs, ys, alternative)
+        bootstrap = bootstrap or BootstrapConfig()
+        with _stage("bootstrap", ci_method=bootstrap.ci_method) as details:
+            run = _bootstrap_correlation_ci(
+                x_arr,
+                y_arr,
+                estimate=coefficient,
+                confidence_level=confidence_level,
+                alternative=alternative,
+                config=bootstrap,
+                x_codes=xs.codes,
+                y_codes=ys.codes,
+            )
+            details.update(n_resamples=run.n_resamples, n_nonfinite=run.n_nonfinite)
+        ci = run.ci
         assumptions = ()
         base_notes: list[str] = [
-            "Spearman correlation targets monotonic association using ranks. Diagnostics should focus on whether the relationship is monotonic and on unusual paired observations or many ties; marginal normality tests are not relevant here. A percentile bootstrap confidence interval is reported to provide uncertainty without relying on large-sample normal approximations for rho.",
+            f"Spearman correlation targets monotonic association using ranks. Diagnostics should focus on whether the relationship is monotonic and on unusual paired observations or many ties; marginal normality tests are not relevant here. A {bootstrap.ci_label} bootstrap confidence interval is reported to provide uncertainty without relying on large-sample normal approximations for rho.",
+            *_bootstrap_notes(run, bootstrap, statistic="Spearman"),
         ]
-        if nonfinite > 0:
-            base_notes.append(
-                f"Bootstrap CI note: dropped {nonfinite} of {n_resamples} resamples with non-finite Spearman estimates (typically due to ties/degenerate resamples)."
-            )
         notes = tuple(base_notes)
     else:
         raise ValueError("method must be 'pearson' or 'spearman'.")
 
+    with _stage("describe"):
+        x_descriptives = _describe_sample(xs)
+        y_descriptives = _describe_sample(ys)
     return CorrelationResult(
         method=method,
         alternative=alternative,
@@ -678,8 +1625,8 @@ def correlation(
         p_value=float(p_value),
         n=int(x_arr.size),
         ci=ci,
-        x_descriptives=describe(x_arr),
-        y_descriptives=describe(y_arr),
+        x_descriptives=x_descriptives,
+        y_descriptives=y_descriptives,
         assumptions=assumptions,
         notes=notes,
     )
@@ -705,6 +1652,27 @@ def interpret_correlation_coefficient(r: float) -> str:
     return "near perfect"
 
 
+def _significance_sentence(
+    p_value: float, adjusted_p_value: Optional[float], p_adjustment: Optional[str], alpha: float
+) -> str:
+    if adjusted_p_value is None or p_adjustment is None:
+        return f"The exact inferential result is {apa_pvalue(p_value)}" + (
+            f", which would usually be described as statistically significant at alpha = {alpha}."
+            if p_value < alpha
+            else f", which would not usually be described as statistically significant at alpha = {alpha}."
+        )
+    # With a multiplicity adjustment, the decision uses the adjusted p-value against alpha.
+    label = P_ADJUSTMENT_LABELS.get(p_adjustment, p_adjustment)
+    return (
+        f"The exact inferential result is {apa_pvalue(p_value)} ({label}-adjusted {apa_pvalue(adjusted_p_value)})"
+        + (
+            f", which would usually be described as statistically significant at alpha = {alpha} after {label} adjustment."
+            if adjusted_p_value < alpha
+            else f", which would not usually be described as statistically significant at alpha = {alpha} after {label} adjustment."
+        )
+    )
+
+
 def interpret_two_group(result: TwoGroupComparisonResult, *, alpha: float = 0.05) -> str:
     direction = "higher" if result.estimate > 0 else "lower" if result.estimate < 0 else "equal"
 
@@ -723,14 +1691,7 @@ def interpret_two_group(result: TwoGroupComparisonResult, *, alpha: float = 0.05
                     else "excludes zero, reinforcing the finding."
                 )
             )
-        parts.append(
-            f"The exact inferential result is {apa_pvalue(result.p_value)}"
-            + (
-                f", which would usually be described as statistically significant at alpha = {alpha}."
-                if result.p_value < alpha
-                else f", which would not usually be described as statistically significant at alpha = {alpha}."
-            )
-        )
+        parts.append(_significance_sentence(result.p_value, result.adjusted_p_value, result.p_adjustment, alpha))
     elif result.estimand == "stochastic_dominance":
         if result.estimate > 0.5:
             parts.append(
@@ -756,14 +1717,7 @@ def interpret_two_group(result: TwoGroupComparisonResult, *, alpha: float = 0.05
                     else "excludes 0.500, reinforcing the dominance pattern."
                 )
             )
-        parts.append(
-            f"The exact inferential result is {apa_pvalue(result.p_value)}"
-            + (
-                f", which would usually be described as statistically significant at alpha = {alpha}."
-                if result.p_value < alpha
-                else f", which would not usually be described as statistically significant at alpha = {alpha}."
-            )
-        )
+        parts.append(_significance_sentence(result.p_value, result.adjusted_p_value, result.p_adjustment, alpha))
 
     if result.effect_size is not None and result.effect_size.interpretation is not None:
         parts.append(
@@ -794,14 +1748,7 @@ def interpret_correlation(result: CorrelationResult, *, alpha: float = 0.05) ->
                 else "excludes zero, reinforcing the association."
             )
         )
-    parts.append(
-        f"The exact inferential result is {apa_pvalue(result.p_value)}"
-        + (
-            f", which would usually be described as statistically significant at alpha = {alpha}."
-            if result.p_value < alpha
-            else f", which would not usually be described as statistically significant at alpha = {alpha}."
-        )
-    )
+    parts.append(_significance_sentence(result.p_value, result.adjusted_p_value, result.p_adjustment, alpha))
 
     return " ".join(parts)
 
@@ -903,10 +1850,12 @@ def report_correlation(
 
 __all__ = [
     "AssumptionCheck",
+    "BootstrapConfig",
     "ConfidenceInterval",
     "CorrelationResult",
     "DescriptiveStats",
     "EffectSize",
+    "PermutationSummary",
     "TwoGroupComparisonResult",
     "anderson_darling_candidates",
     "apa_pvalue",
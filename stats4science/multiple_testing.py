@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import dataclasses
+from typing import Any, TypeVar, Sequence
+
+import numpy as np
+
+from .batch import TwoGroupBatchResult, CorrelationMatrixResult
+from .inferential_stats import (
+    P_ADJUSTMENT_LABELS,
+    PAdjustMethod,
+    CorrelationResult,
+    TwoGroupComparisonResult,
+)
+
+ResultT = TypeVar("ResultT", TwoGroupComparisonResult, CorrelationResult)
+
+
+def adjust_pvalues(p_values: Any, method: PAdjustMethod = "holm") -> np.ndarray:
+    """
+    Adjust a family of p-values for multiple testing in O(k log k).
+
+    Parameters
+    ----------
+    method:
+        - 'bonferroni': family-wise error control.
+        - 'holm': step-down family-wise error control, uniformly more powerful than Bonferroni.
+        - 'bh': Benjamini-Hochberg false discovery rate control (independent or positively dependent tests).
+        - 'by': Benjamini-Yekutieli false discovery rate control under arbitrary dependence.
+
+    NaN entries are left as NaN and do not count towards the family size.
+    """
+    if method not in P_ADJUSTMENT_LABELS:
+        raise ValueError("method must be 'bonferroni', 'holm', 'bh' or 'by'.")
+    p = np.asarray(p_values, dtype=float)
+    finite = ~np.isnan(p)
+    if np.any((p[finite] < 0.0) | (p[finite] > 1.0)):
+        raise ValueError("p-values must lie in [0, 1].")
+    adjusted = np.full(p.shape, np.nan)
+    values = p[finite]
+    k = values.size
+    if k == 0:
+        return adjusted
+
+    if method == "bonferroni":
+        adjusted[finite] = np.minimum(values * k, 1.0)
+        return adjusted
+
+    order = np.argsort(values, kind="stable")
+    ranked = values[order]
+    steps = np.arange(1, k + 1)
+    if method == "holm":
+        ranked_adjusted = np.maximum.accumulate((k - steps + 1) * ranked)
+    else:
+        scale = float(np.sum(1.0 / steps)) if method == "by" else 1.0
+        ranked_adjusted = np.minimum.accumulate((scale * k / steps * ranked)[::-1])[::-1]
+    out = np.empty(k)
+    out[order] = np.minimum(ranked_adjusted, 1.0)
+    adjusted[finite] = out
+    return adjusted
+
+
+def adjust_results(results: Sequence[ResultT], method: PAdjustMethod = "holm") -> list[ResultT]:
+    """
+    Treat ``results`` as one family and return copies carrying ``adjusted_p_value`` and
+    ``p_adjustment``, which ``interpret_two_group`` and ``interpret_correlation`` then
+    use for their significance statements.
+    """
+    adjusted = adjust_pvalues([r.p_value for r in results], method=method)
+    return [dataclasses.replace(r, adjusted_p_value=float(a), p_adjustment=method) for r, a in zip(results, adjusted)]
+
+
+def adjust_batch(result: TwoGroupBatchResult | CorrelationMatrixResult, method: PAdjustMethod = "holm") -> np.ndarray:
+    """
+    Adjusted p-values for a batched result, with the same shape as ``result.p_value``.
+
+    For a full correlation matrix the family is the ``p * (p - 1) / 2`` distinct pairs;
+    the adjusted matrix is symmetric with zeros on the diagonal, like ``p_value``.
+    """
+    if isinstance(result, CorrelationMatrixResult) and not result.condensed:
+        p = result.p_value.shape[0]
+        rows, cols = np.triu_indices(p, k=1)
+        adjusted = np.zeros_like(result.p_value)
+        adjusted[rows, cols] = adjust_pvalues(result.p_value[rows, cols], method=method)
+        adjusted[cols, rows] = adjusted[rows, cols]
+        return adjusted
+    return adjust_pvalues(result.p_value, method=method)
+
+
+__all__ = [
+    "adjust_batch",
+    "adjust_pvalues",
+    "adjust_results",
+]
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import math
+from typing import Callable, Iterator, Optional
+from itertools import islice, combinations
+from dataclasses import replace, dataclass
+
+import numpy as np
+
+from ._kernels import norm_ppf
+from .inferential_stats import (
+    Alternative,
+    ArrayLike1D,
+    RandomState,
+    BootstrapConfig,
+    DiagnosticsPolicy,
+    ComparisonEstimand,
+    PermutationSummary,
+    TwoGroupComparisonResult,
+    _mean_difference_se_df,
+    _chunk_generator_factory,
+    compare_independent_groups,
+)
+
+# Upper bound on (relabellings x observations) cells materialised per vectorised step.
+_PERMUTATION_CHUNK_CELLS = 1 << 22
+
+
+@dataclass(frozen=True)
+class PermutationConfig:
+    """
+    Settings for permutation p-values.
+
+    Parameters
+    ----------
+    max_resamples:
+        Largest number of random relabellings drawn by the Monte Carlo test.
+    random_state:
+        Seed or ``np.random.Generator``; ``None`` draws fresh entropy.
+    exact_threshold:
+        Enumerate every relabelling instead of sampling when there are at most this many.
+    early_stopping:
+        Stop the Monte Carlo test once the p-value is clearly above or below ``alpha``:
+        after at least ``min_resamples`` relabellings, when ``alpha`` lies outside the
+        ``stopping_confidence`` normal interval around the running estimate.
+    batch_size:
+        Relabellings evaluated per vectorised step (also capped by a fixed memory budget);
+        each batch has its own seed stream and the stopping rule is checked between batches.
+    """
+
+    max_resamples: int = 9999
+    random_state: RandomState = 0
+    exact_threshold: int = 20000
+    early_stopping: bool = True
+    stopping_confidence: float = 0.999
+    min_resamples: int = 1000
+    batch_size: int = 1000
+
+    def __post_init__(self) -> None:
+        if self.max_resamples < 1:
+            raise ValueError("max_resamples must be a positive integer.")
+        if self.exact_threshold < 0:
+            raise ValueError("exact_threshold must be a non-negative integer.")
+        if not 0.5 < self.stopping_confidence < 1.0:
+            raise ValueError("stopping_confidence must lie in (0.5, 1).")
+        if self.min_resamples < 1:
+            raise ValueError("min_resamples must be a positive integer.")
+        if self.batch_size < 1:
+            raise ValueError("batch_size must be a positive integer.")
+
+
+# A statistic maps a (batch, n1) block of pooled positions forming group 1 to one value
+# per relabelling; larger values favour group 1 > group 2.
+_Statistic = Callable[[np.ndarray], np.ndarray]
+
+
+def _t_statistic(pooled: np.ndarray, n1: int, *, equal_var: bool) -> _Statistic:
+    # Group sums and sums of squares of the centred pooled data give both groups' moments
+    # for a whole batch of relabellings without materialising the groups.
+    z = pooled - pooled.mean()
+    n2 = z.size - n1
+    total, total_sq = float(z.sum()), float(np.dot(z, z))
+
+    def statistic(idx: np.ndarray) -> np.ndarray:
+        values = z[idx]
+        s1 = values.sum(axis=1)
+        q1 = np.einsum("ij,ij->i", values, values)
+        mean1, mean2 = s1 / n1, (total - s1) / n2
+        var1 = np.maximum(q1 - n1 * mean1 * mean1, 0.0) / (n1 - 1)
+        var2 = np.maximum((total_sq - q1) - n2 * mean2 * mean2, 0.0) / (n2 - 1)
+        se, _ = _mean_difference_se_df(var1, n1, var2, n2, equal_var=equal_var)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (mean1 - mean2) / se
+
+    return statistic
+
+
+def _u_statistic(midranks: np.ndarray, n1: int) -> _Statistic:
+    offset = n1 * (n1 + 1) / 2.0
+
+    def statistic(idx: np.ndarray) -> np.ndarray:
+        return midranks[idx].sum(axis=1) - offset
+
+    return statistic
+
+
+def _exceedances(values: np.ndarray, observed: float, center: float, alternative: Alternative) -> int:
+    # Relative tolerance so relabellings that tie the observed statistic up to rounding count as ties.
+    tolerance = 1e-12 * max(1.0, abs(observed - center))
+    if alternative == "greater":
+        hits = values >= observed - tolerance
+    elif alternative == "less":
+        hits = values <= observed + tolerance
+    else:
+        hits = np.abs(values - center) >= abs(observed - center) - tolerance
+    return int(np.count_nonzero(hits))
+
+
+def _combination_batches(n_total: int, n1: int, batch_size: int) -> Iterator[np.ndarray]:
+    groups = combinations(range(n_total), n1)
+    while True:
+        block = list(islice(groups, batch_size))
+        if not block:
+            return
+        yield np.array(block, dtype=np.intp)
+
+
+def _run_permutations(
+    statistic: _Statistic,
+    n_total: int,
+    n1: int,
+    *,
+    center: float,
+    alternative: Alternative,
+    alpha: float,
+    config: PermutationConfig,
+) -> tuple[float, PermutationSummary]:
+    observed = float(statistic(np.arange(n1, dtype=np.intp)[None, :])[0])
+    batch_size = max(1, min(config.batch_size, _PERMUTATION_CHUNK_CELLS // n_total))
+    n_arrangements = math.comb(n_total, n1)
+
+    if n_arrangements <= config.exact_threshold:
+        hits = sum(
+            _exceedances(statistic(idx), observed, center, alternative)
+            for idx in _combination_batches(n_total, n1, batch_size)
+        )
+        return hits / n_arrangements, PermutationSummary(n_resamples=n_arrangements, exact=True, mc_error=0.0)
+
+    next_generator = _chunk_generator_factory(config.random_state)
+    z_stop = float(norm_ppf(0.5 + config.stopping_confidence / 2.0))
+    hits = drawn = 0
+    stopped_early = False
+    while drawn < config.max_resamples:
+        size = min(batch_size, config.max_resamples - drawn)
+        # The first n1 positions of each row of a random partition form group 1.
+        idx = next_generator().random((size, n_total)).argpartition(n1 - 1, axis=1)[:, :n1]
+        hits += _exceedances(statistic(idx), observed, center, alternative)
+        drawn += size
+        if config.early_stopping and drawn >= config.min_resamples and drawn < config.max_resamples:
+            p_hat = (hits + 1) / (drawn + 1)
+            if abs(p_hat - alpha) > z_stop * math.sqrt(p_hat * (1.0 - p_hat) / drawn):
+                stopped_early = True
+                break
+
+    # Counting the observed labelling keeps the Monte Carlo p-value valid (never exactly zero).
+    p_value = (hits + 1) / (drawn + 1)
+    return p_value, PermutationSummary(
+        n_resamples=drawn,
+        exact=False,
+        mc_error=math.sqrt(p_value * (1.0 - p_value) / drawn),
+        stopped_early=stopped_early,
+    )
+
+
+def _permutation_note(p_value: float, summary: PermutationSummary, config: PermutationConfig, alpha: float) -> str:
+    # Renders the result's ``permutation`` summary.
+    if summary.exact:
+        return f"Permutation p-value: exact, enumerating all {summary.n_resamples} relabellings of the pooled observations."
+    note = f"Permutation p-value: Monte Carlo over {summary.n_resamples} random relabellings"
+    if summary.stopped_early:
+        side = "below" if p_value < alpha else "above"
+        note += (
+            f" (of at most {config.max_resamples}; stopped early once the p-value was clearly {side} alpha = {alpha:g})"
+        )
+    return note + f", Monte Carlo standard error = {summary.mc_error:.2g}."
+
+
+def permutation_test(
+    group1: ArrayLike1D,
+    group2: ArrayLike1D,
+    *,
+    estimand: ComparisonEstimand = "mean_difference",
+    method: Optional[str] = None,
+    alternative: Alternative = "two-sided",
+    confidence_level: float = 0.95,
+    alpha: float = 0.05,
+    config: Optional[PermutationConfig] = None,
+    bootstrap: Optional[BootstrapConfig] = None,
+    diagnostics: DiagnosticsPolicy = "eager",
+) -> TwoGroupComparisonResult:
+    """
+    Compare two independent groups with a permutation p-value.
+
+    The estimate, confidence interval, effect size and descriptives are those of
+    ``compare_independent_groups`` with the same arguments; only the p-value is
+    replaced by its permutation counterpart, recomputed under random (or, for tiny
+    samples, all) relabellings of the pooled observations:
+
+    - 'mean_difference': the Welch (or Student) t statistic, a studentised permutation
+      test that stays asymptotically valid when the variances differ.
+    - 'stochastic_dominance': the Mann-Whitney U statistic, computed from pooled midranks.
+
+    Two-sided p-values count relabellings at least as extreme in absolute value (|t|, or
+    |U - n1 n2 / 2|). The number of relabellings, whether they were enumerated and the
+    Monte Carlo standard error are recorded in the result's ``permutation`` summary (and
+    restated in the notes).
+    """
+    config = config or PermutationConfig()
+    result = compare_independent_groups(
+        group1,
+        group2,
+        estimand=estimand,
+        method=method,
+        alternative=alternative,
+        confidence_level=confidence_level,
+        alpha=alpha,
+        bootstrap=bootstrap,
+        diagnostics=diagnostics,
+    )
+    # compare_independent_groups has validated both inputs at this point.
+    x = np.asarray(group1, dtype=float)
+    y = np.asarray(group2, dtype=float)
+    pooled = np.concatenate([x, y])
+    if estimand == "mean_difference":
+        statistic = _t_statistic(pooled, x.size, equal_var=result.method == "Students_t_test")
+        center = 0.0
+    else:
+        from scipy.stats import rankdata
+
+        statistic = _u_statistic(rankdata(pooled), x.size)
+        center = x.size * y.size / 2.0
+
+    p_value, summary = _run_permutations(
+        statistic,
+        pooled.size,
+        x.size,
+        center=center,
+        alternative=alternative,
+        alpha=alpha,
+        config=config,
+    )
+    return replace(
+        result,
+        method="Permutation_" + result.method,
+        p_value=p_value,
+        notes=(*result.notes, _permutation_note(p_value, summary, config, alpha)),
+        permutation=summary,
+    )
+
+
+__all__ = ["PermutationConfig", "permutation_test"]
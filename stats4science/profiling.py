@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import os
+import json
+import time
+import functools
+from types import TracebackType
+from typing import Any, Union, TextIO, TypeVar, Callable, Optional, cast
+from pathlib import Path
+from contextvars import ContextVar
+from dataclasses import field, asdict, dataclass
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    """Wall time of one stage of an analysis call, with stage-specific details."""
+
+    name: str
+    seconds: float
+    details: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class CallProfile:
+    """
+    Per-stage timing of one instrumented analysis call.
+
+    ``sizes`` holds the input sizes (e.g. ``n1``/``n2`` or ``n``); ``error`` is the
+    exception type name when the call raised, else ``None``. Stages are listed in the
+    order they finished; time outside any stage is ``seconds`` minus their sum.
+    """
+
+    function: str
+    seconds: float
+    sizes: dict[str, int]
+    stages: tuple[StageTiming, ...]
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["stages"] = list(data["stages"])
+        return data
+
+    def to_json(self) -> str:
+        """One-line JSON encoding, suitable as a JSON Lines record."""
+        return json.dumps(self.to_dict(), separators=(",", ":"))
+
+
+ProfileHook = Callable[[CallProfile], None]
+
+# Replaced, never mutated, so a call iterating the hooks is unaffected by concurrent registration.
+_HOOKS: tuple[ProfileHook, ...] = ()
+
+
+def add_profile_hook(hook: ProfileHook) -> ProfileHook:
+    """
+    Call ``hook(profile)`` after every instrumented analysis call, in any thread.
+
+    Instrumented calls are ``compare_independent_groups`` and ``correlation``. While no
+    hook is registered they skip all timing. Returns ``hook`` so it can be used as a decorator.
+    """
+    global _HOOKS
+    _HOOKS = (*_HOOKS, hook)
+    return hook
+
+
+def remove_profile_hook(hook: ProfileHook) -> None:
+    global _HOOKS
+    if hook not in _HOOKS:
+        raise ValueError("hook is not registered.")
+    hooks = list(_HOOKS)
+    hooks.remove(hook)
+    _HOOKS = tuple(hooks)
+
+
+class Profiler:
+    """
+    Collect the ``CallProfile`` of every instrumented call made while the block runs.
+
+    Examples
+    --------
+    >>> with Profiler() as profiler:
+    ...     compare_independent_groups(x, y)
+    >>> profiler.to_jsonl("profile.jsonl")
+    """
+
+    def __init__(self) -> None:
+        self.calls: list[CallProfile] = []
+        self._hook: ProfileHook = self.calls.append
+
+    def __enter__(self) -> Profiler:
+        add_profile_hook(self._hook)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        remove_profile_hook(self._hook)
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        return [call.to_dict() for call in self.calls]
+
+    def to_jsonl(self, destination: Union[str, os.PathLike[str], TextIO]) -> None:
+        """Write one JSON record per call to a path (overwritten) or an open text stream."""
+        if isinstance(destination, (str, os.PathLike)):
+            with Path(destination).open("w", encoding="utf-8") as stream:
+                self.to_jsonl(stream)
+            return
+        for call in self.calls:
+            destination.write(call.to_json() + "\n")
+
+    def stage_totals(self) -> dict[str, float]:
+        """Total seconds per stage name over all collected calls."""
+        totals: dict[str, float] = {}
+        for call in self.calls:
+            for stage in call.stages:
+                totals[stage.name] = totals.get(stage.name, 0.0) + stage.seconds
+        return totals
+
+
+# ------------------------------
+# Instrumentation used by the analysis modules
+# ------------------------------
+
+
+class _CallRecorder:
+    __slots__ = ("sizes", "stages")
+
+    def __init__(self) -> None:
+        self.sizes: dict[str, int] = {}
+        self.stages: list[StageTiming] = []
+
+
+class _Stage:
+    __slots__ = ("_recorder", "_name", "_details", "_start")
+
+    def __init__(self, recorder: _CallRecorder, name: str, details: dict[str, Any]) -> None:
+        self._recorder = recorder
+        self._name = name
+        self._details = details
+        self._start = 0.0
+
+    def __enter__(self) -> dict[str, Any]:
+        # The caller may add details (e.g. resample counts) known only once the stage has run.
+        self._start = time.perf_counter()
+        return self._details
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._recorder.stages.append(StageTiming(self._name, time.perf_counter() - self._start, self._details))
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self) -> dict[str, Any]:
+        return {}
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+_NULL_STAGE = _NullStage()
+
+# The recorder of the instrumented call running in this thread/context, if it is being profiled.
+_CURRENT: ContextVar[Optional[_CallRecorder]] = ContextVar("stats4science_profile", default=None)
+
+
+def _stage(name: str, **details: Any) -> Union[_Stage, _NullStage]:
+    recorder = _CURRENT.get()
+    if recorder is None:
+        return _NULL_STAGE
+    return _Stage(recorder, name, details)
+
+
+def _record_sizes(**sizes: int) -> None:
+    recorder = _CURRENT.get()
+    if recorder is not None:
+        recorder.sizes.update(sizes)
+
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _profiled(function: _F) -> _F:
+    name = function.__name__
+
+    @functools.wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        hooks = _HOOKS
+        if not hooks:
+            return function(*args, **kwargs)
+        recorder = _CallRecorder()
+        token = _CURRENT.set(recorder)
+        error: Optional[str] = None
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        except BaseException as exc:
+            error = type(exc).__name__
+            raise
+        finally:
+            seconds = time.perf_counter() - start
+            _CURRENT.reset(token)
+            profile = CallProfile(
+                function=name,
+                seconds=seconds,
+                sizes=recorder.sizes,
+                stages=tuple(recorder.stages),
+                error=error,
+            )
+            for hook in hooks:
+                hook(profile)
+
+    return cast(_F, wrapper)
+
+
+__all__ = [
+    "CallProfile",
+    "Profiler",
+    "StageTiming",
+    "add_profile_hook",
+    "remove_profile_hook",
+]
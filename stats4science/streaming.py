@@ -0,0 +1,388 @@
+from __future__ import annotations
+
+import os
+import math
+from typing import Union, Iterable, Optional, Sequence
+
+import numpy as np
+
+from .inferential_stats import (
+    _PEARSON_NOTE,
+    _KURTOSIS_UNDEFINED_NOTE,
+    Alternative,
+    ArrayLike1D,
+    DescriptiveStats,
+    CorrelationResult,
+    TwoGroupComparisonResult,
+    _pearson_ci,
+    _require_range,
+    _t_test_pvalue,
+    _is_near_constant,
+    _as_1d_float_array,
+    _kurtosis_from_sums,
+    _mean_difference_ci,
+    _mean_difference_note,
+    _hedges_g_from_moments,
+    _mean_difference_se_df,
+)
+
+
+class StreamingDescriptives:
+    """
+    Mergeable single-pass accumulator for ``describe`` on data that does not fit in memory.
+
+    Feed chunks with ``update`` (and combine accumulators built on separate partitions
+    with ``merge``), then call ``to_descriptives`` for a ``DescriptiveStats``.
+
+    Count, mean, SD and kurtosis come from central moment sums combined with the
+    pairwise update formulas of Chan et al. and Pébay, so they match ``describe`` up to
+    floating-point rounding. Minimum and maximum are exact. The median is exact while
+    at most ``sketch_size`` observations have been seen; beyond that it comes from a
+    compacting quantile sketch of ``O(sketch_size * log(n / sketch_size))`` values
+    whose worst-case rank error is tracked and reported in the notes.
+    """
+
+    def __init__(self, sketch_size: int = 65536) -> None:
+        if sketch_size < 2:
+            raise ValueError("sketch_size must be an integer >= 2.")
+        self.sketch_size = int(sketch_size)
+        self._n = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._m3 = 0.0
+        self._m4 = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+        # Level h holds sketch items that each stand for 2**h observations. Level 0 is
+        # kept as a list of pending chunks and only concatenated when it must be compacted.
+        self._pending: list[np.ndarray] = []
+        self._pending_size = 0
+        self._levels: list[np.ndarray] = [np.empty(0)]
+        self._compactions: list[int] = [0]
+        self._rank_error = 0
+
+    @property
+    def n(self) -> int:
+        return self._n
+
+    def update(self, chunk: ArrayLike1D) -> StreamingDescriptives:
+        # A copy: the sketch keeps the chunk after update returns, and callers often
+        # refill one read buffer.
+        x = np.array(chunk, dtype=float)
+        if x.ndim == 1 and x.size == 0:
+            return self
+        x = _as_1d_float_array(x, name="chunk")
+        mean = float(np.mean(x))
+        d = x - mean
+        d2 = d * d
+        self._combine(x.size, mean, float(np.sum(d2)), float(np.sum(d2 * d)), float(np.sum(d2 * d2)))
+        self._min = min(self._min, float(np.min(x)))
+        self._max = max(self._max, float(np.max(x)))
+        self._pending.append(x)
+        self._pending_size += x.size
+        if self._pending_size > self.sketch_size:
+            self._flush_pending()
+        return self
+
+    def merge(self, other: StreamingDescriptives) -> StreamingDescriptives:
+        """Fold the observations summarised by ``other`` into this accumulator."""
+        if other._n == 0:
+            return self
+        self._combine(other._n, other._mean, other._m2, other._m3, other._m4)
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+        self._pending.extend(other._pending)
+        self._pending_size += other._pending_size
+        self._rank_error += other._rank_error
+        for level, items in enumerate(other._levels):
+            self._ensure_level(level)
+            self._levels[level] = np.concatenate([self._levels[level], items])
+        self._flush_pending()
+        return self
+
+    def quantile(self, q: float) -> float:
+        """Quantile (linear interpolation, as ``np.quantile``) of the observations seen so far."""
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("q must lie in [0, 1].")
+        if self._n == 0:
+            raise ValueError("No observations have been added.")
+        if self._rank_error == 0:
+            return float(np.quantile(np.concatenate([*self._pending, self._levels[0]]), q))
+        items = np.concatenate([*self._pending, *self._levels])
+        weights = np.concatenate(
+            [np.ones(self._pending_size, dtype=np.int64)]
+            + [np.full(level.size, 1 << h, dtype=np.int64) for h, level in enumerate(self._levels)]
+        )
+        order = np.argsort(items, kind="stable")
+        items = items[order]
+        cumulative = np.cumsum(weights[order])
+        position = q * (self._n - 1)
+        lower, upper = math.floor(position), math.ceil(position)
+        low_value, high_value = items[np.searchsorted(cumulative, [lower, upper], side="right")]
+        return float(low_value + (high_value - low_value) * (position - lower))
+
+    def to_descriptives(self) -> DescriptiveStats:
+        n = self._n
+        if n < 2:
+            raise ValueError("At least 2 observations are required for descriptive statistics with sample SD.")
+        notes: list[str] = []
+        if _is_near_constant(self._max - self._min, self._mean):
+            kurt = float("nan")
+            notes.append(_KURTOSIS_UNDEFINED_NOTE)
+        else:
+            kurt = _kurtosis_from_sums(n, self._m2, self._m4)
+        if self._rank_error:
+            notes.append(
+                "Median is approximate: it comes from a quantile sketch whose rank error is at most "
+                f"{self._rank_error} of {n} observations ({100.0 * self._rank_error / n:.3g}%). "
+                "All other fields are exact up to floating-point rounding."
+            )
+        return DescriptiveStats(
+            n=n,
+            mean=self._mean,
+            sd=math.sqrt(self._m2 / (n - 1)),
+            median=self.quantile(0.5),
+            minimum=self._min,
+            maximum=self._max,
+            kurtosis_fisher=float(kurt),
+            notes=tuple(notes),
+        )
+
+    def _combine(self, n_b: int, mean_b: float, m2_b: float, m3_b: float, m4_b: float) -> None:
+        n_a, mean_a, m2_a, m3_a = self._n, self._mean, self._m2, self._m3
+        n = n_a + n_b
+        delta = mean_b - mean_a
+        delta_n = delta / n
+        cross = n_a * n_b * delta * delta_n
+        self._m4 = (
+            self._m4
+            + m4_b
+            + cross * delta_n * delta_n * (n_a * n_a - n_a * n_b + n_b * n_b)
+            + 6.0 * delta_n * delta_n * (n_a * n_a * m2_b + n_b * n_b * m2_a)
+            + 4.0 * delta_n * (n_a * m3_b - n_b * m3_a)
+        )
+        self._m3 = m3_a + m3_b + cross * delta_n * (n_a - n_b) + 3.0 * delta_n * (n_a * m2_b - n_b * m2_a)
+        self._m2 = m2_a + m2_b + cross
+        self._mean = mean_a + delta_n * n_b
+        self._n = n
+
+    def _ensure_level(self, level: int) -> None:
+        while len(self._levels) <= level:
+            self._levels.append(np.empty(0))
+            self._compactions.append(0)
+
+    def _flush_pending(self) -> None:
+        if self._pending:
+            self._levels[0] = np.concatenate([self._levels[0], *self._pending])
+            self._pending, self._pending_size = [], 0
+        level = 0
+        while level < len(self._levels):
+            if self._levels[level].size > self.sketch_size:
+                self._compact(level)
+            level += 1
+
+    def _compact(self, level: int) -> None:
+        # Sort the level and promote every other item to the next level with twice the
+        # weight; an odd item out stays behind so the total weight remains exactly n.
+        # Each compaction moves any query's rank by at most the level weight 2**level.
+        items = np.sort(self._levels[level])
+        keep = items[items.size - items.size % 2 :]
+        offset = self._compactions[level] % 2
+        self._compactions[level] += 1
+        self._ensure_level(level + 1)
+        self._levels[level + 1] = np.concatenate([self._levels[level + 1], items[offset : items.size - keep.size : 2]])
+        self._levels[level] = keep
+        self._rank_error += 1 << level
+
+    def __repr__(self) -> str:
+        return f"StreamingDescriptives(n={self._n}, sketch_size={self.sketch_size})"
+
+
+class PearsonAccumulator:
+    """
+    Mergeable single-pass accumulator for Pearson's r on an unbounded stream of pairs.
+
+    Feed paired chunks with ``update`` (and combine accumulators built by separate
+    workers with ``merge``); ``to_correlation`` can be called at any time and returns
+    the ``CorrelationResult`` that ``correlation(method="pearson")`` gives for all pairs
+    seen so far: r, its exact t-based p-value and the Fisher z interval.
+
+    Each chunk's co-moment is taken about the chunk means and folded in with the
+    pairwise update of Chan et al., so no large sums of products are cancelled. The
+    marginal descriptives are kept by one ``StreamingDescriptives`` per variable, whose
+    median becomes approximate beyond ``sketch_size`` observations.
+    """
+
+    def __init__(self, sketch_size: int = 65536) -> None:
+        self._x = StreamingDescriptives(sketch_size=sketch_size)
+        self._y = StreamingDescriptives(sketch_size=sketch_size)
+        self._cxy = 0.0
+
+    @property
+    def n(self) -> int:
+        return self._x.n
+
+    def update(self, x: ArrayLike1D, y: ArrayLike1D) -> PearsonAccumulator:
+        xs = np.asarray(x, dtype=float)
+        ys = np.asarray(y, dtype=float)
+        if xs.shape != ys.shape:
+            raise ValueError(f"x and y chunks must have equal shapes, got {xs.shape} and {ys.shape}.")
+        if xs.ndim == 1 and xs.size == 0:
+            return self
+        xs = _as_1d_float_array(xs, name="x chunk")
+        ys = _as_1d_float_array(ys, name="y chunk")
+        mean_x, mean_y = float(np.mean(xs)), float(np.mean(ys))
+        self._combine(xs.size, mean_x, mean_y, float(np.dot(xs - mean_x, ys - mean_y)))
+        self._x.update(xs)
+        self._y.update(ys)
+        return self
+
+    def merge(self, other: PearsonAccumulator) -> PearsonAccumulator:
+        """Fold the pairs summarised by ``other`` into this accumulator."""
+        if other.n == 0:
+            return self
+        self._combine(other.n, other._x._mean, other._y._mean, other._cxy)
+        self._x.merge(other._x)
+        self._y.merge(other._y)
+        return self
+
+    def to_correlation(
+        self, *, alternative: Alternative = "two-sided", confidence_level: float = 0.95
+    ) -> CorrelationResult:
+        n = self.n
+        if n < 3:
+            raise ValueError("Correlation requires at least 3 paired observations.")
+        _require_range(self._x._min, self._x._max, name="x")
+        _require_range(self._y._min, self._y._max, name="y")
+        r = float(np.clip(self._cxy / math.sqrt(self._x._m2 * self._y._m2), -1.0, 1.0))
+        df = n - 2
+        with np.errstate(divide="ignore"):
+            statistic = r * np.sqrt(np.divide(df, (1.0 + r) * (1.0 - r)))
+        return CorrelationResult(
+            method="pearson",
+            alternative=alternative,
+            coefficient=r,
+            p_value=float(_t_test_pvalue(statistic, df, alternative)),
+            n=n,
+            ci=_pearson_ci(r, n, confidence_level, alternative),
+            x_descriptives=self._x.to_descriptives(),
+            y_descriptives=self._y.to_descriptives(),
+            notes=(
+                _PEARSON_NOTE,
+                "The pairs were streamed through a single-pass accumulator; r, its p-value and the Fisher z "
+                "interval equal those of the in-memory analysis up to floating-point rounding.",
+            ),
+        )
+
+    def _combine(self, n_b: int, mean_x_b: float, mean_y_b: float, cxy_b: float) -> None:
+        # Uses the marginal means before they are updated with the same observations.
+        n_a = self._x.n
+        n = n_a + n_b
+        self._cxy += cxy_b + (mean_x_b - self._x._mean) * (mean_y_b - self._y._mean) * n_a * n_b / n
+
+    def __repr__(self) -> str:
+        return f"PearsonAccumulator(n={self.n}, sketch_size={self._x.sketch_size})"
+
+
+GroupSource = Union[ArrayLike1D, Iterable[ArrayLike1D], str, "os.PathLike[str]", StreamingDescriptives]
+
+
+def _accumulate(source: GroupSource, *, name: str, chunk_size: int, sketch_size: int) -> StreamingDescriptives:
+    if isinstance(source, StreamingDescriptives):
+        return source
+    acc = StreamingDescriptives(sketch_size=sketch_size)
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        if not path.endswith(".npy"):
+            raise ValueError(f"{name} paths must point to .npy files, got {path!r}.")
+        data = np.load(path, mmap_mode="r")
+    elif isinstance(source, np.ndarray):
+        data = source
+    elif isinstance(source, Sequence):
+        data = np.asarray(source, dtype=float)
+    else:
+        for chunk in source:
+            acc.update(chunk)
+        return acc
+    if data.ndim != 1:
+        raise ValueError(f"{name} must be one-dimensional, got shape={data.shape}.")
+    # Arrays (including np.memmap) are sliced so only chunk_size values are converted at a time.
+    for start in range(0, data.shape[0], chunk_size):
+        acc.update(data[start : start + chunk_size])
+    return acc
+
+
+def compare_independent_groups_streaming(
+    group1: GroupSource,
+    group2: GroupSource,
+    *,
+    method: Optional[str] = None,
+    alternative: Alternative = "two-sided",
+    confidence_level: float = 0.95,
+    chunk_size: int = 1 << 20,
+    sketch_size: int = 65536,
+) -> TwoGroupComparisonResult:
+    """
+    Welch or Student comparison of means for groups too large to hold in memory.
+
+    Each group may be an array or ``np.memmap`` (read ``chunk_size`` values at a time),
+    a path to a ``.npy`` file (memory-mapped), an iterator of 1-D chunks, or a
+    ``StreamingDescriptives`` that has already consumed the group. Only the sufficient
+    statistics (n, mean, variance) enter the test, so statistic, p-value, CI, df and
+    Hedges' g equal those of ``compare_independent_groups(estimand="mean_difference")``
+    up to floating-point rounding, with memory bounded by ``chunk_size`` and ``sketch_size``.
+
+    Normality and equal-variance diagnostics need the full samples and are not reported.
+    """
+    test_method = (method or "welch").lower()
+    if test_method not in {"welch", "student"}:
+        raise ValueError("method must be 'welch' or 'student'.")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+    acc1 = _accumulate(group1, name="group1", chunk_size=chunk_size, sketch_size=sketch_size)
+    acc2 = _accumulate(group2, name="group2", chunk_size=chunk_size, sketch_size=sketch_size)
+    n1, n2 = acc1.n, acc2.n
+    if n1 < 2 or n2 < 2:
+        raise ValueError("At least 2 observations per group are required.")
+
+    equal_var = test_method == "student"
+    mean_diff = acc1._mean - acc2._mean
+    var1, var2 = acc1._m2 / (n1 - 1), acc2._m2 / (n2 - 1)
+    effect = _hedges_g_from_moments(mean_diff, var1, n1, var2, n2)
+    ci, df = _mean_difference_ci(
+        mean_diff,
+        var1,
+        n1,
+        var2,
+        n2,
+        confidence_level=confidence_level,
+        equal_var=equal_var,
+        alternative=alternative,
+    )
+    se, _ = _mean_difference_se_df(var1, n1, var2, n2, equal_var=equal_var)
+    statistic = float(mean_diff / se)
+    return TwoGroupComparisonResult(
+        estimand="mean_difference",
+        method="Welch_t_test" if not equal_var else "Students_t_test",
+        alternative=alternative,
+        statistic=statistic,
+        p_value=float(_t_test_pvalue(statistic, df, alternative)),
+        estimate=mean_diff,
+        estimate_label="mean_difference",
+        ci=ci,
+        effect_size=effect,
+        n1=n1,
+        n2=n2,
+        group1_descriptives=acc1.to_descriptives(),
+        group2_descriptives=acc2.to_descriptives(),
+        df=df,
+        assumptions=(),
+        notes=(
+            _mean_difference_note(equal_var),
+            "The groups were streamed through single-pass accumulators; Shapiro-Wilk and equal-variance "
+            "diagnostics are not reported because they need the full samples in memory.",
+        ),
+    )
+
+
+__all__ = ["PearsonAccumulator", "StreamingDescriptives", "compare_independent_groups_streaming"]
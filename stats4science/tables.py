@@ -0,0 +1,448 @@
+from __future__ import annotations
+
+from typing import Any, Union, Literal, Iterable, Iterator, Optional, overload
+from operator import itemgetter
+from dataclasses import dataclass
+
+import numpy as np
+
+from .inferential_stats import (
+    EffectSize,
+    AssumptionCheck,
+    DescriptiveStats,
+    CorrelationResult,
+    ConfidenceInterval,
+    PermutationSummary,
+    TwoGroupComparisonResult,
+)
+
+AnalysisResult = Union[TwoGroupComparisonResult, CorrelationResult]
+ResultKind = Literal["two_group", "correlation"]
+
+_DESCRIPTIVE_STATS = ("mean", "sd", "median", "minimum", "maximum", "kurtosis_fisher")
+_ASSUMPTION_STATS = ("statistic", "p_value", "alpha")
+# Rows are decoded in blocks of this many when iterating, so column-to-list conversions
+# stay vectorised without materialising the whole table at once.
+_DECODE_BLOCK = 4096
+
+
+class _Interner:
+    # Assigns each distinct value a stable integer code; None is coded as -1.
+    def __init__(self) -> None:
+        self.values: list[Any] = []
+        self._codes: dict[Any, int] = {}
+
+    def code(self, value: Any) -> int:
+        if value is None:
+            return -1
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+# ------------------------------
+# Column layout
+# ------------------------------
+
+
+def _ci_fields(prefix: str) -> list[tuple[str, Any]]:
+    return [(f"has_{prefix}", np.bool_)] + [(f"{prefix}_{part}", np.float64) for part in ("level", "lower", "upper")]
+
+
+def _descriptive_fields(prefix: str) -> list[tuple[str, Any]]:
+    return (
+        [(f"{prefix}_n", np.int64)]
+        + [(f"{prefix}_{stat}", np.float64) for stat in _DESCRIPTIVE_STATS]
+        + [(f"{prefix}_notes", np.int32)]
+    )
+
+
+def _assumption_fields(max_assumptions: int) -> list[tuple[str, Any]]:
+    fields: list[tuple[str, Any]] = [("n_assumptions", np.int16)]
+    for i in range(max_assumptions):
+        fields.append((f"assumption{i}_test", np.int32))
+        fields.extend((f"assumption{i}_{stat}", np.float64) for stat in _ASSUMPTION_STATS)
+        fields.extend([(f"assumption{i}_passed", np.bool_), (f"assumption{i}_note", np.int32)])
+    return fields
+
+
+_ADJUSTMENT_FIELDS: list[tuple[str, Any]] = [
+    ("notes", np.int32),
+    ("has_adjusted_p_value", np.bool_),
+    ("adjusted_p_value", np.float64),
+    ("p_adjustment", np.int32),
+]
+
+
+def _table_dtype(kind: ResultKind, max_assumptions: int) -> np.dtype:
+    if kind == "two_group":
+        fields: list[tuple[str, Any]] = [
+            ("estimand", np.int32),
+            ("method", np.int32),
+            ("alternative", np.int32),
+            ("statistic", np.float64),
+            ("p_value", np.float64),
+            ("estimate", np.float64),
+            ("estimate_label", np.int32),
+            *_ci_fields("ci"),
+            ("has_effect_size", np.bool_),
+            ("effect_size_name", np.int32),
+            ("effect_size_value", np.float64),
+            ("effect_size_interpretation", np.int32),
+            *_ci_fields("effect_size_ci"),
+            ("n1", np.int64),
+            ("n2", np.int64),
+            *_descriptive_fields("group1"),
+            *_descriptive_fields("group2"),
+            ("has_df", np.bool_),
+            ("df", np.float64),
+            ("has_permutation", np.bool_),
+            ("permutation_n_resamples", np.int64),
+            ("permutation_exact", np.bool_),
+            ("permutation_mc_error", np.float64),
+            ("permutation_stopped_early", np.bool_),
+        ]
+    else:
+        fields = [
+            ("method", np.int32),
+            ("alternative", np.int32),
+            ("coefficient", np.float64),
+            ("p_value", np.float64),
+            ("n", np.int64),
+            *_ci_fields("ci"),
+            *_descriptive_fields("x"),
+            *_descriptive_fields("y"),
+        ]
+    return np.dtype(fields + _assumption_fields(max_assumptions) + _ADJUSTMENT_FIELDS)
+
+
+# ------------------------------
+# Encoding: result objects -> columns
+# ------------------------------
+
+
+def _put_ci(row: dict[str, Any], prefix: str, ci: Optional[ConfidenceInterval]) -> None:
+    row[f"has_{prefix}"] = ci is not None
+    if ci is not None:
+        row[f"{prefix}_level"], row[f"{prefix}_lower"], row[f"{prefix}_upper"] = ci.level, ci.lower, ci.upper
+
+
+def _put_descriptives(row: dict[str, Any], prefix: str, stats: DescriptiveStats, note_sets: _Interner) -> None:
+    row[f"{prefix}_n"] = stats.n
+    for stat in _DESCRIPTIVE_STATS:
+        row[f"{prefix}_{stat}"] = getattr(stats, stat)
+    row[f"{prefix}_notes"] = note_sets.code(tuple(stats.notes))
+
+
+def _put_common(row: dict[str, Any], result: AnalysisResult, strings: _Interner, note_sets: _Interner) -> None:
+    row["n_assumptions"] = len(result.assumptions)
+    for i, check in enumerate(result.assumptions):
+        row[f"assumption{i}_test"] = strings.code(check.test_name)
+        for stat in _ASSUMPTION_STATS:
+            row[f"assumption{i}_{stat}"] = getattr(check, stat)
+        row[f"assumption{i}_passed"] = check.passed
+        row[f"assumption{i}_note"] = strings.code(check.note)
+    row["notes"] = note_sets.code(tuple(result.notes))
+    row["has_adjusted_p_value"] = result.adjusted_p_value is not None
+    if result.adjusted_p_value is not None:
+        row["adjusted_p_value"] = result.adjusted_p_value
+    row["p_adjustment"] = strings.code(result.p_adjustment)
+
+
+def _encode_two_group(result: TwoGroupComparisonResult, strings: _Interner, note_sets: _Interner) -> dict[str, Any]:
+    row: dict[str, Any] = {
+        "estimand": strings.code(result.estimand),
+        "method": strings.code(result.method),
+        "alternative": strings.code(result.alternative),
+        "statistic": result.statistic,
+        "p_value": result.p_value,
+        "estimate": result.estimate,
+        "estimate_label": strings.code(result.estimate_label),
+        "n1": result.n1,
+        "n2": result.n2,
+        "has_df": result.df is not None,
+    }
+    if result.df is not None:
+        row["df"] = result.df
+    _put_ci(row, "ci", result.ci)
+    effect = result.effect_size
+    row["has_effect_size"] = effect is not None
+    if effect is not None:
+        row["effect_size_name"] = strings.code(effect.name)
+        row["effect_size_value"] = effect.value
+        row["effect_size_interpretation"] = strings.code(effect.interpretation)
+    _put_ci(row, "effect_size_ci", None if effect is None else effect.ci)
+    _put_descriptives(row, "group1", result.group1_descriptives, note_sets)
+    _put_descriptives(row, "group2", result.group2_descriptives, note_sets)
+    permutation = result.permutation
+    row["has_permutation"] = permutation is not None
+    if permutation is not None:
+        row["permutation_n_resamples"] = permutation.n_resamples
+        row["permutation_exact"] = permutation.exact
+        row["permutation_mc_error"] = permutation.mc_error
+        row["permutation_stopped_early"] = permutation.stopped_early
+    _put_common(row, result, strings, note_sets)
+    return row
+
+
+def _encode_correlation(result: CorrelationResult, strings: _Interner, note_sets: _Interner) -> dict[str, Any]:
+    row: dict[str, Any] = {
+        "method": strings.code(result.method),
+        "alternative": strings.code(result.alternative),
+        "coefficient": result.coefficient,
+        "p_value": result.p_value,
+        "n": result.n,
+    }
+    _put_ci(row, "ci", result.ci)
+    _put_descriptives(row, "x", result.x_descriptives, note_sets)
+    _put_descriptives(row, "y", result.y_descriptives, note_sets)
+    _put_common(row, result, strings, note_sets)
+    return row
+
+
+def _missing_value(dtype: np.dtype) -> Any:
+    # Fill for absent optional values: NaN for floats, -1 (None) for codes, 0/False otherwise.
+    if dtype.kind == "f":
+        return np.nan
+    if dtype == np.int32:
+        return -1
+    return 0
+
+
+# ------------------------------
+# Decoding: columns -> to_dict() layout
+# ------------------------------
+
+
+def _text(strings: tuple[str, ...], code: int) -> Optional[str]:
+    return None if code < 0 else strings[code]
+
+
+def _ci_dict(row: dict[str, Any], prefix: str) -> Optional[dict[str, Any]]:
+    if not row[f"has_{prefix}"]:
+        return None
+    return {"level": row[f"{prefix}_level"], "lower": row[f"{prefix}_lower"], "upper": row[f"{prefix}_upper"]}
+
+
+def _descriptives_dict(row: dict[str, Any], prefix: str, note_sets: tuple[tuple[str, ...], ...]) -> dict[str, Any]:
+    out: dict[str, Any] = {"n": row[f"{prefix}_n"]}
+    out.update((stat, row[f"{prefix}_{stat}"]) for stat in _DESCRIPTIVE_STATS)
+    out["notes"] = note_sets[row[f"{prefix}_notes"]]
+    return out
+
+
+def _assumption_dicts(row: dict[str, Any], strings: tuple[str, ...]) -> list[dict[str, Any]]:
+    return [
+        {
+            "test_name": strings[row[f"assumption{i}_test"]],
+            "statistic": row[f"assumption{i}_statistic"],
+            "p_value": row[f"assumption{i}_p_value"],
+            "alpha": row[f"assumption{i}_alpha"],
+            "passed": row[f"assumption{i}_passed"],
+            "note": strings[row[f"assumption{i}_note"]],
+        }
+        for i in range(row["n_assumptions"])
+    ]
+
+
+def _decode_two_group(
+    row: dict[str, Any], strings: tuple[str, ...], note_sets: tuple[tuple[str, ...], ...]
+) -> dict[str, Any]:
+    effect = None
+    if row["has_effect_size"]:
+        effect = {
+            "name": strings[row["effect_size_name"]],
+            "value": row["effect_size_value"],
+            "interpretation": _text(strings, row["effect_size_interpretation"]),
+            "ci": _ci_dict(row, "effect_size_ci"),
+        }
+    permutation = None
+    # Tables exported before schema 2 have no permutation columns.
+    if row.get("has_permutation", False):
+        permutation = {
+            "n_resamples": row["permutation_n_resamples"],
+            "exact": row["permutation_exact"],
+            "mc_error": row["permutation_mc_error"],
+            "stopped_early": row["permutation_stopped_early"],
+        }
+    return {
+        "estimand": strings[row["estimand"]],
+        "method": strings[row["method"]],
+        "alternative": strings[row["alternative"]],
+        "statistic": row["statistic"],
+        "p_value": row["p_value"],
+        "estimate": row["estimate"],
+        "estimate_label": strings[row["estimate_label"]],
+        "ci": _ci_dict(row, "ci"),
+        "effect_size": effect,
+        "n1": row["n1"],
+        "n2": row["n2"],
+        "group1_descriptives": _descriptives_dict(row, "group1", note_sets),
+        "group2_descriptives": _descriptives_dict(row, "group2", note_sets),
+        "df": row["df"] if row["has_df"] else None,
+        "assumptions": _assumption_dicts(row, strings),
+        "notes": note_sets[row["notes"]],
+        "adjusted_p_value": row["adjusted_p_value"] if row["has_adjusted_p_value"] else None,
+        "p_adjustment": _text(strings, row["p_adjustment"]),
+        "permutation": permutation,
+    }
+
+
+def _decode_correlation(
+    row: dict[str, Any], strings: tuple[str, ...], note_sets: tuple[tuple[str, ...], ...]
+) -> dict[str, Any]:
+    return {
+        "method": strings[row["method"]],
+        "alternative": strings[row["alternative"]],
+        "coefficient": row["coefficient"],
+        "p_value": row["p_value"],
+        "n": row["n"],
+        "ci": _ci_dict(row, "ci"),
+        "x_descriptives": _descriptives_dict(row, "x", note_sets),
+        "y_descriptives": _descriptives_dict(row, "y", note_sets),
+        "assumptions": _assumption_dicts(row, strings),
+        "notes": note_sets[row["notes"]],
+        "adjusted_p_value": row["adjusted_p_value"] if row["has_adjusted_p_value"] else None,
+        "p_adjustment": _text(strings, row["p_adjustment"]),
+    }
+
+
+def _ci_from_dict(data: Optional[dict[str, Any]]) -> Optional[ConfidenceInterval]:
+    return None if data is None else ConfidenceInterval(**data)
+
+
+def _result_from_dict(kind: ResultKind, data: dict[str, Any]) -> AnalysisResult:
+    assumptions = tuple(AssumptionCheck(**check) for check in data["assumptions"])
+    if kind == "correlation":
+        return CorrelationResult(
+            **{
+                **data,
+                "ci": _ci_from_dict(data["ci"]),
+                "x_descriptives": DescriptiveStats(**data["x_descriptives"]),
+                "y_descriptives": DescriptiveStats(**data["y_descriptives"]),
+                "assumptions": assumptions,
+            }
+        )
+    effect = data["effect_size"]
+    if effect is not None:
+        effect = EffectSize(**{**effect, "ci": _ci_from_dict(effect["ci"])})
+    permutation = data.get("permutation")
+    return TwoGroupComparisonResult(
+        **{
+            **data,
+            "ci": _ci_from_dict(data["ci"]),
+            "effect_size": effect,
+            "group1_descriptives": DescriptiveStats(**data["group1_descriptives"]),
+            "group2_descriptives": DescriptiveStats(**data["group2_descriptives"]),
+            "assumptions": assumptions,
+            "permutation": None if permutation is None else PermutationSummary(**permutation),
+        }
+    )
+
+
+@dataclass(frozen=True, eq=False)
+class ResultTable:
+    """
+    Columnar collection of ``TwoGroupComparisonResult`` or ``CorrelationResult`` rows.
+
+    ``data`` is a NumPy structured array with one record per result: nested dataclasses
+    are flattened into prefixed fields (``ci_lower``, ``group1_sd``, ``assumption0_p_value``,
+    ...), optional values carry a ``has_*`` flag, and every string is interned. ``int32``
+    fields are codes: those named ``*notes`` index ``note_sets`` (one entry per distinct
+    tuple of notes), the others index ``strings``, with ``-1`` standing for ``None``.
+    A long note repeated on 100k rows is therefore stored once.
+
+    Indexing with an integer decodes that row into its dataclass on demand; slicing
+    returns a table whose ``data`` is a view (no copy) sharing the same pools; integer
+    or boolean arrays select rows into a copy. ``to_dicts`` and ``iter_dicts`` produce
+    the ``to_dict()`` layout column by column, without per-object ``asdict``.
+    """
+
+    kind: ResultKind
+    data: np.ndarray
+    strings: tuple[str, ...]
+    note_sets: tuple[tuple[str, ...], ...]
+
+    @classmethod
+    def from_results(cls, results: Iterable[AnalysisResult], *, kind: Optional[ResultKind] = None) -> ResultTable:
+        """Build a table from result objects, which must all be of one type."""
+        rows = list(results)
+        if kind is None:
+            if not rows:
+                raise ValueError("Cannot infer the result kind of an empty collection; pass kind=.")
+            kind = "correlation" if isinstance(rows[0], CorrelationResult) else "two_group"
+        if kind not in ("two_group", "correlation"):
+            raise ValueError("kind must be 'two_group' or 'correlation'.")
+        expected = TwoGroupComparisonResult if kind == "two_group" else CorrelationResult
+        if not all(isinstance(result, expected) for result in rows):
+            raise ValueError(f"All results must be {expected.__name__} instances.")
+
+        max_assumptions = max((len(result.assumptions) for result in rows), default=0)
+        dtype = _table_dtype(kind, max_assumptions)
+        names = dtype.names or ()
+        # Absent optional values keep these fills; each row dict then becomes a record tuple in C.
+        missing = {name: _missing_value(dtype[name]) for name in names}
+        as_record = itemgetter(*names)
+        strings, note_sets = _Interner(), _Interner()
+        encode = _encode_two_group if kind == "two_group" else _encode_correlation
+        records = [as_record({**missing, **encode(result, strings, note_sets)}) for result in rows]  # type: ignore[arg-type]
+        data = np.array(records, dtype=dtype)
+        return cls(kind=kind, data=data, strings=tuple(strings.values), note_sets=tuple(note_sets.values))
+
+    def __len__(self) -> int:
+        return int(self.data.shape[0])
+
+    @overload
+    def __getitem__(self, index: int) -> AnalysisResult: ...
+
+    @overload
+    def __getitem__(self, index: Union[slice, np.ndarray]) -> ResultTable: ...
+
+    def __getitem__(self, index: Union[int, slice, np.ndarray]) -> Union[AnalysisResult, ResultTable]:
+        if isinstance(index, (int, np.integer)):
+            position = range(len(self))[index]
+            (row,) = self._decode(self.data[position : position + 1])
+            return _result_from_dict(self.kind, row)
+        return ResultTable(kind=self.kind, data=self.data[index], strings=self.strings, note_sets=self.note_sets)
+
+    def __iter__(self) -> Iterator[AnalysisResult]:
+        for row in self.iter_dicts():
+            yield _result_from_dict(self.kind, row)
+
+    def __repr__(self) -> str:
+        return f"ResultTable(kind={self.kind!r}, rows={len(self)})"
+
+    def column(self, name: str, *, decode: bool = False) -> Any:
+        """
+        One field as a NumPy view; ``decode=True`` maps code fields back to their
+        strings or note tuples (as a list).
+        """
+        values = self.data[name]
+        if not decode or values.dtype != np.int32:
+            return values
+        pool: tuple[Any, ...] = self.note_sets if name.endswith("notes") else self.strings
+        return [None if code < 0 else pool[code] for code in values.tolist()]
+
+    def columns(self) -> dict[str, np.ndarray]:
+        return {name: self.data[name] for name in self.data.dtype.names or ()}
+
+    def iter_dicts(self) -> Iterator[dict[str, Any]]:
+        """Yield each row in the ``to_dict()`` layout, decoding a block of rows at a time."""
+        for start in range(0, len(self), _DECODE_BLOCK):
+            yield from self._decode(self.data[start : start + _DECODE_BLOCK])
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        return list(self.iter_dicts())
+
+    def _decode(self, block: np.ndarray) -> Iterator[dict[str, Any]]:
+        names = block.dtype.names or ()
+        # One tolist() per field turns the whole block into Python scalars at C speed.
+        columns = [block[name].tolist() for name in names]
+        decode = _decode_two_group if self.kind == "two_group" else _decode_correlation
+        for values in zip(*columns):
+            yield decode(dict(zip(names, values)), self.strings, self.note_sets)
+
+
+__all__ = ["ResultTable"]
@@ -0,0 +1,287 @@
+import unittest
+
+import numpy as np
+from scipy.stats import pearsonr, spearmanr
+
+from stats4science import batch as b
+from stats4science import inferential_stats as s
+
+
+class TestCompareIndependentGroupsBatch(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(21)
+        self.pairs = [
+            (rng.normal(loc=0.3 * i, scale=1.0 + 0.1 * i, size=5 + i), rng.normal(size=4 + 2 * i)) for i in range(12)
+        ]
+
+    def test_ragged_pairs_match_single_call_results(self) -> None:
+        for method in ("welch", "student"):
+            for alternative in ("two-sided", "greater", "less"):
+                with self.subTest(method=method, alternative=alternative):
+                    res = b.compare_independent_groups_batch(self.pairs, method=method, alternative=alternative)  # type: ignore[arg-type]
+                    self.assertEqual(len(res), len(self.pairs))
+                    for i, (x, y) in enumerate(self.pairs):
+                        single = s.compare_independent_groups(x, y, method=method, alternative=alternative)  # type: ignore[arg-type]
+                        assert single.ci is not None and single.effect_size is not None and single.df is not None
+                        self.assertEqual(res.method, single.method)
+                        self.assertAlmostEqual(res.estimate[i], single.estimate, places=12)
+                        self.assertAlmostEqual(res.statistic[i], single.statistic, places=10)
+                        self.assertAlmostEqual(res.p_value[i], single.p_value, places=12)
+                        self.assertAlmostEqual(res.df[i], single.df, places=10)
+                        self.assertAlmostEqual(res.ci_lower[i], single.ci.lower, places=10)
+                        self.assertAlmostEqual(res.ci_upper[i], single.ci.upper, places=10)
+                        self.assertAlmostEqual(res.hedges_g[i], single.effect_size.value, places=12)
+                        self.assertAlmostEqual(res.sd1[i], single.group1_descriptives.sd, places=12)
+
+    def test_padded_input_matches_ragged_input(self) -> None:
+        width1 = max(x.size for x, _ in self.pairs)
+        width2 = max(y.size for _, y in self.pairs)
+        group1 = np.full((len(self.pairs), width1), np.nan)
+        group2 = np.full((len(self.pairs), width2), np.nan)
+        for i, (x, y) in enumerate(self.pairs):
+            group1[i, : x.size] = x
+            group2[i, : y.size] = y
+        padded = b.compare_independent_groups_batch(
+            group1=group1,
+            group2=group2,
+            lengths1=[x.size for x, _ in self.pairs],
+            lengths2=[y.size for _, y in self.pairs],
+        )
+        ragged = b.compare_independent_groups_batch(self.pairs)
+        for name, column in ragged.columns().items():
+            with self.subTest(column=name):
+                np.testing.assert_allclose(padded.columns()[name], column, rtol=1e-12, atol=1e-12)
+
+    def test_zero_variance_pairs_do_not_raise(self) -> None:
+        res = b.compare_independent_groups_batch(
+            [([1.0, 1.0], [2.0, 2.0]), ([1.0, 1.0], [1.0, 1.0]), ([1.0, 2.0, 3.0], [2.0, 4.0])]
+        )
+        self.assertEqual(res.statistic[0], -np.inf)
+        self.assertTrue(np.isnan(res.hedges_g[0]))
+        self.assertTrue(np.isnan(res.statistic[1]))
+        self.assertTrue(np.isfinite(res.statistic[2]))
+        self.assertEqual(res.to_dict()["n1"], [2, 2, 3])
+
+    def test_validation_errors(self) -> None:
+        with self.assertRaisesRegex(ValueError, r"At least 2 observations"):
+            b.compare_independent_groups_batch([([1.0], [1.0, 2.0])])
+        with self.assertRaisesRegex(ValueError, r"contain NaN"):
+            b.compare_independent_groups_batch([([1.0, float("nan")], [1.0, 2.0])])
+        with self.assertRaisesRegex(ValueError, r"method must be 'welch' or 'student'"):
+            b.compare_independent_groups_batch(self.pairs, method="mannwhitney")
+        with self.assertRaisesRegex(ValueError, r"not both"):
+            b.compare_independent_groups_batch(self.pairs, group1=np.zeros((1, 2)), group2=np.zeros((1, 2)))
+        with self.assertRaisesRegex(ValueError, r"must not exceed the row width"):
+            b.compare_independent_groups_batch(group1=np.zeros((1, 2)), group2=np.zeros((1, 2)), lengths1=[3])
+
+
+class TestCompareFromSummary(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(4)
+        self.pairs = [(rng.normal(loc=0.2 * i, size=6 + i), rng.normal(scale=2.0, size=5 + 3 * i)) for i in range(6)]
+
+    @staticmethod
+    def _summaries(x: np.ndarray, y: np.ndarray) -> tuple[int, float, float, int, float, float]:
+        return x.size, float(np.mean(x)), float(np.std(x, ddof=1)), y.size, float(np.mean(y)), float(np.std(y, ddof=1))
+
+    def test_scalar_summaries_match_raw_data_analysis(self) -> None:
+        for method in ("welch", "student"):
+            for alternative in ("two-sided", "greater", "less"):
+                with self.subTest(method=method, alternative=alternative):
+                    x, y = self.pairs[3]
+                    raw = s.compare_independent_groups(x, y, method=method, alternative=alternative)  # type: ignore[arg-type]
+                    res = b.compare_from_summary(*self._summaries(x, y), method=method, alternative=alternative)  # type: ignore[arg-type]
+                    assert isinstance(res, s.TwoGroupComparisonResult)
+                    assert res.ci is not None and raw.ci is not None
+                    assert res.effect_size is not None and raw.effect_size is not None
+                    self.assertEqual(res.method, raw.method)
+                    self.assertAlmostEqual(res.statistic, raw.statistic, places=10)
+                    self.assertAlmostEqual(res.p_value, raw.p_value, places=12)
+                    assert res.df is not None and raw.df is not None
+                    self.assertAlmostEqual(res.df, raw.df, places=10)
+                    self.assertAlmostEqual(res.ci.lower, raw.ci.lower, places=10)
+                    self.assertAlmostEqual(res.ci.upper, raw.ci.upper, places=10)
+                    self.assertAlmostEqual(res.effect_size.value, raw.effect_size.value, places=12)
+                    self.assertEqual(res.assumptions, ())
+                    self.assertIn("diagnostics are unavailable", res.notes[-1])
+                    self.assertTrue(np.isnan(res.group1_descriptives.median))
+        assert isinstance(res, s.TwoGroupComparisonResult)
+        self.assertIn("mean difference", s.report_two_group(res))
+
+    def test_array_summaries_match_batch_results(self) -> None:
+        columns = np.array([self._summaries(x, y) for x, y in self.pairs]).T
+        res = b.compare_from_summary(*columns, alternative="greater")
+        expected = b.compare_independent_groups_batch(self.pairs, alternative="greater")
+        assert isinstance(res, b.TwoGroupBatchResult)
+        for name, column in expected.columns().items():
+            np.testing.assert_allclose(res.columns()[name], column, rtol=1e-12, err_msg=name)
+
+    def test_broadcasting_and_validation(self) -> None:
+        res = b.compare_from_summary(10, [0.0, 0.5, 1.0], 1.0, 12, 0.0, [1.0, 2.0, 0.0])
+        self.assertEqual(len(res), 3)  # type: ignore[arg-type]
+        with self.assertRaisesRegex(ValueError, r"n1 must contain integer counts"):
+            b.compare_from_summary(1, 0.0, 1.0, 5, 0.0, 1.0)
+        with self.assertRaisesRegex(ValueError, r"n2 must contain integer counts"):
+            b.compare_from_summary(5, 0.0, 1.0, 5.5, 0.0, 1.0)
+        with self.assertRaisesRegex(ValueError, r"non-negative"):
+            b.compare_from_summary(5, 0.0, -1.0, 5, 0.0, 1.0)
+        with self.assertRaisesRegex(ValueError, r"finite"):
+            b.compare_from_summary(5, float("nan"), 1.0, 5, 0.0, 1.0)
+        with self.assertRaisesRegex(ValueError, r"pooled standard deviation is zero"):
+            b.compare_from_summary(5, 0.0, 0.0, 5, 1.0, 0.0)
+
+
+class TestCompareByGroup(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(8)
+        # Segment sizes include small tie-free ones (exact Mann-Whitney p-values) and
+        # rounded, tied ones; segment "b" has a single control observation.
+        sizes = {"a": (6, 7), "b": (4, 1), "c": (30, 25), "d": (3, 9), "e": (12, 12)}
+        values, groups, segments = [], [], []
+        for name, (n_treated, n_control) in sizes.items():
+            treated = rng.normal(loc=0.4, size=n_treated)
+            control = rng.normal(size=n_control)
+            if name in {"c", "e"}:
+                treated, control = np.round(treated, 1), np.round(control, 1)
+            values += [*treated, *control]
+            groups += [True] * n_treated + [False] * n_control
+            segments += [name] * (n_treated + n_control)
+        order = rng.permutation(len(values))
+        self.values = np.array(values)[order]
+        self.groups = np.array(groups)[order]
+        self.segments = np.array(segments)[order]
+
+    def _slices(self, segment: str) -> tuple[np.ndarray, np.ndarray]:
+        in_segment = self.segments == segment
+        return self.values[in_segment & self.groups], self.values[in_segment & ~self.groups]
+
+    def test_mean_difference_matches_per_segment_analysis(self) -> None:
+        for method in ("welch", "student"):
+            for alternative in ("two-sided", "less"):
+                with self.subTest(method=method, alternative=alternative):
+                    res = b.compare_by_group(
+                        self.values,
+                        self.groups,
+                        self.segments,
+                        group1=True,
+                        method=method,
+                        alternative=alternative,  # type: ignore[arg-type]
+                    )
+                    self.assertEqual(res.segments.tolist(), ["a", "b", "c", "d", "e"])
+                    self.assertEqual((res.group1, res.group2, res.effect_size_name), (True, False, "Hedges_g"))
+                    for i, segment in enumerate(res.segments):
+                        x, y = self._slices(segment)
+                        if segment == "b":
+                            self.assertEqual((res.n1[i], res.n2[i]), (4, 1))
+                            self.assertTrue(np.isnan(res.p_value[i]) and np.isnan(res.effect_size[i]))
+                            continue
+                        single = s.compare_independent_groups(x, y, method=method, alternative=alternative)  # type: ignore[arg-type]
+                        assert single.ci is not None and single.effect_size is not None and single.df is not None
+                        self.assertEqual(res.method, single.method)
+                        self.assertAlmostEqual(res.estimate[i], single.estimate, places=12)
+                        self.assertAlmostEqual(res.statistic[i], single.statistic, places=10)
+                        self.assertAlmostEqual(res.p_value[i], single.p_value, places=12)
+                        self.assertAlmostEqual(res.df[i], single.df, places=10)
+                        self.assertAlmostEqual(res.ci_lower[i], single.ci.lower, places=10)
+                        self.assertAlmostEqual(res.ci_upper[i], single.ci.upper, places=10)
+                        self.assertAlmostEqual(res.effect_size[i], single.effect_size.value, places=12)
+                        self.assertAlmostEqual(res.sd2[i], single.group2_descriptives.sd, places=12)
+                    self.assertIn("1 segment(s) have fewer than 2 observations", res.notes[-1])
+
+    def test_stochastic_dominance_matches_per_segment_analysis(self) -> None:
+        for alternative in ("two-sided", "greater", "less"):
+            with self.subTest(alternative=alternative):
+                res = b.compare_by_group(
+                    self.values,
+                    self.groups,
+                    self.segments,
+                    group1=True,
+                    estimand="stochastic_dominance",
+                    alternative=alternative,  # type: ignore[arg-type]
+                )
+                self.assertEqual((res.method, res.effect_size_name), ("Mann_Whitney_U", "Cliffs_delta"))
+                for i, segment in enumerate(res.segments):
+                    if segment == "b":
+                        self.assertTrue(np.isnan(res.statistic[i]))
+                        continue
+                    x, y = self._slices(segment)
+                    single = s.compare_independent_groups(
+                        x,
+                        y,
+                        estimand="stochastic_dominance",
+                        alternative=alternative,  # type: ignore[arg-type]
+                        bootstrap=s.BootstrapConfig(n_resamples=200, random_state=0),
+                    )
+                    assert single.effect_size is not None
+                    self.assertAlmostEqual(res.statistic[i], single.statistic, places=10)
+                    self.assertAlmostEqual(res.p_value[i], single.p_value, places=12)
+                    self.assertAlmostEqual(res.estimate[i], single.estimate, places=12)
+                    self.assertAlmostEqual(res.effect_size[i], single.effect_size.value, places=12)
+                    self.assertTrue(np.isnan(res.df[i]) and np.isnan(res.ci_lower[i]))
+        self.assertEqual(res.to_dict()["segments"], ["a", "b", "c", "d", "e"])
+
+    def test_default_group_order_and_validation_errors(self) -> None:
+        res = b.compare_by_group(self.values, self.groups, self.segments)
+        self.assertEqual((res.group1, res.group2), (False, True))
+        self.assertEqual(res.to_dict()["group1"], False)
+        with self.assertRaisesRegex(ValueError, r"same length"):
+            b.compare_by_group(self.values[:-1], self.groups, self.segments)
+        with self.assertRaisesRegex(ValueError, r"exactly two distinct labels"):
+            b.compare_by_group([1.0, 2.0, 3.0], ["a", "b", "c"], [0, 0, 0])
+        with self.assertRaisesRegex(ValueError, r"does not occur"):
+            b.compare_by_group(self.values, self.groups, self.segments, group1="treated")
+        with self.assertRaisesRegex(ValueError, r"contain NaN"):
+            b.compare_by_group([1.0, float("nan")], [0, 1], [0, 0])
+        with self.assertRaisesRegex(ValueError, r"method must be 'mannwhitney'"):
+            b.compare_by_group(self.values, self.groups, self.segments, estimand="stochastic_dominance", method="welch")
+
+
+class TestCorrelationMatrix(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(4)
+        self.data = rng.normal(size=(40, 5))
+        self.data[:, 1] += self.data[:, 0]
+        self.data[:, 3] = np.round(self.data[:, 3])  # ties for Spearman
+
+    def test_matches_pairwise_scipy_and_pearson_ci(self) -> None:
+        for method, reference in (("pearson", pearsonr), ("spearman", spearmanr)):
+            res = b.correlation_matrix(self.data, method=method)  # type: ignore[arg-type]
+            self.assertEqual(res.coefficient.shape, (5, 5))
+            for i in range(5):
+                for j in range(5):
+                    if i == j:
+                        continue
+                    with self.subTest(method=method, i=i, j=j):
+                        expected = reference(self.data[:, i], self.data[:, j])
+                        self.assertAlmostEqual(res.coefficient[i, j], float(expected.statistic), places=12)
+                        self.assertAlmostEqual(res.p_value[i, j], float(expected.pvalue), places=12)
+                        if method == "pearson":
+                            ci = s._pearson_ci(res.coefficient[i, j], 40, 0.95, "two-sided")
+                            self.assertAlmostEqual(res.ci_lower[i, j], ci.lower, places=12)
+                            self.assertAlmostEqual(res.ci_upper[i, j], ci.upper, places=12)
+            np.testing.assert_array_equal(np.diag(res.coefficient), np.ones(5))
+
+    def test_upper_triangle_blocks_match_full_matrix(self) -> None:
+        full = b.correlation_matrix(self.data, alternative="greater")
+        condensed = b.correlation_matrix(self.data, alternative="greater", upper_triangle=True, block_size=2)
+        self.assertTrue(condensed.condensed)
+        assert condensed.row is not None and condensed.col is not None
+        self.assertEqual(condensed.coefficient.shape, (10,))
+        for name in ("coefficient", "p_value", "ci_lower", "ci_upper"):
+            with self.subTest(column=name):
+                expected = getattr(full, name)[condensed.row, condensed.col]
+                np.testing.assert_allclose(getattr(condensed, name), expected, rtol=1e-12, atol=1e-12)
+
+    def test_validation_errors(self) -> None:
+        with self.assertRaisesRegex(ValueError, r"column 2 has zero variance"):
+            data = self.data.copy()
+            data[:, 2] = 3.0
+            b.correlation_matrix(data)
+        with self.assertRaisesRegex(ValueError, r"at least 4 observations"):
+            b.correlation_matrix(self.data[:3])
+        with self.assertRaisesRegex(ValueError, r"method must be"):
+            b.correlation_matrix(self.data, method="kendall")  # type: ignore[arg-type]
+
+
+if __name__ == "__main__":
+    unittest.main()
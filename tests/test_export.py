@@ -0,0 +1,135 @@
+import io
+import json
+import zipfile
+import tempfile
+import unittest
+from pathlib import Path
+from dataclasses import replace
+
+import numpy as np
+
+import stats4science as stats
+from stats4science import export
+from stats4science.tables import ResultTable
+
+
+class TestExport(unittest.TestCase):
+    comparisons: list[stats.TwoGroupComparisonResult]
+    correlations: list[stats.CorrelationResult]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        rng = np.random.default_rng(22)
+        config = stats.BootstrapConfig(n_resamples=200)
+        cls.comparisons = stats.adjust_results(
+            [
+                stats.compare_independent_groups(
+                    rng.normal(size=14),
+                    rng.normal(loc=0.4, size=11),
+                    estimand=estimand,  # type: ignore[arg-type]
+                    bootstrap=config,
+                )
+                for estimand in ("mean_difference", "stochastic_dominance")
+            ],
+            method="holm",
+        )
+        cls.correlations = [
+            stats.correlation(rng.normal(size=20), rng.normal(size=20), method=method, bootstrap=config)  # type: ignore[arg-type]
+            for method in ("pearson", "spearman")
+        ]
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def test_jsonl_streams_mixed_results_and_reads_them_back(self) -> None:
+        results: list[stats.TwoGroupComparisonResult | stats.CorrelationResult]
+        results = [*self.comparisons, *self.correlations, self.comparisons[0]]
+        path = self.directory / "results.jsonl"
+        count = stats.write_jsonl(iter(results), path)
+        self.assertEqual(count, len(results))
+        lines = path.read_text().splitlines()
+        self.assertEqual(len(lines), len(results) + 1)
+        header = json.loads(lines[0])["metadata"]
+        self.assertEqual(header["schema_version"], export.SCHEMA_VERSION)
+        self.assertEqual(header["stats4science_version"], stats.__version__)
+        self.assertEqual(json.loads(lines[1]), json.loads(json.dumps(results[0].to_dict())))
+        self.assertEqual(list(stats.read_jsonl(path)), results)
+
+    def test_jsonl_accepts_tables_and_streams_without_a_header(self) -> None:
+        stream = io.StringIO()
+        stats.write_jsonl(ResultTable.from_results(self.correlations), stream, header=False)
+        stream.seek(0)
+        self.assertEqual(list(stats.read_jsonl(stream)), self.correlations)
+
+    def test_npz_round_trips_through_the_lazy_reader(self) -> None:
+        path = self.directory / "results.npz"
+        stats.save_npz(self.comparisons * 3, path)
+        with zipfile.ZipFile(path) as archive:
+            self.assertTrue(all(info.compress_type == zipfile.ZIP_STORED for info in archive.infolist()))
+        stored = stats.load_npz(path)
+        self.assertEqual(len(stored), 6)
+        self.assertEqual(stored.kind, "two_group")
+        p_values = stored.column("p_value")
+        self.assertIsInstance(p_values, np.memmap)
+        np.testing.assert_array_equal(p_values, [result.p_value for result in self.comparisons * 3])
+        self.assertEqual(stored.column("method", decode=True)[:2], ["Welch_t_test", "Mann_Whitney_U"])
+        self.assertEqual(stored[-1], self.comparisons[1])
+        self.assertEqual(list(stored), self.comparisons * 3)
+        self.assertEqual(stored.table(slice(2, 4)).to_dicts(), [result.to_dict() for result in self.comparisons])
+
+    def test_npz_without_mmap_and_empty_tables(self) -> None:
+        path = self.directory / "correlations.npz"
+        stats.save_npz(ResultTable.from_results(self.correlations), path)
+        stored = stats.load_npz(path, mmap=False)
+        self.assertNotIsInstance(stored.column("coefficient"), np.memmap)
+        self.assertEqual(list(stored), self.correlations)
+        empty = self.directory / "empty.npz"
+        stats.save_npz(ResultTable.from_results([], kind="correlation"), empty)
+        self.assertEqual(list(stats.load_npz(empty)), [])
+
+    def test_permutation_summaries_round_trip_and_schema_1_files_still_read(self) -> None:
+        rng = np.random.default_rng(23)
+        results = [
+            stats.permutation_test(rng.normal(size=6), rng.normal(size=5)),
+            stats.permutation_test(
+                rng.normal(size=30), rng.normal(size=30), config=stats.PermutationConfig(max_resamples=500)
+            ),
+            self.comparisons[0],
+        ]
+        path = self.directory / "permutation.npz"
+        stats.save_npz(results, path)
+        self.assertEqual(list(stats.load_npz(path)), results)
+        stream = io.StringIO()
+        stats.write_jsonl(results, stream)
+        self.assertEqual(list(stats.read_jsonl(io.StringIO(stream.getvalue()))), results)
+        # Schema 1 had no permutation summary: records lack the key, tables the columns.
+        header, *records = (json.loads(line) for line in stream.getvalue().splitlines())
+        header["metadata"]["schema_version"] = 1
+        for record in records:
+            del record["permutation"]
+        old_lines = "\n".join(json.dumps(record) for record in [header, *records])
+        expected = [replace(result, permutation=None) for result in results]
+        self.assertEqual(list(stats.read_jsonl(io.StringIO(old_lines))), expected)
+        table = ResultTable.from_results(results)
+        names = [
+            name for name in table.data.dtype.names or () if not name.startswith(("has_permutation", "permutation_"))
+        ]
+        old = ResultTable(kind="two_group", data=table.data[names], strings=table.strings, note_sets=table.note_sets)
+        self.assertEqual(list(old), expected)
+
+    def test_newer_schema_versions_are_rejected(self) -> None:
+        stream = io.StringIO()
+        stats.write_jsonl(self.correlations, stream)
+        lines = stream.getvalue().splitlines()
+        header = json.loads(lines[0])
+        header["metadata"]["schema_version"] = export.SCHEMA_VERSION + 1
+        with self.assertRaisesRegex(ValueError, rf"export schema {export.SCHEMA_VERSION + 1}"):
+            list(stats.read_jsonl(io.StringIO("\n".join([json.dumps(header), *lines[1:]]))))
+        with self.assertRaisesRegex(ValueError, r"not a stats4science results export"):
+            list(stats.read_jsonl(io.StringIO(json.dumps({"metadata": {"format": "other"}}))))
+
+
+if __name__ == "__main__":
+    unittest.main()
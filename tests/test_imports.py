@@ -0,0 +1,61 @@
+import sys
+import tempfile
+import unittest
+import subprocess
+from pathlib import Path
+
+import numpy as np
+
+import stats4science as stats
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _loaded_modules(code: str) -> set[str]:
+    # A fresh interpreter, so modules imported by this test process do not count.
+    script = f"import sys\n{code}\nprint('\\n'.join(sys.modules))"
+    output = subprocess.run(
+        [sys.executable, "-c", script], cwd=PACKAGE_ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return {name.split(".")[0] for name in output.split()}
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_every_public_name_resolves_to_its_submodule(self) -> None:
+        self.assertEqual(set(stats._EXPORTS), set(stats.__all__) - {"__version__"})
+        for name, module in stats._EXPORTS.items():
+            with self.subTest(name=name):
+                self.assertIs(getattr(stats, name), getattr(getattr(stats, module), name))
+        self.assertLessEqual(set(stats.__all__), set(dir(stats)))
+        with self.assertRaisesRegex(AttributeError, r"no attribute 'ttest'"):
+            stats.ttest  # noqa: B018
+
+    def test_importing_the_package_loads_neither_numpy_nor_scipy(self) -> None:
+        loaded = _loaded_modules("import stats4science\nstats4science.__version__")
+        self.assertNotIn("numpy", loaded)
+        self.assertNotIn("scipy", loaded)
+
+    def test_formatting_stored_reports_needs_only_numpy(self) -> None:
+        rng = np.random.default_rng(5)
+        result = stats.compare_independent_groups(rng.normal(size=20), rng.normal(size=20))
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "results.jsonl"
+            stats.write_jsonl([result], path)
+            loaded = _loaded_modules(
+                "import stats4science as stats\n"
+                f"(result,) = stats.read_jsonl({str(path)!r})\n"
+                "stats.report_two_group(result)\n"
+                "stats.interpret_two_group(result)"
+            )
+        self.assertIn("numpy", loaded)
+        self.assertNotIn("scipy", loaded)
+
+    def test_scipy_is_loaded_by_the_first_analysis_call(self) -> None:
+        loaded = _loaded_modules(
+            "import stats4science as stats\nstats.correlation([1.0, 2.0, 4.0, 3.0], [2.0, 1.0, 5.0, 3.5])"
+        )
+        self.assertIn("scipy", loaded)
+
+
+if __name__ == "__main__":
+    unittest.main()
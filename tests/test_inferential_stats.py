@@ -1,8 +1,10 @@
 import math
+import pickle
 import unittest
+import warnings
 
 import numpy as np
-from scipy.stats import norm, pearsonr, spearmanr, ttest_ind, mannwhitneyu
+from scipy.stats import norm, kurtosis, pearsonr, rankdata, spearmanr, ttest_ind, mannwhitneyu
 
 from stats4science import inferential_stats as s
 
@@ -46,6 +48,21 @@ class TestInferentialStats(unittest.TestCase):
         as_dict = d.to_dict()
         self.assertEqual(as_dict["n"], 4)
 
+    def test_sample_cache_matches_numpy_and_scipy(self) -> None:
+        x = np.array([3.0, 1.0, 4.0, 1.0, 5.0, 9.0, 2.0, 6.0, 5.0, 3.0])
+        sample = s._Sample(x, name="x")
+        self.assertEqual(sample.n, 10)
+        self.assertEqual(sample.mean, float(np.mean(x)))
+        self.assertEqual(sample.var, float(np.var(x, ddof=1)))
+        self.assertEqual(sample.median, float(np.median(x)))
+        np.testing.assert_array_equal(sample.sorted, np.sort(x))
+        np.testing.assert_array_equal(sample.ranks, rankdata(x))
+        self.assertIs(sample.sorted, sample.sorted)
+        d = s.describe(x)
+        self.assertAlmostEqual(d.kurtosis_fisher, float(kurtosis(x, fisher=True, bias=False)), places=12)
+        with self.assertRaisesRegex(ValueError, r"x contains NaN"):
+            s._Sample([1.0, float("nan")], name="x")
+
     def test_describe_requires_at_least_2(self) -> None:
         with self.assertRaisesRegex(ValueError, r"At least 2 observations"):
             s.describe([1.0])
@@ -109,6 +126,22 @@ class TestInferentialStats(unittest.TestCase):
         self.assertGreater(eff.value, 0)
         self.assertIn(eff.interpretation, {"negligible", "small", "medium", "large"})
 
+    def test_probability_of_superiority_matches_pairwise_definition(self) -> None:
+        rng = np.random.default_rng(3)
+        x = rng.integers(0, 6, size=37).astype(float)
+        y = rng.integers(0, 6, size=23).astype(float)
+        diffs = x[:, None] - y[None, :]
+        expected = float(np.sum(diffs > 0) + 0.5 * np.sum(diffs == 0)) / float(diffs.size)
+        self.assertEqual(s._probability_of_superiority_from_arrays(x, y), expected)
+        self.assertEqual(s._superiority_counts(x, y), (int(np.sum(diffs > 0)), int(np.sum(diffs == 0))))
+
+    def test_probability_of_superiority_scales_without_pairwise_matrix(self) -> None:
+        x = np.arange(200_000, dtype=float)
+        y = np.arange(200_000, dtype=float) + 0.5
+        # x[i] beats exactly the i values of y below it; a pairwise matrix would need 4e10 cells.
+        expected = (200_000 * 199_999 / 2) / (200_000**2)
+        self.assertAlmostEqual(s._probability_of_superiority_from_arrays(x, y), expected, places=12)
+
     def test_compare_independent_groups_mean_difference_default_is_welch(self) -> None:
         x = np.array([1.0, 2.0, 3.0, 4.0])
         y = np.array([1.0, 2.0, 1.0, 2.0])
@@ -127,6 +160,30 @@ class TestInferentialStats(unittest.TestCase):
         self.assertEqual(d["group1_descriptives"]["n"], 4)
         self.assertEqual(d["group2_descriptives"]["n"], 4)
 
+    def test_compare_independent_groups_diagnostics_policy(self) -> None:
+        rng = np.random.default_rng(12)
+        x, y = rng.normal(size=40), rng.normal(loc=0.4, scale=1.3, size=35)
+        eager = s.compare_independent_groups(x, y)
+        lazy = s.compare_independent_groups(x, y, diagnostics="lazy")
+        off = s.compare_independent_groups(x, y, diagnostics="off")
+
+        assert isinstance(lazy.assumptions, s._LazyAssumptions)
+        self.assertFalse(lazy.assumptions.evaluated)
+        self.assertEqual((lazy.statistic, lazy.p_value, lazy.ci), (eager.statistic, eager.p_value, eager.ci))
+        self.assertEqual(lazy.notes, eager.notes)
+        self.assertEqual(lazy.assumptions[0], eager.assumptions[0])
+        self.assertTrue(lazy.assumptions.evaluated)
+        self.assertEqual(lazy.assumptions, eager.assumptions)
+        self.assertEqual(lazy.to_dict(), eager.to_dict())
+        restored = pickle.loads(pickle.dumps(s.compare_independent_groups(x, y, diagnostics="lazy")))
+        self.assertEqual(restored.assumptions, tuple(eager.assumptions))
+
+        self.assertEqual(off.assumptions, ())
+        self.assertEqual(off.p_value, eager.p_value)
+        self.assertIn("diagnostics='off'", off.notes[-1])
+        with self.assertRaisesRegex(ValueError, r"diagnostics must be"):
+            s.compare_independent_groups(x, y, diagnostics="later")  # type: ignore[arg-type]
+
     def test_compare_independent_groups_student_sets_df_n_minus_2(self) -> None:
         x = np.array([1.0, 2.0, 3.0, 4.0])
         y = np.array([2.0, 3.0, 4.0, 5.0])
@@ -302,6 +359,30 @@ class TestInferentialStats(unittest.TestCase):
         self.assertAlmostEqual(ci.lower, -1.0, places=15)
         self.assertGreaterEqual(ci.upper, r)
 
+    def test_shared_rank_summary_matches_scipy_mann_whitney_and_spearman(self) -> None:
+        rng = np.random.default_rng(17)
+        cases = [
+            (rng.integers(0, 5, 12).astype(float), rng.integers(0, 5, 15).astype(float)),
+            (rng.normal(size=6), rng.normal(size=7)),
+            (rng.normal(size=40), rng.normal(loc=0.3, size=25)),
+            (np.full(5, 2.0), np.full(6, 2.0)),
+        ]
+        for alternative in ("two-sided", "less", "greater"):
+            for x, y in cases:
+                with self.subTest(alternative=alternative, n1=x.size, n2=y.size):
+                    ranks = s._rank_comparison(x, y)
+                    expected = mannwhitneyu(x, y, alternative=alternative)
+                    statistic, p_value = s._mann_whitney_test(x, y, ranks, alternative)  # type: ignore[arg-type]
+                    self.assertEqual(statistic, expected.statistic)
+                    self.assertAlmostEqual(p_value, expected.pvalue, places=14)
+                    self.assertEqual(ranks.superiority, s._probability_of_superiority_from_arrays(x, y))
+            x = rng.integers(0, 6, 30).astype(float)
+            y = x + rng.integers(0, 3, 30)
+            rho, p_value = s._spearman_test(s._Sample(x, name="x"), s._Sample(y, name="y"), alternative)  # type: ignore[arg-type]
+            expected = spearmanr(x, y, alternative=alternative)
+            self.assertAlmostEqual(rho, expected.statistic, places=14)
+            self.assertAlmostEqual(p_value, expected.pvalue, places=14)
+
     def test_probability_of_superiority_ci_is_bootstrap_reproducible(self) -> None:
         x = np.array([1.0, 2.0, 4.0, 7.0])
         y = np.array([0.0, 3.0, 3.5, 8.0])
@@ -309,6 +390,59 @@ class TestInferentialStats(unittest.TestCase):
         ci2 = s._probability_of_superiority_ci(x, y, confidence_level=0.95, alternative="two-sided")
         self.assertEqual(ci1, ci2)
 
+    def test_probability_of_superiority_resamples_match_pairwise_estimates(self) -> None:
+        x = np.array([1.0, 2.0, 2.0, 4.0, 7.0])
+        y = np.array([0.0, 2.0, 3.5, 8.0])
+        codes_x, codes_y, n_levels = s._pooled_codes(x, y)
+        batched = s._probability_of_superiority_resamples(codes_x, codes_y, n_levels, np.random.default_rng(1), 50)
+        rng = np.random.default_rng(1)
+        x_idx = rng.integers(x.size, size=(50, x.size))
+        y_idx = rng.integers(y.size, size=(50, y.size))
+        expected = [s._probability_of_superiority_from_arrays(x[i], y[j]) for i, j in zip(x_idx, y_idx)]
+        np.testing.assert_array_equal(batched, expected)
+
+    def test_probability_of_superiority_ci_chunked_bootstrap_is_reproducible(self) -> None:
+        rng = np.random.default_rng(7)
+        x = rng.normal(size=40)
+        y = rng.normal(size=30)
+        config = s.BootstrapConfig(chunk_size=64)
+        run1 = s._probability_of_superiority_ci(x, y, confidence_level=0.95, alternative="two-sided", config=config)
+        run2 = s._probability_of_superiority_ci(x, y, confidence_level=0.95, alternative="two-sided", config=config)
+        self.assertEqual(run1, run2)
+        self.assertEqual(run1.n_resamples, 5000)
+        self.assertLess(run1.ci.lower, run1.ci.upper)
+        with self.assertRaisesRegex(ValueError, r"chunk_size must be a positive integer"):
+            s.BootstrapConfig(chunk_size=0)
+
+    def test_parallel_bootstrap_is_identical_for_any_worker_count(self) -> None:
+        rng = np.random.default_rng(12)
+        x = rng.normal(size=60)
+        y = 0.4 * x + rng.normal(size=60)
+        serial = s.BootstrapConfig(n_resamples=1000, chunk_size=100)
+        expected_ps = s._probability_of_superiority_ci(
+            x, y, confidence_level=0.95, alternative="two-sided", config=serial
+        )
+        expected_rho = s._bootstrap_correlation_ci(
+            x, y, estimate=0.4, confidence_level=0.95, alternative="two-sided", config=serial
+        )
+        for n_jobs, backend in ((2, "thread"), (3, "thread"), (2, "process")):
+            with self.subTest(n_jobs=n_jobs, backend=backend):
+                config = s.BootstrapConfig(n_resamples=1000, chunk_size=100, n_jobs=n_jobs, backend=backend)  # type: ignore[arg-type]
+                ps = s._probability_of_superiority_ci(
+                    x, y, confidence_level=0.95, alternative="two-sided", config=config
+                )
+                rho = s._bootstrap_correlation_ci(
+                    x, y, estimate=0.4, confidence_level=0.95, alternative="two-sided", config=config
+                )
+                self.assertEqual(ps, expected_ps)
+                self.assertEqual(rho, expected_rho)
+
+    def test_bootstrap_config_validates_parallel_settings(self) -> None:
+        with self.assertRaisesRegex(ValueError, r"n_jobs must be a positive integer or -1"):
+            s.BootstrapConfig(n_jobs=0)
+        with self.assertRaisesRegex(ValueError, r"backend must be 'thread' or 'process'"):
+            s.BootstrapConfig(backend="dask")  # type: ignore[arg-type]
+
     def test_correlation_pearson_extreme_values_produce_bounded_intervals(self) -> None:
         cases = [
             (np.array([1.0, 2.0, 3.0, 4.0, 5.0]), np.array([2.0, 4.0, 6.0, 8.0, 10.0]), 1.0),
@@ -387,6 +521,185 @@ class TestInferentialStats(unittest.TestCase):
         # The key behavioral requirement: we do not silently substitute; we report drops.
         self.assertTrue(any("dropped" in note.lower() for note in res.notes) or len(res.notes) >= 1)
 
+    def test_spearman_resamples_match_scipy_including_degenerate_draws(self) -> None:
+        x = np.array([0.0, 0.0, 0.0, 1.0, 1.0, 2.0])
+        y = np.array([0.0, 1.0, 1.0, 3.0, 2.0, 2.0])
+        _, codes_x = np.unique(x, return_inverse=True)
+        _, codes_y = np.unique(y, return_inverse=True)
+        batched = s._spearman_resamples(codes_x, 3, codes_y, 4, np.random.default_rng(11), 300)
+        idx = np.random.default_rng(11).integers(x.size, size=(300, x.size))
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            expected = np.array([spearmanr(x[i], y[i]).statistic for i in idx])
+        np.testing.assert_array_equal(np.isnan(batched), np.isnan(expected))
+        np.testing.assert_allclose(batched[~np.isnan(batched)], expected[~np.isnan(expected)], rtol=0, atol=1e-12)
+
+    def test_correlation_spearman_bootstrap_drop_note_counts_degenerate_resamples(self) -> None:
+        x = np.array([0.0, 0.0, 0.0, 1.0])
+        y = np.array([0.0, 1.0, 2.0, 3.0])
+        res = s.correlation(x, y, method="spearman")
+        run = s._bootstrap_correlation_ci(
+            x, y, estimate=res.coefficient, confidence_level=0.95, alternative="two-sided"
+        )
+        self.assertGreater(run.n_nonfinite, 0)
+        self.assertEqual(res.ci, run.ci)
+        self.assertIn(f"dropped {run.n_nonfinite} of 5000 resamples", res.notes[1])
+
+    def test_bootstrap_config_validates_settings(self) -> None:
+        with self.assertRaisesRegex(ValueError, r"n_resamples must be a positive integer"):
+            s.BootstrapConfig(n_resamples=0)
+        with self.assertRaisesRegex(ValueError, r"ci_method must be"):
+            s.BootstrapConfig(ci_method="normal")  # type: ignore[arg-type]
+        with self.assertRaisesRegex(ValueError, r"tolerance must be positive"):
+            s.BootstrapConfig(tolerance=0.0)
+
+    def test_bootstrap_config_controls_resample_count_and_seed(self) -> None:
+        rng = np.random.default_rng(5)
+        x = rng.normal(size=25)
+        y = rng.normal(loc=0.5, size=20)
+        small = s.compare_independent_groups(
+            x, y, estimand="stochastic_dominance", bootstrap=s.BootstrapConfig(n_resamples=200, random_state=1)
+        )
+        again = s.compare_independent_groups(
+            x, y, estimand="stochastic_dominance", bootstrap=s.BootstrapConfig(n_resamples=200, random_state=1)
+        )
+        other = s.compare_independent_groups(
+            x, y, estimand="stochastic_dominance", bootstrap=s.BootstrapConfig(n_resamples=200, random_state=2)
+        )
+        self.assertEqual(small.ci, again.ci)
+        self.assertNotEqual(small.ci, other.ci)
+        generator_config = s.BootstrapConfig(n_resamples=200, random_state=np.random.default_rng(1))
+        first = s.correlation(x, x + y[:1], method="spearman", bootstrap=generator_config)
+        self.assertIsNotNone(first.ci)
+
+    def test_bootstrap_ci_methods_bracket_the_estimate(self) -> None:
+        rng = np.random.default_rng(8)
+        x = rng.normal(size=30)
+        y = 0.6 * x + rng.normal(size=30)
+        for ci_method in ("percentile", "basic", "bca", "studentized"):
+            with self.subTest(ci_method=ci_method):
+                config = s.BootstrapConfig(n_resamples=2000, ci_method=ci_method)  # type: ignore[arg-type]
+                corr = s.correlation(x, y, method="spearman", bootstrap=config)
+                assert corr.ci is not None
+                self.assertLess(corr.ci.lower, corr.coefficient)
+                self.assertLess(corr.coefficient, corr.ci.upper)
+                self.assertIn(config.ci_label, corr.notes[0])
+                comp = s.compare_independent_groups(x, y, estimand="stochastic_dominance", bootstrap=config)
+                assert comp.ci is not None
+                self.assertLessEqual(0.0, comp.ci.lower)
+                self.assertLess(comp.ci.lower, comp.estimate)
+                self.assertLess(comp.estimate, comp.ci.upper)
+                self.assertLessEqual(comp.ci.upper, 1.0)
+
+    def test_bca_acceleration_matches_scipy_jackknife_formula(self) -> None:
+        x = np.array([1.0, 2.0, 2.0, 4.0, 7.0, 9.0])
+        y = np.array([0.0, 2.0, 3.5, 8.0, 1.0])
+        jackknife = s._probability_of_superiority_jackknife(x, y)
+        expected_x = [s._probability_of_superiority_from_arrays(np.delete(x, i), y) for i in range(x.size)]
+        expected_y = [s._probability_of_superiority_from_arrays(x, np.delete(y, j)) for j in range(y.size)]
+        np.testing.assert_allclose(jackknife[0], expected_x, rtol=0, atol=1e-15)
+        np.testing.assert_allclose(jackknife[1], expected_y, rtol=0, atol=1e-15)
+        theta = np.array([1.0, 2.0, 4.0, 8.0])
+        d = theta.mean() - theta
+        self.assertAlmostEqual(s._bca_acceleration([theta]), np.sum(d**3) / (6.0 * np.sum(d**2) ** 1.5), places=15)
+
+    def test_spearman_jackknife_matches_leave_one_out_refits(self) -> None:
+        rng = np.random.default_rng(12)
+        samples = [
+            (rng.normal(size=25), rng.normal(size=25)),
+            (rng.integers(0, 4, size=30).astype(float), rng.integers(0, 6, size=30).astype(float)),
+            (np.array([0.0, 0.0, 0.0, 1.0, 2.0]), np.array([1.0, 0.0, 2.0, 3.0, 3.0])),
+        ]
+        for x, y in samples:
+            with self.subTest(n=x.size):
+                _, codes_x = np.unique(x, return_inverse=True)
+                _, codes_y = np.unique(y, return_inverse=True)
+                (jackknife,) = s._spearman_jackknife(codes_x, int(codes_x.max()) + 1, codes_y, int(codes_y.max()) + 1)
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore")
+                    expected = np.array([spearmanr(np.delete(x, i), np.delete(y, i)).statistic for i in range(x.size)])
+                np.testing.assert_array_equal(np.isnan(jackknife), np.isnan(expected))
+                finite = ~np.isnan(expected)
+                np.testing.assert_allclose(jackknife[finite], expected[finite], rtol=0, atol=1e-12)
+
+    def test_studentized_superiority_uses_delong_standard_error(self) -> None:
+        rng = np.random.default_rng(13)
+        x = np.round(rng.normal(size=20), 1)
+        y = np.round(rng.normal(loc=0.4, size=16), 1)
+        ranks = s._rank_comparison(x, y)
+        hx = s._code_counts(ranks.codes_x[None, :], ranks.n_levels)
+        hy = s._code_counts(ranks.codes_y[None, :], ranks.n_levels)
+        ((theta, se),) = s._superiority_from_counts(hx, hy, x.size, y.size, with_se=True)
+        placements_x = [(np.sum(xi > y) + 0.5 * np.sum(xi == y)) / y.size for xi in x]
+        placements_y = [(np.sum(x > yj) + 0.5 * np.sum(x == yj)) / x.size for yj in y]
+        expected = np.sqrt(np.var(placements_x, ddof=1) / x.size + np.var(placements_y, ddof=1) / y.size)
+        self.assertAlmostEqual(theta, ranks.superiority, places=15)
+        self.assertAlmostEqual(se, expected, places=15)
+
+    def test_studentized_spearman_requires_four_pairs(self) -> None:
+        config = s.BootstrapConfig(ci_method="studentized")
+        with self.assertRaisesRegex(ValueError, r"at least 4 paired observations"):
+            s.correlation([1.0, 2.0, 3.0], [1.0, 3.0, 2.0], method="spearman", bootstrap=config)
+
+    def test_studentized_spearman_drops_boundary_resamples_on_strongly_monotone_data(self) -> None:
+        rng = np.random.default_rng(0)
+        x = rng.normal(size=15)
+        y = x + 0.15 * rng.normal(size=15)
+        percentile = s.correlation(x, y, method="spearman", bootstrap=s.BootstrapConfig(n_resamples=2000))
+        config = s.BootstrapConfig(n_resamples=2000, ci_method="studentized")
+        res = s.correlation(x, y, method="spearman", bootstrap=config)
+        assert res.ci is not None and percentile.ci is not None
+        self.assertGreater(res.coefficient, 0.98)
+        self.assertGreaterEqual(res.ci.lower, percentile.ci.lower - 0.05)
+        self.assertLessEqual(res.ci.upper, percentile.ci.upper)
+        self.assertLess(res.ci.lower, res.coefficient)
+        run = s._bootstrap_correlation_ci(
+            x, y, estimate=res.coefficient, confidence_level=0.95, alternative="two-sided", config=config
+        )
+        self.assertGreater(run.n_nonfinite, 0)
+        self.assertIn(f"dropped {run.n_nonfinite} of 2000 resamples with degenerate studentized pivots", res.notes[1])
+        # Mostly degenerate pivots fall back to the percentile interval of the same resamples.
+        y = np.arange(15.0)
+        y[[7, 8]] = y[[8, 7]]
+        fallback = s.correlation(np.arange(15.0), y, method="spearman", bootstrap=config)
+        expected = s.correlation(np.arange(15.0), y, method="spearman", bootstrap=s.BootstrapConfig(n_resamples=2000))
+        self.assertEqual(fallback.ci, expected.ci)
+        self.assertIn("percentile interval of the same resamples is reported instead", fallback.notes[1])
+        perfect = s.correlation(np.arange(10.0), np.arange(10.0) ** 2, method="spearman", bootstrap=config)
+        assert perfect.ci is not None
+        self.assertEqual((perfect.ci.lower, perfect.ci.upper), (1.0, 1.0))
+
+    def test_studentized_superiority_under_complete_separation(self) -> None:
+        config = s.BootstrapConfig(ci_method="studentized")
+        x, y = np.arange(10.0, 20.0), np.arange(10.0)
+        res = s.compare_independent_groups(x, y, estimand="stochastic_dominance", bootstrap=config)
+        assert res.ci is not None and res.effect_size is not None and res.effect_size.ci is not None
+        self.assertEqual((res.ci.lower, res.ci.upper), (1.0, 1.0))
+        self.assertEqual((res.effect_size.ci.lower, res.effect_size.ci.upper), (1.0, 1.0))
+        self.assertIn("degenerate at the estimate", res.notes[1])
+        less = s.compare_independent_groups(x, y, estimand="stochastic_dominance", alternative="less", bootstrap=config)
+        assert less.ci is not None
+        self.assertEqual((less.ci.lower, less.ci.upper), (0.0, 1.0))
+        # One overlapping value: resamples without it are separated and their pivots are dropped.
+        near = s.compare_independent_groups(
+            np.r_[0.5, x[:-1]],
+            y,
+            estimand="stochastic_dominance",
+            bootstrap=s.BootstrapConfig(n_resamples=2000, ci_method="studentized"),
+        )
+        assert near.ci is not None
+        self.assertTrue(np.isfinite(near.ci.lower) and near.ci.lower < near.estimate)
+        self.assertRegex(near.notes[1], r"dropped \d+ of 2000 resamples with degenerate studentized pivots")
+
+    def test_adaptive_bootstrap_stops_early_and_reports_it(self) -> None:
+        rng = np.random.default_rng(9)
+        x = rng.normal(size=15)
+        y = rng.normal(size=15)
+        config = s.BootstrapConfig(n_resamples=20000, adaptive=True, tolerance=0.01, min_resamples=400)
+        res = s.compare_independent_groups(x, y, estimand="stochastic_dominance", bootstrap=config)
+        self.assertEqual(len(res.notes), 2)
+        self.assertIn("adaptive resampling stopped after", res.notes[1])
+
     def test_correlation_invalid_method(self) -> None:
         with self.assertRaisesRegex(ValueError, r"method must be"):
             s.correlation([1.0, 2.0, 3.0], [1.0, 2.0, 3.0], method="kendall")  # type: ignore[arg-type]
@@ -0,0 +1,108 @@
+import unittest
+
+import numpy as np
+from scipy import stats as sps
+
+from stats4science import _kernels as kernels
+
+
+class TestKernels(unittest.TestCase):
+    def setUp(self) -> None:
+        self.rng = np.random.default_rng(11)
+
+    def test_t_distribution_matches_scipy_on_floats_and_arrays(self) -> None:
+        statistics = np.array([-40.0, -3.2, -1e-3, 0.0, 0.7, 2.1, 9.5, 60.0])
+        df = np.array([1.0, 2.5, 4.0, 9.37, 30.0, 151.2, 1e4, 1e7])
+        np.testing.assert_allclose(kernels.t_sf(statistics, df), sps.t.sf(statistics, df), rtol=1e-12, atol=0)
+        np.testing.assert_allclose(kernels.t_cdf(statistics, df), sps.t.cdf(statistics, df), rtol=1e-12, atol=0)
+        q = np.array([1e-12, 0.025, 0.3, 0.5, 0.8, 0.95, 0.975, 1.0 - 1e-9])
+        np.testing.assert_allclose(kernels.t_ppf(q, df), sps.t.ppf(q, df), rtol=1e-12)
+        self.assertAlmostEqual(float(kernels.t_ppf(0.975, 17.3)), float(sps.t.ppf(0.975, 17.3)), places=13)
+        for alternative in ("two-sided", "less", "greater"):
+            with self.subTest(alternative=alternative):
+                x, y = self.rng.normal(size=12), self.rng.normal(loc=0.5, scale=2.0, size=9)
+                expected = sps.ttest_ind(x, y, equal_var=False, alternative=alternative)
+                se = np.sqrt(x.var(ddof=1) / 12 + y.var(ddof=1) / 9)
+                a, b = x.var(ddof=1) / 12, y.var(ddof=1) / 9
+                df_welch = (a + b) ** 2 / (a**2 / 11 + b**2 / 8)
+                statistic = (x.mean() - y.mean()) / se
+                self.assertAlmostEqual(float(statistic), float(expected.statistic), places=12)
+                p_value = float(kernels.t_pvalue(statistic, df_welch, alternative))  # type: ignore[arg-type]
+                self.assertAlmostEqual(p_value, float(expected.pvalue), places=14)
+
+    def test_normal_distribution_and_critical_values_match_scipy(self) -> None:
+        z = np.array([-38.0, -5.0, -1.96, 0.0, 0.4, 3.0, 8.2])
+        np.testing.assert_allclose(kernels.norm_cdf(z), sps.norm.cdf(z), rtol=1e-14, atol=0)
+        np.testing.assert_allclose(kernels.norm_sf(z), sps.norm.sf(z), rtol=1e-14, atol=0)
+        q = np.array([1e-300, 1e-8, 0.05, 0.5, 0.975, 1.0 - 1e-12])
+        np.testing.assert_allclose(kernels.norm_ppf(q), sps.norm.ppf(q), rtol=1e-14)
+        self.assertEqual(kernels.z_critical(0.95, "two-sided"), float(sps.norm.ppf(0.975)))
+        self.assertEqual(kernels.z_critical(0.9, "greater"), float(sps.norm.ppf(0.9)))
+        self.assertEqual(float(kernels.t_critical(0.99, 7.0, "less")), float(sps.t.ppf(0.99, 7.0)))
+
+    def test_critical_values_are_memoised_per_level_sidedness_and_df(self) -> None:
+        kernels.reset_critical_value_cache()
+        self.addCleanup(kernels.reset_critical_value_cache)
+        for _ in range(3):
+            kernels.t_critical(0.95, 18, "two-sided")
+            kernels.t_critical(0.95, 18, "greater")
+            kernels.z_critical(0.95, "two-sided")
+        info = kernels.critical_value_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (6, 3, 3))
+        self.assertEqual(kernels.t_critical(0.95, 18.0, "less"), float(sps.t.ppf(0.95, 18)))
+        kernels.reset_critical_value_cache(maxsize=2)
+        for df in (5, 6, 7, 5):
+            kernels.t_critical(0.9, df, "two-sided")
+        info = kernels.critical_value_cache_info()
+        self.assertEqual((info.hits, info.misses, info.maxsize, info.currsize), (0, 4, 2, 2))
+        with self.assertRaisesRegex(ValueError, r"maxsize must be a positive integer"):
+            kernels.reset_critical_value_cache(maxsize=0)
+
+    def test_fractional_df_are_interpolated_accurately(self) -> None:
+        kernels.reset_critical_value_cache()
+        self.addCleanup(kernels.reset_critical_value_cache)
+        df = np.concatenate([self.rng.uniform(1.0, 10.0, 500), self.rng.uniform(10.0, 1e6, 500), [np.inf]])
+        for confidence_level in (0.8, 0.95, 0.999):
+            for alternative in ("two-sided", "greater"):
+                with self.subTest(confidence_level=confidence_level, alternative=alternative):
+                    level = 1.0 - (1.0 - confidence_level) / (2.0 if alternative == "two-sided" else 1.0)
+                    expected = sps.t.ppf(level, df)
+                    table = kernels.t_critical(confidence_level, df, alternative)  # type: ignore[arg-type]
+                    np.testing.assert_allclose(table, expected, rtol=1e-11)
+                    scalar = kernels.t_critical(confidence_level, float(df[3]), alternative)  # type: ignore[arg-type]
+                    self.assertAlmostEqual(scalar / expected[3], 1.0, places=11)
+        info = kernels.critical_value_cache_info()
+        self.assertEqual((info.tables, info.interpolated, info.misses), (6, 6 * (df.size + 1), 0))
+        # Below one degree of freedom the quantile is computed directly.
+        mixed = np.array([0.5, 2.5])
+        np.testing.assert_allclose(kernels.t_critical(0.95, mixed, "two-sided"), sps.t.ppf(0.975, mixed), rtol=1e-11)
+        self.assertEqual(kernels.t_critical(0.95, 0.5, "two-sided"), float(sps.t.ppf(0.975, 0.5)))
+
+    def test_brown_forsythe_matches_scipy_levene(self) -> None:
+        for center in ("median", "mean"):
+            for sizes in ((3, 4), (12, 30), (200, 150)):
+                with self.subTest(center=center, sizes=sizes):
+                    x = self.rng.normal(size=sizes[0])
+                    y = self.rng.standard_t(3, size=sizes[1]) * 1.7
+                    centers = (np.median(x), np.median(y)) if center == "median" else (x.mean(), y.mean())
+                    statistic, p_value = kernels.brown_forsythe((x, y), centers)
+                    expected = sps.levene(x, y, center=center)
+                    self.assertAlmostEqual(statistic / float(expected.statistic), 1.0, places=12)
+                    self.assertAlmostEqual(p_value, float(expected.pvalue), places=13)
+
+    def test_pearson_matches_scipy_pearsonr(self) -> None:
+        for n in (3, 4, 25, 1000):
+            for alternative in ("two-sided", "less", "greater"):
+                with self.subTest(n=n, alternative=alternative):
+                    x = self.rng.normal(size=n)
+                    y = 0.3 * x + self.rng.normal(size=n)
+                    r, p_value = kernels.pearson(x, y, alternative)  # type: ignore[arg-type]
+                    expected = sps.pearsonr(x, y, alternative=alternative)
+                    self.assertAlmostEqual(r, float(expected.statistic), places=14)
+                    self.assertAlmostEqual(p_value, float(expected.pvalue), places=14)
+        r, p_value = kernels.pearson(np.arange(5.0), 2.0 * np.arange(5.0) + 1.0, "two-sided")
+        self.assertEqual((r, p_value), (1.0, 0.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+
+import numpy as np
+from scipy.stats import false_discovery_control
+
+from stats4science import batch as b
+from stats4science import multiple_testing as mt
+from stats4science import inferential_stats as s
+
+
+class TestMultipleTesting(unittest.TestCase):
+    def test_bonferroni_and_holm_known_values(self) -> None:
+        p = [0.01, 0.04, 0.03, 0.005]
+        np.testing.assert_allclose(mt.adjust_pvalues(p, "bonferroni"), [0.04, 0.16, 0.12, 0.02])
+        np.testing.assert_allclose(mt.adjust_pvalues(p, "holm"), [0.03, 0.06, 0.06, 0.02])
+
+    def test_fdr_methods_match_scipy(self) -> None:
+        p = np.random.default_rng(1).uniform(size=200) ** 3
+        np.testing.assert_allclose(mt.adjust_pvalues(p, "bh"), false_discovery_control(p, method="bh"), atol=1e-15)
+        np.testing.assert_allclose(mt.adjust_pvalues(p, "by"), false_discovery_control(p, method="by"), atol=1e-15)
+
+    def test_nan_entries_are_preserved_and_excluded_from_family(self) -> None:
+        adjusted = mt.adjust_pvalues([0.01, float("nan"), 0.02], "bonferroni")
+        self.assertTrue(np.isnan(adjusted[1]))
+        np.testing.assert_allclose(adjusted[[0, 2]], [0.02, 0.04])
+
+    def test_validation(self) -> None:
+        with self.assertRaisesRegex(ValueError, r"method must be"):
+            mt.adjust_pvalues([0.1], "hommel")  # type: ignore[arg-type]
+        with self.assertRaisesRegex(ValueError, r"must lie in \[0, 1\]"):
+            mt.adjust_pvalues([1.5])
+
+    def test_adjusted_results_drive_interpretation(self) -> None:
+        x = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+        results = [
+            s.compare_independent_groups(x, x + shift, estimand="mean_difference") for shift in (-4.0, -2.6, 0.1)
+        ]
+        adjusted = mt.adjust_results(results, method="bonferroni")
+        self.assertEqual([r.p_adjustment for r in adjusted], ["bonferroni"] * 3)
+        for raw, adj in zip(results, adjusted):
+            self.assertAlmostEqual(adj.adjusted_p_value, min(1.0, 3 * raw.p_value), places=15)  # type: ignore[arg-type]
+        marginal = adjusted[1]
+        self.assertLess(marginal.p_value, 0.05)
+        self.assertGreaterEqual(marginal.adjusted_p_value, 0.05)  # type: ignore[arg-type]
+        text = s.interpret_two_group(marginal, alpha=0.05)
+        self.assertIn("Bonferroni-adjusted", text)
+        self.assertIn(
+            "would not usually be described as statistically significant at alpha = 0.05 after Bonferroni", text
+        )
+        self.assertIn("p_bonferroni=", marginal.summary())
+        self.assertIn("adjusted_p_value", marginal.to_dict())
+
+        corr = s.correlation(x, np.array([1.0, 3.0, 2.0, 5.0, 4.0, 6.0]))
+        (corr_adj,) = mt.adjust_results([corr], method="holm")
+        self.assertIn("Holm-adjusted", s.interpret_correlation(corr_adj))
+
+    def test_adjust_batch_uses_distinct_pairs_of_full_matrix(self) -> None:
+        data = np.random.default_rng(2).normal(size=(30, 4))
+        full = b.correlation_matrix(data)
+        condensed = b.correlation_matrix(data, upper_triangle=True)
+        adjusted_full = mt.adjust_batch(full, "holm")
+        adjusted_condensed = mt.adjust_batch(condensed, "holm")
+        np.testing.assert_allclose(adjusted_full[condensed.row, condensed.col], adjusted_condensed)
+        np.testing.assert_allclose(adjusted_full, adjusted_full.T)
+
+
+if __name__ == "__main__":
+    unittest.main()
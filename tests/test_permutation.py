@@ -0,0 +1,92 @@
+import unittest
+
+import numpy as np
+from scipy.stats import ttest_ind, mannwhitneyu
+from scipy.stats import permutation_test as scipy_permutation_test
+
+from stats4science import inferential_stats as s
+from stats4science.permutation import PermutationConfig, permutation_test
+
+
+class TestPermutationTest(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(1)
+        self.x = rng.normal(size=6)
+        self.y = rng.normal(loc=0.8, size=7)
+
+    def test_exact_one_sided_p_values_match_scipy(self) -> None:
+        statistics = {
+            "mean_difference": lambda a, b, axis: ttest_ind(a, b, equal_var=False, axis=axis).statistic,
+            "stochastic_dominance": lambda a, b, axis: mannwhitneyu(a, b, axis=axis).statistic,
+        }
+        for estimand, statistic in statistics.items():
+            for alternative in ("less", "greater"):
+                with self.subTest(estimand=estimand, alternative=alternative):
+                    res = permutation_test(self.x, self.y, estimand=estimand, alternative=alternative)  # type: ignore[arg-type]
+                    expected = scipy_permutation_test(
+                        (self.x, self.y),
+                        statistic,
+                        permutation_type="independent",
+                        alternative=alternative,
+                        n_resamples=np.inf,
+                        vectorized=True,
+                    )
+                    self.assertAlmostEqual(res.p_value, expected.pvalue, places=12)
+                    self.assertEqual(res.permutation, s.PermutationSummary(n_resamples=1716, exact=True, mc_error=0.0))
+                    self.assertIn("exact, enumerating all 1716 relabellings", res.notes[-1])
+
+    def test_exact_two_sided_counts_absolute_t_statistics(self) -> None:
+        expected = scipy_permutation_test(
+            (self.x, self.y),
+            lambda a, b, axis: np.abs(ttest_ind(a, b, equal_var=False, axis=axis).statistic),
+            permutation_type="independent",
+            alternative="greater",
+            n_resamples=np.inf,
+            vectorized=True,
+        )
+        self.assertAlmostEqual(permutation_test(self.x, self.y).p_value, expected.pvalue, places=12)
+
+    def test_result_reuses_estimates_and_records_monte_carlo_details(self) -> None:
+        rng = np.random.default_rng(3)
+        x, y = rng.normal(size=40), rng.normal(loc=0.5, scale=2.0, size=30)
+        base = s.compare_independent_groups(x, y)
+        config = PermutationConfig(max_resamples=3000, early_stopping=False, batch_size=700)
+        res = permutation_test(x, y, config=config)
+        self.assertEqual(res.method, "Permutation_Welch_t_test")
+        self.assertEqual((res.estimate, res.statistic, res.ci), (base.estimate, base.statistic, base.ci))
+        assert res.permutation is not None
+        self.assertEqual((res.permutation.n_resamples, res.permutation.exact), (3000, False))
+        self.assertFalse(res.permutation.stopped_early)
+        self.assertAlmostEqual(res.permutation.mc_error, np.sqrt(res.p_value * (1.0 - res.p_value) / 3000), places=15)
+        self.assertEqual(res.to_dict()["permutation"]["n_resamples"], 3000)
+        self.assertIsNone(base.permutation)
+        self.assertIn("Monte Carlo over 3000 random relabellings", res.notes[-1])
+        self.assertIn(f"Monte Carlo standard error = {res.permutation.mc_error:.2g}", res.notes[-1])
+        self.assertLess(abs(res.p_value - base.p_value), 0.03)
+        self.assertEqual(permutation_test(x, y, config=config).p_value, res.p_value)
+        self.assertIn("Permutation Welch t test", s.report_two_group(res))
+
+    def test_monte_carlo_stops_early_when_decision_is_clear(self) -> None:
+        rng = np.random.default_rng(4)
+        x, y = rng.normal(size=50), rng.normal(loc=1.5, size=50)
+        res = permutation_test(x, y, estimand="stochastic_dominance")
+        self.assertIn("Monte Carlo over 1000 random relabellings", res.notes[-1])
+        self.assertIn("clearly below alpha = 0.05", res.notes[-1])
+        self.assertAlmostEqual(res.p_value, 1 / 1001, places=12)
+
+        null = permutation_test(x, x[::-1] + 0.01, config=PermutationConfig(min_resamples=500, batch_size=250))
+        self.assertIn("clearly above alpha", null.notes[-1])
+
+    def test_validation(self) -> None:
+        with self.assertRaisesRegex(ValueError, r"max_resamples"):
+            PermutationConfig(max_resamples=0)
+        with self.assertRaisesRegex(ValueError, r"stopping_confidence"):
+            PermutationConfig(stopping_confidence=1.0)
+        with self.assertRaisesRegex(ValueError, r"batch_size"):
+            PermutationConfig(batch_size=0)
+        with self.assertRaisesRegex(ValueError, r"estimand must be"):
+            permutation_test(self.x, self.y, estimand="median")  # type: ignore[arg-type]
+
+
+if __name__ == "__main__":
+    unittest.main()
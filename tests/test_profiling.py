@@ -0,0 +1,81 @@
+import io
+import json
+import unittest
+
+import numpy as np
+
+import stats4science as stats
+from stats4science import profiling
+
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(3)
+        self.x = rng.normal(size=40)
+        self.y = rng.normal(loc=0.4, size=30)
+
+    def test_profiler_records_stages_and_sizes_per_call(self) -> None:
+        with stats.Profiler() as profiler:
+            stats.compare_independent_groups(self.x, self.y)
+            stats.correlation(self.x[:30], self.y, method="pearson")
+        mean_call, corr_call = profiler.calls
+        self.assertEqual(mean_call.function, "compare_independent_groups")
+        self.assertEqual(mean_call.sizes, {"n1": 40, "n2": 30})
+        self.assertEqual(
+            [stage.name for stage in mean_call.stages],
+            ["validation", "describe", "shapiro", "levene", "effect_size", "t_test"],
+        )
+        self.assertLessEqual(sum(stage.seconds for stage in mean_call.stages), mean_call.seconds)
+        self.assertIsNone(mean_call.error)
+        self.assertEqual(corr_call.function, "correlation")
+        self.assertEqual(corr_call.sizes, {"n": 30})
+        self.assertEqual([stage.name for stage in corr_call.stages], ["validation", "pearson", "describe"])
+        self.assertEqual(set(profiler.stage_totals()), {stage.name for c in profiler.calls for stage in c.stages})
+
+    def test_bootstrap_stage_reports_resample_counts(self) -> None:
+        config = stats.BootstrapConfig(n_resamples=300, ci_method="bca")
+        with stats.Profiler() as profiler:
+            stats.compare_independent_groups(self.x, self.y, estimand="stochastic_dominance", bootstrap=config)
+            stats.correlation(self.x[:30], self.y, method="spearman", bootstrap=config)
+        for call in profiler.calls:
+            with self.subTest(function=call.function):
+                (bootstrap,) = [stage for stage in call.stages if stage.name == "bootstrap"]
+                self.assertEqual(bootstrap.details, {"ci_method": "bca", "n_resamples": 300, "n_nonfinite": 0})
+
+    def test_failed_calls_are_recorded_with_the_error_type(self) -> None:
+        with stats.Profiler() as profiler, self.assertRaises(ValueError):
+            stats.correlation([1.0, 2.0], [2.0, 1.0])
+        (call,) = profiler.calls
+        self.assertEqual(call.error, "ValueError")
+        self.assertEqual([stage.name for stage in call.stages], ["validation"])
+
+    def test_disabled_profiling_records_nothing(self) -> None:
+        seen: list[stats.CallProfile] = []
+        hook = stats.add_profile_hook(seen.append)
+        stats.remove_profile_hook(hook)
+        stats.compare_independent_groups(self.x, self.y)
+        self.assertEqual(seen, [])
+        self.assertIsNone(profiling._CURRENT.get())
+        with self.assertRaisesRegex(ValueError, r"hook is not registered"):
+            stats.remove_profile_hook(hook)
+
+    def test_lazy_diagnostics_run_after_the_call_are_not_attributed_to_it(self) -> None:
+        with stats.Profiler() as profiler:
+            result = stats.compare_independent_groups(self.x, self.y, diagnostics="lazy")
+            stats.correlation(self.x[:30], self.y)
+            self.assertEqual(len(result.assumptions), 3)
+        self.assertNotIn("shapiro", [stage.name for call in profiler.calls for stage in call.stages])
+
+    def test_jsonl_export_round_trips(self) -> None:
+        with stats.Profiler() as profiler:
+            stats.compare_independent_groups(self.x, self.y, diagnostics="off")
+        stream = io.StringIO()
+        profiler.to_jsonl(stream)
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(json.loads(lines[0]), profiler.to_dicts()[0])
+        self.assertEqual(json.loads(lines[0])["stages"][0]["name"], "validation")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,258 @@
+import pickle
+import tempfile
+import unittest
+from typing import Iterator
+from pathlib import Path
+
+import numpy as np
+
+from stats4science import inferential_stats as s
+from stats4science.streaming import PearsonAccumulator, StreamingDescriptives, compare_independent_groups_streaming
+
+
+class TestStreamingDescriptives(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(5)
+        # Large offset relative to the spread stresses the numerical stability of the moment updates.
+        self.x = 1e6 + rng.gamma(2.0, 10.0, size=20_001)
+
+    def assert_matches_describe(self, result: s.DescriptiveStats, expected: s.DescriptiveStats) -> None:
+        self.assertEqual(result.n, expected.n)
+        self.assertAlmostEqual(result.mean, expected.mean, delta=1e-9 * abs(expected.mean))
+        self.assertAlmostEqual(result.sd, expected.sd, delta=1e-9 * expected.sd)
+        self.assertAlmostEqual(result.kurtosis_fisher, expected.kurtosis_fisher, delta=1e-7)
+        self.assertEqual(result.minimum, expected.minimum)
+        self.assertEqual(result.maximum, expected.maximum)
+
+    def test_chunked_and_merged_partitions_match_describe(self) -> None:
+        expected = s.describe(self.x)
+        left, right = StreamingDescriptives(), StreamingDescriptives()
+        for chunk in np.array_split(self.x[:7000], 13):
+            left.update(chunk)
+        for chunk in np.array_split(self.x[7000:], 5):
+            right.update(chunk)
+        result = left.merge(right).to_descriptives()
+        self.assert_matches_describe(result, expected)
+        self.assertEqual(result.median, expected.median)
+        self.assertEqual(result.notes, ())
+
+    def test_small_inputs_match_describe_including_kurtosis_correction(self) -> None:
+        for data in ([1.0, 2.0], [1.0, 2.0, 7.0], [3.0, 1.0, 4.0, 1.0, 5.0]):
+            with self.subTest(data=data):
+                acc = StreamingDescriptives()
+                for value in data:
+                    acc.update([value])
+                self.assert_matches_describe(acc.to_descriptives(), s.describe(data))
+
+    def test_sketched_median_stays_within_reported_rank_error(self) -> None:
+        acc = StreamingDescriptives(sketch_size=256)
+        for chunk in np.array_split(self.x, 40):
+            acc.update(chunk)
+        result = acc.to_descriptives()
+        self.assert_matches_describe(result, s.describe(self.x))
+        self.assertEqual(len(result.notes), 1)
+        self.assertIn("Median is approximate", result.notes[0])
+        bound = acc._rank_error
+        self.assertGreater(bound, 0)
+        ordered = np.sort(self.x)
+        middle = (self.x.size - 1) // 2
+        self.assertGreaterEqual(result.median, ordered[max(0, middle - bound)])
+        self.assertLessEqual(result.median, ordered[min(self.x.size - 1, middle + bound)])
+        self.assertLess(sum(level.size for level in acc._levels), 256 * 8)
+
+    def test_constant_stream_reports_undefined_kurtosis(self) -> None:
+        acc = StreamingDescriptives().update(np.full(10, 3.0)).update(np.full(5, 3.0))
+        result = acc.to_descriptives()
+        self.assertTrue(np.isnan(result.kurtosis_fisher))
+        self.assertEqual(result.notes, s.describe(np.full(15, 3.0)).notes)
+
+    def test_reused_read_buffer_does_not_corrupt_the_median(self) -> None:
+        buffer = np.empty(100)
+        acc = StreamingDescriptives()
+        for start in range(0, 1000, 100):
+            buffer[:] = self.x[start : start + 100]
+            acc.update(buffer)
+        self.assertEqual(acc.to_descriptives().median, float(np.median(self.x[:1000])))
+
+    def test_accumulator_survives_pickling_between_workers(self) -> None:
+        acc = StreamingDescriptives(sketch_size=64).update(self.x[:1000])
+        clone = pickle.loads(pickle.dumps(acc))
+        self.assertEqual(clone.to_descriptives(), acc.to_descriptives())
+
+    def test_validation(self) -> None:
+        with self.assertRaisesRegex(ValueError, r"sketch_size"):
+            StreamingDescriptives(sketch_size=1)
+        acc = StreamingDescriptives()
+        with self.assertRaisesRegex(ValueError, r"NaN"):
+            acc.update([1.0, float("nan")])
+        with self.assertRaisesRegex(ValueError, r"one-dimensional"):
+            acc.update(np.ones((2, 2)))
+        acc.update([])
+        acc.update([1.0])
+        with self.assertRaisesRegex(ValueError, r"At least 2 observations"):
+            acc.to_descriptives()
+
+
+class TestCompareIndependentGroupsStreaming(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(8)
+        self.x = 50.0 + rng.normal(size=3000)
+        self.y = 50.2 + rng.normal(scale=1.5, size=2001)
+
+    def test_streamed_sources_match_in_memory_comparison(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "group1.npy"
+            np.save(path, self.x)
+            for method in ("welch", "student"):
+                for alternative in ("two-sided", "greater", "less"):
+                    with self.subTest(method=method, alternative=alternative):
+                        expected = s.compare_independent_groups(self.x, self.y, method=method, alternative=alternative)  # type: ignore[arg-type]
+                        result = compare_independent_groups_streaming(
+                            path,
+                            iter(np.array_split(self.y, 9)),
+                            method=method,
+                            alternative=alternative,  # type: ignore[arg-type]
+                            chunk_size=500,
+                        )
+                        assert expected.ci is not None and result.ci is not None
+                        assert expected.effect_size is not None and result.effect_size is not None
+                        self.assertEqual(result.method, expected.method)
+                        self.assertEqual((result.n1, result.n2), (expected.n1, expected.n2))
+                        self.assertAlmostEqual(result.estimate, expected.estimate, places=10)
+                        self.assertAlmostEqual(result.statistic, expected.statistic, places=9)
+                        self.assertAlmostEqual(result.p_value, expected.p_value, places=12)
+                        assert result.df is not None and expected.df is not None
+                        self.assertAlmostEqual(result.df, expected.df, places=8)
+                        self.assertAlmostEqual(result.ci.lower, expected.ci.lower, places=10)
+                        self.assertAlmostEqual(result.ci.upper, expected.ci.upper, places=10)
+                        self.assertAlmostEqual(result.effect_size.value, expected.effect_size.value, places=12)
+                        self.assertEqual(result.notes[0], expected.notes[0])
+                        self.assertEqual(result.assumptions, ())
+
+    def test_generator_reusing_one_read_buffer_gives_exact_medians(self) -> None:
+        def read_into(values: np.ndarray, size: int) -> Iterator[np.ndarray]:
+            # Like a readinto()-style reader: every chunk is a view of the same buffer.
+            buffer = np.empty(size)
+            for start in range(0, values.size, size):
+                chunk = buffer[: min(size, values.size - start)]
+                chunk[:] = values[start : start + size]
+                yield chunk
+
+        result = compare_independent_groups_streaming(read_into(self.x, 256), read_into(self.y, 300))
+        self.assertEqual(result.group1_descriptives.median, float(np.median(self.x)))
+        self.assertEqual(result.group2_descriptives.median, float(np.median(self.y)))
+        self.assertEqual((result.n1, result.n2), (self.x.size, self.y.size))
+
+    def test_memmap_and_prebuilt_accumulators_are_accepted(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "group2.bin"
+            mapped = np.memmap(path, dtype=np.float32, mode="w+", shape=self.y.shape)
+            mapped[:] = self.y
+            mapped.flush()
+            acc = StreamingDescriptives()
+            for chunk in np.array_split(self.x, 4):
+                acc.update(chunk)
+            result = compare_independent_groups_streaming(acc, np.memmap(path, dtype=np.float32, mode="r"))
+            del mapped
+        expected = s.compare_independent_groups(self.x, self.y.astype(np.float32))
+        self.assertAlmostEqual(result.statistic, expected.statistic, places=9)
+
+    def test_validation(self) -> None:
+        with self.assertRaisesRegex(ValueError, r"method must be"):
+            compare_independent_groups_streaming(self.x, self.y, method="mannwhitney")
+        with self.assertRaisesRegex(ValueError, r"\.npy"):
+            compare_independent_groups_streaming("group1.csv", self.y)
+        with self.assertRaisesRegex(ValueError, r"At least 2 observations"):
+            compare_independent_groups_streaming(iter([np.array([1.0])]), self.y)
+        with self.assertRaisesRegex(ValueError, r"one-dimensional"):
+            compare_independent_groups_streaming(np.ones((3, 3)), self.y)
+
+
+class TestPearsonAccumulator(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(13)
+        # Offsets far larger than the spread stress the co-moment updates.
+        self.x = 1e3 + rng.normal(scale=0.1, size=5003)
+        self.y = -3e3 + 0.04 * (self.x - 1e3) + rng.normal(scale=0.01, size=5003)
+
+    def test_chunked_and_merged_partitions_match_correlation(self) -> None:
+        for alternative in ("two-sided", "greater", "less"):
+            with self.subTest(alternative=alternative):
+                expected = s.correlation(self.x, self.y, alternative=alternative)  # type: ignore[arg-type]
+                workers = [PearsonAccumulator(), PearsonAccumulator(), PearsonAccumulator()]
+                for i, start in enumerate(range(0, self.x.size, 700)):
+                    workers[i % 3].update(self.x[start : start + 700], self.y[start : start + 700])
+                acc = workers[0].merge(workers[1]).merge(workers[2]).merge(PearsonAccumulator())
+                result = acc.to_correlation(alternative=alternative)  # type: ignore[arg-type]
+                assert result.ci is not None and expected.ci is not None
+                self.assertEqual(result.n, expected.n)
+                self.assertAlmostEqual(result.coefficient, expected.coefficient, places=12)
+                self.assertAlmostEqual(result.p_value, expected.p_value, places=12)
+                self.assertAlmostEqual(result.ci.lower, expected.ci.lower, places=12)
+                self.assertAlmostEqual(result.ci.upper, expected.ci.upper, places=12)
+                self.assertAlmostEqual(result.x_descriptives.sd, expected.x_descriptives.sd, places=9)
+                self.assertEqual(result.notes[0], expected.notes[0])
+
+    def test_snapshots_track_the_stream_and_small_samples_match_exactly(self) -> None:
+        acc = PearsonAccumulator()
+        for end in (4, 5, 40, 41):
+            acc.update(self.x[acc.n : end], self.y[acc.n : end])
+            with self.subTest(n=end):
+                result = acc.to_correlation(confidence_level=0.9)
+                expected = s.correlation(self.x[:end], self.y[:end], confidence_level=0.9)
+                self.assertAlmostEqual(result.coefficient, expected.coefficient, places=12)
+                self.assertAlmostEqual(result.p_value, expected.p_value, places=12)
+        perfect = PearsonAccumulator().update([1.0, 2.0, 3.0, 4.0], [3.0, 5.0, 7.0, 9.0]).to_correlation()
+        self.assertEqual((perfect.coefficient, perfect.p_value), (1.0, 0.0))
+        clone = pickle.loads(pickle.dumps(acc))
+        self.assertEqual(clone.to_correlation(), acc.to_correlation())
+
+    def test_reused_read_buffers_and_near_constant_data_match_correlation(self) -> None:
+        buffers = np.empty(250), np.empty(250)
+        acc = PearsonAccumulator()
+        for start in range(0, 5000, 250):
+            buffers[0][:] = self.x[start : start + 250]
+            buffers[1][:] = self.y[start : start + 250]
+            acc.update(*buffers)
+        result = acc.to_correlation()
+        self.assertEqual(result.x_descriptives.median, float(np.median(self.x[:5000])))
+        self.assertEqual(result.y_descriptives.median, float(np.median(self.y[:5000])))
+        # Both paths apply one zero-variance rule, so they agree on data at its edge.
+        y = np.arange(5.0)
+        for offsets in ([10.0, 0.0, 20.0, 5.0, 15.0], [0.0, 5.0, 9.0, 3.0, 1.0]):
+            with self.subTest(offsets=offsets):
+                x = 1e6 + np.array(offsets)
+                try:
+                    expected: object = s.correlation(x, y).coefficient
+                except ValueError as error:
+                    expected = str(error)
+                try:
+                    streamed: object = PearsonAccumulator().update(x, y).to_correlation().coefficient
+                except ValueError as error:
+                    streamed = str(error)
+                self.assertEqual(type(streamed), type(expected))
+                if isinstance(expected, float) and isinstance(streamed, float):
+                    self.assertAlmostEqual(streamed, expected, places=9)
+                else:
+                    self.assertEqual(streamed, expected)
+
+    def test_validation(self) -> None:
+        acc = PearsonAccumulator()
+        with self.assertRaisesRegex(ValueError, r"equal shapes"):
+            acc.update([1.0, 2.0], [1.0])
+        with self.assertRaisesRegex(ValueError, r"NaN"):
+            acc.update([1.0, 2.0], [1.0, float("nan")])
+        self.assertEqual(acc.n, 0)
+        acc.update([], []).update([1.0, 2.0], [1.0, 2.0])
+        with self.assertRaisesRegex(ValueError, r"at least 3 paired observations"):
+            acc.to_correlation()
+        acc.update([2.0, 2.0], [0.0, 5.0])
+        with self.assertRaisesRegex(ValueError, r"requires n >= 4"):
+            PearsonAccumulator().update([1.0, 2.0, 3.0], [1.0, 3.0, 2.0]).to_correlation()
+        with self.assertRaisesRegex(ValueError, r"x has zero variance"):
+            PearsonAccumulator().update(np.full(5, 2.0), np.arange(5.0)).to_correlation()
+        self.assertEqual(acc.to_correlation().n, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
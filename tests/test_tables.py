@@ -0,0 +1,85 @@
+import pickle
+import unittest
+
+import numpy as np
+
+import stats4science as stats
+from stats4science.tables import ResultTable
+
+
+class TestResultTable(unittest.TestCase):
+    comparisons: list[stats.TwoGroupComparisonResult]
+    correlations: list[stats.CorrelationResult]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        rng = np.random.default_rng(21)
+        config = stats.BootstrapConfig(n_resamples=200)
+        cls.comparisons = [
+            stats.compare_independent_groups(
+                rng.normal(size=15),
+                rng.normal(loc=0.3, size=12),
+                estimand=estimand,  # type: ignore[arg-type]
+                bootstrap=config,
+            )
+            for estimand in ("mean_difference", "stochastic_dominance", "mean_difference")
+        ]
+        cls.comparisons.append(
+            stats.compare_independent_groups(rng.normal(size=10), rng.normal(size=10), diagnostics="off")
+        )
+        cls.comparisons = stats.adjust_results(cls.comparisons, method="holm")
+        cls.correlations = [
+            stats.correlation(rng.normal(size=20), rng.normal(size=20), method=method, bootstrap=config)  # type: ignore[arg-type]
+            for method in ("pearson", "spearman")
+        ]
+
+    def test_rows_round_trip_to_the_original_results(self) -> None:
+        for results in (self.comparisons, self.correlations):
+            table = ResultTable.from_results(results)
+            with self.subTest(kind=table.kind):
+                self.assertEqual(len(table), len(results))
+                self.assertEqual(list(table), results)
+                self.assertEqual(table[-1], results[-1])
+                self.assertEqual(table.to_dicts(), [result.to_dict() for result in results])
+
+    def test_notes_and_strings_are_interned(self) -> None:
+        table = ResultTable.from_results(self.comparisons * 50)
+        self.assertEqual(len(table), 200)
+        # Welch (with and without the diagnostics-off note) and Mann-Whitney note sets, plus
+        # the empty descriptive notes.
+        self.assertEqual(len(table.note_sets), 4)
+        self.assertEqual(len(set(table.strings)), len(table.strings))
+        self.assertEqual(table.column("method", decode=True)[:3], ["Welch_t_test", "Mann_Whitney_U", "Welch_t_test"])
+        self.assertEqual(table.column("notes", decode=True)[1], self.comparisons[1].notes)
+
+    def test_slices_are_views_sharing_the_pools(self) -> None:
+        table = ResultTable.from_results(self.comparisons)
+        head = table[1:3]
+        self.assertTrue(np.shares_memory(head.data, table.data))
+        self.assertIs(head.strings, table.strings)
+        self.assertEqual(list(head), self.comparisons[1:3])
+        np.testing.assert_array_equal(head.column("p_value"), [r.p_value for r in self.comparisons[1:3]])
+        selected = table[table.column("p_value") < 2.0]
+        self.assertEqual(len(selected), len(table))
+
+    def test_missing_optional_values_are_flagged(self) -> None:
+        table = ResultTable.from_results(self.comparisons)
+        np.testing.assert_array_equal(table.column("has_df"), [True, False, True, True])
+        np.testing.assert_array_equal(table.column("n_assumptions"), [3, 0, 3, 0])
+        self.assertTrue(np.isnan(table.column("assumption0_p_value")[1]))
+        self.assertEqual(table.column("effect_size_name", decode=True)[1], "Cliffs_delta")
+        self.assertTrue(table.column("has_effect_size_ci")[1])
+        self.assertEqual(table.column("p_adjustment", decode=True), ["holm"] * 4)
+
+    def test_pickles_and_validates_inputs(self) -> None:
+        table = ResultTable.from_results(self.correlations)
+        self.assertEqual(list(pickle.loads(pickle.dumps(table))), self.correlations)
+        self.assertEqual(len(ResultTable.from_results([], kind="correlation")), 0)
+        with self.assertRaisesRegex(ValueError, r"Cannot infer the result kind"):
+            ResultTable.from_results([])
+        with self.assertRaisesRegex(ValueError, r"must be CorrelationResult"):
+            ResultTable.from_results([*self.correlations, self.comparisons[0]])
+
+
+if __name__ == "__main__":
+    unittest.main()